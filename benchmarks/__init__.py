@@ -0,0 +1 @@
+"""Performance benchmarks for Budgetize. Run them from the repository root with `python -m benchmarks.<name>`."""
@@ -0,0 +1,280 @@
+"""Database API benchmark.
+
+Fills a temporary database with a synthetic ledger (see `benchmarks.ledger`) of each
+size, and times the queries the screens run through `Database`: balances, monthly
+summaries, recent transactions, search, period reports, forecasts, export/import, CSV
+statement imports and deleting an account.
+
+The results are compared against a JSON baseline, so regressions can be spotted locally.
+Baselines depend on the machine, save one before making changes:
+
+Usage:
+    python -m benchmarks.database --rows 10k 100k --save
+    python -m benchmarks.database --rows 10k 100k [--tolerance 1.5] [--json]
+    python -m benchmarks.database --rows 1m --repeats 3
+"""
+
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Optional
+
+from benchmarks.ledger import (
+    CURRENCIES,
+    generate_accounts,
+    generate_transactions,
+    write_statement,
+)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, "benchmarks", "baselines", "database.json")
+
+DAY = 24 * 60 * 60
+
+
+def parse_rows(value: str) -> int:
+    """Parses a number of rows such as 10000, 10k or 1m."""
+    multipliers = {"k": 1_000, "m": 1_000_000}
+    suffix = value[-1].lower()
+    if suffix in multipliers:
+        return int(float(value[:-1]) * multipliers[suffix])
+
+    return int(value)
+
+
+def time_ms(func: Callable[[], Any], repeats: int = 1) -> float:
+    """Runs the function and returns the median of the milliseconds it took."""
+    times = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - started_at) * 1000)
+
+    return round(statistics.median(times), 2)
+
+
+def run_scenarios(
+    rows: int, folder: str, repeats: int, accounts: int, currencies: int, seed: int
+) -> dict[str, float]:
+    """Builds a ledger with the specified number of rows and times every scenario.
+
+    Returns:
+        dict[str, float]: The milliseconds taken by each scenario.
+    """
+    # Imported here so `--help` does not create the app folder.
+    from budgetize.consts import DEFAULT_IMPORT_PROFILES
+    from budgetize.db.database import Database
+    from budgetize.forecast import ForecastEngine
+    from budgetize.importer import CSVImporter, ImportProfile
+    from budgetize.money import get_currency_exponent
+    from budgetize.reports import ReportEngine
+
+    db = Database(url=f"sqlite:///{os.path.join(folder, f'ledger-{rows}.sqlite')}")
+    ledger_accounts = generate_accounts(accounts, currencies, seed)
+    for account in ledger_accounts:
+        db._add_account(account["id"], account["name"], account["currency"])
+
+    # The ledger ends today, so the summaries of the current month have rows to add up.
+    end = time.time() // DAY * DAY
+    results = {
+        "bulk_insert": time_ms(
+            lambda: db.bulk_add_transactions(
+                generate_transactions(rows, ledger_accounts, seed=seed, end=end)
+            )
+        )
+    }
+
+    account_ids = [account["id"] for account in ledger_accounts]
+    busiest_account_id = account_ids[0]
+
+    def get_balances() -> None:
+        for account_id in account_ids:
+            db.get_account_balance(account_id)
+
+    def get_monthly_summary() -> None:
+        db.get_monthly_totals(True)
+        db.get_monthly_totals(False)
+        db.get_monthly_category_totals()
+
+    results["balances"] = time_ms(get_balances, repeats)
+    results["monthly_summary"] = time_ms(get_monthly_summary, repeats)
+    results["recent_transactions"] = time_ms(db.get_all_recent_transactions, repeats)
+    results["account_transactions"] = time_ms(
+        lambda: list(db.get_transactions_from_account(busiest_account_id)), repeats
+    )
+    results["search"] = time_ms(lambda: db.search_transactions("coffee"), repeats)
+
+    # The rates of the generated ledger, so the report does not fetch them.
+    account_factors = {
+        account["id"]: 10.0 ** -get_currency_exponent(account["currency"])
+        / CURRENCIES[account["currency"]]
+        for account in ledger_accounts
+    }
+    results["period_report"] = time_ms(
+        lambda: ReportEngine(db).build(account_factors, period="quarter"), repeats
+    )
+    results["forecast"] = time_ms(
+        lambda: ForecastEngine(db).build(
+            {
+                account["currency"]: CURRENCIES[account["currency"]]
+                for account in ledger_accounts
+            }
+        ),
+        repeats,
+    )
+
+    exported: dict[int, dict] = {}
+
+    def export() -> None:
+        exported.update(db.get_db_as_dict())
+
+    results["export"] = time_ms(export)
+
+    # Imports into a new database, like restoring an exported file.
+    imported_db = Database(
+        url=f"sqlite:///{os.path.join(folder, f'imported-{rows}.sqlite')}"
+    )
+    results["import"] = time_ms(
+        lambda: imported_db.populate_from_dict(
+            {str(account_id): data for account_id, data in exported.items()}
+        )
+    )
+
+    # Imports a statement with as many rows into a new account, parsing it like the CLI.
+    statement_path = os.path.join(folder, f"statement-{rows}.csv")
+    write_statement(
+        statement_path,
+        generate_transactions(rows, ledger_accounts, seed=seed + 1, end=end),
+    )
+    statement_account_id = max(account_ids) + 1
+    imported_db._add_account(statement_account_id, "Statement", "USD")
+    importer = CSVImporter(
+        imported_db, ImportProfile("default", DEFAULT_IMPORT_PROFILES["default"])
+    )
+    results["csv_import"] = time_ms(
+        lambda: importer.run(statement_path, statement_account_id)
+    )
+
+    results["delete_account"] = time_ms(
+        lambda: imported_db.delete_account(busiest_account_id)
+    )
+
+    return results
+
+
+def compare(
+    report: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    """Returns the scenarios that are slower than the baseline by more than the tolerance."""
+    regressions = []
+    for rows, results in report.items():
+        for scenario, elapsed in results.items():
+            previous = baseline.get(rows, {}).get(scenario)
+            # Very fast scenarios are too noisy to compare.
+            if previous is None or max(previous, elapsed) < 1:
+                continue
+
+            if elapsed > previous * tolerance:
+                regressions.append(
+                    f"{rows} rows / {scenario}: {elapsed:.1f} ms (baseline {previous:.1f} ms)"
+                )
+
+    return regressions
+
+
+def load_baseline(path: str) -> Optional[dict]:
+    """Returns the saved baseline, or None if there is none."""
+    if not os.path.exists(path):
+        return None
+
+    with open(path, encoding="utf-8") as f:
+        baseline: dict = json.load(f)
+
+    return baseline
+
+
+def save_baseline(path: str, report: dict[str, dict[str, float]]) -> None:
+    """Saves the results as the baseline, keeping the results of other sizes."""
+    baseline = load_baseline(path) or {"results": {}}
+    baseline["environment"] = {
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+    }
+    baseline["results"].update(report)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=4)
+        f.write("\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows",
+        nargs="+",
+        default=["10k", "100k"],
+        help="Sizes of the ledgers, e.g. 10k 100k 1m",
+    )
+    parser.add_argument("--repeats", type=int, default=5, help="Runs of each query")
+    parser.add_argument("--accounts", type=int, default=8, help="Accounts per ledger")
+    parser.add_argument("--currencies", type=int, default=4, help="Currencies used")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the ledger")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline path")
+    parser.add_argument(
+        "--save", action="store_true", help="Save the results as the baseline"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.5,
+        help="Slowdown over the baseline reported as a regression",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as folder:
+        for rows in (parse_rows(value) for value in args.rows):
+            report[str(rows)] = run_scenarios(
+                rows, folder, args.repeats, args.accounts, args.currencies, args.seed
+            )
+
+    baseline = load_baseline(args.baseline)
+    regressions = (
+        compare(report, baseline["results"], args.tolerance) if baseline else []
+    )
+
+    if args.json:
+        print(json.dumps({"results": report, "regressions": regressions}, indent=4))
+    else:
+        for size, results in report.items():
+            print(f"{size} rows")
+            for scenario, elapsed in results.items():
+                previous = (
+                    (baseline or {}).get("results", {}).get(size, {}).get(scenario)
+                )
+                versus = f"(baseline {previous:.1f} ms)" if previous is not None else ""
+                print(f"    {scenario:22} {elapsed:10.1f} ms {versus}")
+
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+
+    if args.save:
+        save_baseline(args.baseline, report)
+        print(f"Saved baseline to {args.baseline}")
+
+    sys.exit(1 if regressions and not args.save else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Import time regression benchmark.
+
+Imports each module in a fresh interpreter with `python -X importtime`, and checks the
+median cumulative time against its budget. It also checks that the core package does not
+import the dependencies that are only needed for rare tasks (e.g. refreshing rates).
+
+Usage:
+    python -m benchmarks.import_time [--runs 5] [--json]
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Maximum median cumulative import time of each module, in milliseconds.
+BUDGETS_MS = {
+    "budgetize": 150,
+    "budgetize.tui": 1500,
+    "budgetize.cli": 600,
+}
+
+# Modules that must not be imported as a side effect of importing each module.
+FORBIDDEN_IMPORTS = {
+    "budgetize": ["httpx", "bs4", "pkg_resources", "babel"],
+    "budgetize.cli": ["textual", "budgetize.tui", "numpy"],
+    "budgetize.tui": ["numpy"],
+}
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def measure_import(module: str) -> tuple[float, set[str]]:
+    """Imports the module in a new interpreter.
+
+    Returns:
+        tuple[float, set[str]]: The cumulative import time in milliseconds and the names of
+        every module imported.
+    """
+    env = {**os.environ, "PYTHONPATH": REPO_ROOT}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    total_us = 0
+    imported = set()
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+
+        _, cumulative, _, name = match.groups()
+        imported.add(name)
+        if name == module:
+            total_us = int(cumulative)
+
+    return total_us / 1000, imported
+
+
+def run(runs: int) -> dict[str, dict]:
+    """Measures every module with a budget.
+
+    Returns:
+        dict[str, dict]: The median time, budget and forbidden imports found for each module.
+    """
+    report = {}
+    for module, budget in BUDGETS_MS.items():
+        times = []
+        imported: set[str] = set()
+        for _ in range(runs):
+            elapsed, imported = measure_import(module)
+            times.append(elapsed)
+
+        forbidden = [
+            name for name in FORBIDDEN_IMPORTS.get(module, []) if name in imported
+        ]
+        report[module] = {
+            "median_ms": round(statistics.median(times), 1),
+            "budget_ms": budget,
+            "forbidden_imports": forbidden,
+            "ok": statistics.median(times) <= budget and not forbidden,
+        }
+
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Imports per module")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = run(args.runs)
+    if args.json:
+        print(json.dumps(report, indent=4))
+    else:
+        for module, result in report.items():
+            status = "OK" if result["ok"] else "FAIL"
+            print(
+                f"{status:4} {module:20} {result['median_ms']:8.1f} ms "
+                f"(budget {result['budget_ms']} ms)"
+            )
+            if result["forbidden_imports"]:
+                print(f"     imports {', '.join(result['forbidden_imports'])}")
+
+    sys.exit(0 if all(result["ok"] for result in report.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""Deterministic generator of synthetic ledgers for the benchmarks.
+
+The same arguments always produce the same accounts and transactions. A ledger has
+accounts across several currencies and years of transactions: a monthly salary, expenses
+with the category and amount distributions of a household, hidden transfers between
+accounts (recorded like the Transfer screen does) and the hidden initial balances.
+"""
+
+import csv
+import random
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Optional
+
+# Currencies of the accounts, with the approximate units per US dollar to scale amounts.
+CURRENCIES = {
+    "USD": 1.0,
+    "EUR": 0.9,
+    "GBP": 0.8,
+    "JPY": 150.0,
+    "ARS": 900.0,
+    "BRL": 5.0,
+    "MXN": 17.0,
+    "CAD": 1.35,
+}
+
+# Category: (relative frequency, median amount in USD, spread of the log-normal amount)
+EXPENSE_CATEGORIES = {
+    "Food": (30, 12.0, 0.6),
+    "Groceries": (25, 60.0, 0.5),
+    "Entertainment": (12, 30.0, 0.8),
+    "Car": (9, 45.0, 0.7),
+    "Medicine": (6, 25.0, 0.9),
+    "Gifts": (4, 50.0, 1.0),
+    "Investment": (3, 300.0, 0.8),
+}
+
+DESCRIPTIONS = {
+    "Food": ["Lunch", "Coffee", "Dinner", "Pizza", "Bakery"],
+    "Groceries": ["Supermarket", "Farmers market", "Butcher", "Corner store"],
+    "Entertainment": ["Cinema", "Concert", "Streaming", "Video game", "Books"],
+    "Car": ["Fuel", "Parking", "Car wash", "Tolls", "Oil change"],
+    "Medicine": ["Pharmacy", "Dentist", "Doctor"],
+    "Gifts": ["Birthday gift", "Flowers", "Wedding gift"],
+    "Investment": ["Index fund", "Bonds", "Savings"],
+    "Income": ["Salary", "Freelance", "Refund"],
+}
+
+# Share of the rows of each kind. The rest are expenses.
+INCOME_SHARE = 0.03
+TRANSFER_SHARE = 0.02  # Each transfer adds two rows
+
+DAY = 24 * 60 * 60
+
+# Fixed end of the ledger, so the generated timestamps do not depend on the clock.
+DEFAULT_END = 1790812800.0  # 2026-10-01 00:00 UTC
+
+
+def generate_accounts(count: int = 8, currencies: int = 4, seed: int = 0) -> list[dict]:
+    """Returns the accounts of a ledger, spread across the first currencies of `CURRENCIES`.
+
+    Args:
+        count (int): The number of accounts.
+        currencies (int): The number of different currencies.
+        seed (int): The seed of the random generator.
+
+    Returns:
+        list[dict]: The `id`, `name`, `currency` and `starting_balance` of every account.
+    """
+    rng = random.Random(seed)
+    currency_codes = list(CURRENCIES)[: max(1, min(currencies, len(CURRENCIES)))]
+
+    accounts = []
+    for account_id in range(1, count + 1):
+        currency = currency_codes[(account_id - 1) % len(currency_codes)]
+        accounts.append(
+            {
+                "id": account_id,
+                "name": f"Account {account_id} ({currency})",
+                "currency": currency,
+                "starting_balance": round(
+                    rng.uniform(100, 5000) * CURRENCIES[currency], 2
+                ),
+            }
+        )
+
+    return accounts
+
+
+def generate_transactions(
+    rows: int,
+    accounts: list[dict],
+    years: int = 3,
+    seed: int = 0,
+    end: Optional[float] = None,
+) -> Iterator[dict]:
+    """Yields the transactions of a ledger in chronological order.
+
+    The first rows are the hidden initial balances of the accounts. Most accounts get a
+    similar share of the rows, but the first one is the busiest, like a main bank account.
+
+    Args:
+        rows (int): The number of transactions, including the initial balances.
+        accounts (list[dict]): The accounts, as returned by `generate_accounts`.
+        years (int): The number of years covered by the transactions.
+        seed (int): The seed of the random generator.
+        end (float): The timestamp of the last transaction. Defaults to `DEFAULT_END`.
+
+    Yields:
+        dict: The arguments of `Database.add_transaction` for each transaction.
+    """
+    rng = random.Random(seed)
+    end = DEFAULT_END if end is None else end
+    start = end - years * 365 * DAY
+
+    for account in accounts[:rows]:
+        yield {
+            "account_id": account["id"],
+            "amount": account["starting_balance"],
+            "description": "Initial balance",
+            "category": "-",
+            "timestamp": start,
+            "visible": False,
+        }
+
+    remaining = rows - min(rows, len(accounts))
+    if remaining <= 0 or not accounts:
+        return
+
+    weights = [3.0] + [1.0] * (len(accounts) - 1)
+    categories = list(EXPENSE_CATEGORIES)
+    category_weights = [EXPENSE_CATEGORIES[name][0] for name in categories]
+    step = (end - start) / remaining
+
+    timestamp = start
+    produced = 0
+    while produced < remaining:
+        timestamp += rng.uniform(0, 2 * step)
+        timestamp = min(timestamp, end)
+        account = rng.choices(accounts, weights)[0]
+        scale = CURRENCIES[account["currency"]]
+        kind = rng.random()
+
+        if kind < TRANSFER_SHARE and len(accounts) > 1 and remaining - produced >= 2:
+            destination = rng.choice([acc for acc in accounts if acc is not account])
+            amount_usd = round(rng.lognormvariate(5.0, 0.7), 2)
+            yield {
+                "account_id": account["id"],
+                "amount": -round(amount_usd * scale, 2),
+                "description": "-",
+                "category": "Transfer",
+                "timestamp": timestamp,
+                "visible": False,
+            }
+            yield {
+                "account_id": destination["id"],
+                "amount": round(amount_usd * CURRENCIES[destination["currency"]], 2),
+                "description": "-",
+                "category": "",
+                "timestamp": timestamp,
+                "visible": False,
+            }
+            produced += 2
+            continue
+
+        if kind < TRANSFER_SHARE + INCOME_SHARE:
+            category = "Income"
+            amount = rng.lognormvariate(7.6, 0.4) * scale
+        else:
+            category = rng.choices(categories, category_weights)[0]
+            _, median, spread = EXPENSE_CATEGORIES[category]
+            amount = -rng.lognormvariate(0, spread) * median * scale
+
+        yield {
+            "account_id": account["id"],
+            "amount": round(amount, 2),
+            "description": rng.choice(DESCRIPTIONS[category]),
+            "category": category,
+            "timestamp": timestamp,
+            "visible": True,
+        }
+        produced += 1
+
+
+def write_statement(path: str, transactions: Iterator[dict]) -> int:
+    """Writes the transactions as a CSV bank statement, in the "default" import profile.
+
+    Returns:
+        int: The number of rows written.
+    """
+    rows = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["date", "amount", "description", "category"])
+        for transaction in transactions:
+            writer.writerow(
+                [
+                    datetime.fromtimestamp(transaction["timestamp"]).strftime(
+                        "%Y-%m-%d"
+                    ),
+                    f"{transaction['amount']:.2f}",
+                    transaction["description"],
+                    transaction["category"],
+                ]
+            )
+            rows += 1
+
+    return rows
@@ -0,0 +1,174 @@
+"""Logging overhead benchmark.
+
+Measures how long the calling thread (the UI thread in the app) is blocked by each log
+call, before and after moving the writes to the background listener of `budgetize.log`.
+
+Scenarios:
+    file/eager:  records written by a `FileHandler`, messages built with f-strings.
+    queue/lazy:  records queued for the listener thread, messages with %-style arguments.
+
+Each scenario logs an INFO line and a DEBUG line with the exchange rates dict, as
+`CurrencyManager._save_exchange` does, at the DEBUG and INFO levels. The median and the
+99th percentile of each call are reported: slow writes show up as stalls in the tail.
+`--write-delay-ms` adds latency to every write, like a slow disk or network home folder.
+
+Usage:
+    python -m benchmarks.logging_overhead [--calls 5000] [--write-delay-ms 0.5] [--json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import queue
+import statistics
+import sys
+import tempfile
+import time
+from logging.handlers import QueueListener
+from typing import Any, Callable, TextIO
+
+from budgetize.log import (
+    DATE_FORMAT,
+    LOG_FORMAT,
+    LocalQueueHandler,
+    create_file_handler,
+)
+
+# Similar in size to the rates of a user with a few accounts in other currencies.
+RATES = {
+    "USD": {
+        currency: {"rate": 1.2345 + i, "retrieve_timestamp": 1760000000 + i}
+        for i, currency in enumerate(
+            ["EUR", "GBP", "JPY", "ARS", "BRL", "CAD", "CHF", "MXN", "CLP", "COP"]
+        )
+    }
+}
+
+
+def log_eager(logger: logging.Logger) -> None:
+    """Logs the way the hot paths did before: messages are built even if not logged."""
+    logger.info(f"Saving exchange rate for {'USD'}-{'EUR'} at {1.2345}...")
+    logger.debug(f"Current rates: {RATES}")
+
+
+def log_lazy(logger: logging.Logger) -> None:
+    """Logs with %-style arguments: messages are only built if they are logged."""
+    logger.info("Saving exchange rate for %s-%s at %s...", "USD", "EUR", 1.2345)
+    logger.debug("Current rates: %s", RATES)
+
+
+class SlowStream:
+    """Wraps a file, waiting before every write."""
+
+    def __init__(self, stream: TextIO, delay: float) -> None:
+        self.stream = stream
+        self.delay = delay
+
+    def write(self, text: str) -> int:
+        time.sleep(self.delay)
+        return self.stream.write(text)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.stream, name)
+
+
+def measure(
+    log: Callable[[logging.Logger], None],
+    use_queue: bool,
+    level: int,
+    calls: int,
+    write_delay: float,
+) -> list[float]:
+    """Logs the calls in a temporary file and returns the microseconds spent in each call."""
+    with tempfile.TemporaryDirectory() as folder:
+        log_path = os.path.join(folder, "benchmark.log")
+        logger = logging.getLogger(f"benchmarks.logging_overhead.{time.time_ns()}")
+        logger.propagate = False
+        logger.setLevel(level)
+
+        listener = None
+        handler: logging.Handler
+        if use_queue:
+            file_handler = create_file_handler(log_path, {"max_bytes": 0})
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, file_handler)
+            listener.start()
+            handler = LocalQueueHandler(log_queue)
+        else:
+            # The configuration of `logging.basicConfig(filename=...)` used before.
+            file_handler = logging.FileHandler(log_path, encoding="utf-8")
+            file_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
+            handler = file_handler
+
+        if write_delay:
+            stream = file_handler.stream  # type: ignore
+            file_handler.stream = SlowStream(stream, write_delay)  # type: ignore
+
+        logger.addHandler(handler)
+        times = []
+        try:
+            for _ in range(calls):
+                started_at = time.perf_counter()
+                log(logger)
+                times.append((time.perf_counter() - started_at) * 1_000_000)
+        finally:
+            # Writing the queued records is not counted, it happens in the listener thread.
+            if listener is not None:
+                listener.stop()
+            logger.removeHandler(handler)
+            file_handler.close()
+
+    return times
+
+
+def run(calls: int, write_delay: float) -> dict[str, dict[str, dict[str, float]]]:
+    """Measures every scenario at the DEBUG and INFO levels.
+
+    Returns:
+        dict[str, dict[str, dict[str, float]]]: The median and 99th percentile of the
+        microseconds per call of each scenario, by level.
+    """
+    scenarios = {
+        "file/eager": (log_eager, False),
+        "queue/lazy": (log_lazy, True),
+    }
+
+    report: dict[str, dict[str, dict[str, float]]] = {}
+    for name, (log, use_queue) in scenarios.items():
+        report[name] = {}
+        for level in (logging.DEBUG, logging.INFO):
+            times = measure(log, use_queue, level, calls, write_delay)
+            report[name][logging.getLevelName(level)] = {
+                "median_us": round(statistics.median(times), 2),
+                "p99_us": round(statistics.quantiles(times, n=100)[98], 2),
+            }
+
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=5000, help="Log calls per run")
+    parser.add_argument(
+        "--write-delay-ms", type=float, default=0, help="Latency added to each write"
+    )
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = run(args.calls, args.write_delay_ms / 1000)
+    if args.json:
+        print(json.dumps(report, indent=4))
+    else:
+        print(f"{'scenario':12} {'level':6} {'median us':>10} {'p99 us':>10}")
+        for name, levels in report.items():
+            for level, result in levels.items():
+                print(
+                    f"{name:12} {level:6} {result['median_us']:10.2f} {result['p99_us']:10.2f}"
+                )
+
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 """Main entry point for the application when running -m budgetize"""
 
-from .tui import TuiApp
+from budgetize.console import run
 
-TuiApp().run()
+run()
@@ -51,6 +51,26 @@ class Budget:
 
         return self._categories[category]
 
+    def get_limits_by_category_id(
+        self, category_ids: dict[str, int]
+    ) -> dict[int, float]:
+        """Returns the expend limits keyed by the ID of their category in the database.
+
+        Arguments
+        ---------
+            category_ids: `dict`
+                The ID of each category by name, as returned by `Database.get_category_ids`.
+
+        Returns:
+            A dictionary with the category IDs and their expend limits.
+            Categories missing from the database are skipped.
+        """
+        return {
+            category_ids[category]: limit
+            for category, limit in self._categories.items()
+            if category in category_ids
+        }
+
     def to_dict(self) -> dict:
         """Returns the budget as a dictionary.
 
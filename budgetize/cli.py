@@ -0,0 +1,632 @@
+"""Headless commands to query the ledger from scripts, without starting the TUI.
+
+Every command writes its rows to stdout as they are produced, in JSON, JSON Lines or CSV.
+
+Usage:
+    budgetize balances [--convert]
+    budgetize summary [--month 2026-10] [--convert]
+    budgetize categories [--month 2026-10] [--convert]
+    budgetize export [--account NAME] [--month 2026-10] [--format csv]
+    budgetize import STATEMENT.csv --account NAME [--profile default] [--duplicates skip]
+    budgetize recurring list|add|delete|run
+    budgetize report [--period quarter] [--kind expenses] [--start 2017-01] [--end 2026-12]
+    budgetize forecast [--months 12] [--scenario budget]
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import os
+import sys
+from datetime import datetime
+from typing import IO, Iterable, Iterator, Optional
+
+from sqlalchemy.exc import NoResultFound
+
+from budgetize import CurrencyManager, SettingsManager
+from budgetize.consts import (
+    APP_FOLDER_PATH,
+    DB_FILE_NAME,
+    FORECAST_HISTORY_YEARS,
+    FORECAST_MONTHS,
+    FORECAST_SCENARIOS,
+    REPORT_KINDS,
+    REPORT_PERIODS,
+    VERSION,
+)
+from budgetize.dates import RECURRENCE_UNITS, get_year_month
+from budgetize.db.database import Database
+from budgetize.exceptions import (
+    CSVImportError,
+    ExchangeRateFetchError,
+    SchemaOutdatedError,
+)
+from budgetize.money import from_minor_units
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("json", "jsonl", "csv")
+
+
+class CliError(Exception):
+    """Error shown to the user of a command, without a traceback."""
+
+
+# ======================== OUTPUT ========================
+
+
+def write_rows(rows: Iterable[dict], fmt: str, stream: IO[str]) -> int:
+    """Writes the rows as they are produced.
+
+    Args:
+        rows (Iterable[dict]): The rows. All of them must have the keys of the first one.
+        fmt (str): "json" (an array), "jsonl" (an object per line) or "csv".
+        stream (IO[str]): Where the rows are written.
+
+    Returns:
+        int: The number of rows written.
+    """
+    count = 0
+    if fmt == "csv":
+        writer: Optional[csv.DictWriter] = None
+        for row in rows:
+            if writer is None:
+                writer = csv.DictWriter(stream, fieldnames=list(row))
+                writer.writeheader()
+            writer.writerow(row)
+            count += 1
+    elif fmt == "jsonl":
+        for row in rows:
+            stream.write(json.dumps(row, ensure_ascii=False) + "\n")
+            count += 1
+    else:
+        # The array is opened with the first row, so errors raised before it leave no output.
+        for row in rows:
+            stream.write(",\n    " if count else "[\n    ")
+            stream.write(json.dumps(row, ensure_ascii=False))
+            count += 1
+        stream.write("\n]\n" if count else "[]\n")
+
+    return count
+
+
+# ======================== COMMANDS ========================
+
+
+def parse_month(value: Optional[str]) -> int:
+    """Parses a month such as 2026-10 into a year month (202610). Defaults to the current month."""
+    if value is None:
+        return get_year_month(datetime.now().timestamp())
+
+    try:
+        date = datetime.strptime(value, "%Y-%m")
+    except ValueError as e:
+        raise CliError(f"Invalid month '{value}', expected YYYY-MM") from e
+
+    return date.year * 100 + date.month
+
+
+def format_month(year_month: int) -> str:
+    """Formats a year month (202610) as 2026-10."""
+    return f"{year_month // 100}-{year_month % 100:02}"
+
+
+def parse_date(value: str) -> float:
+    """Parses a date such as 2026-10-31 into the timestamp of its local midnight."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").timestamp()
+    except ValueError as e:
+        raise CliError(f"Invalid date '{value}', expected YYYY-MM-DD") from e
+
+
+def format_date(timestamp: Optional[float]) -> Optional[str]:
+    """Formats a timestamp as a local date such as 2026-10-31."""
+    if timestamp is None:
+        return None
+
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")
+
+
+def convert(amount: float, currency: str, base_currency: str) -> float:
+    """Converts an amount to the base currency with the saved rates, fetching missing ones."""
+    if currency == base_currency:
+        return amount
+
+    rate = asyncio.run(CurrencyManager(base_currency).get_exchange(currency))
+    return round(amount / rate, 2)
+
+
+def balances(db: Database, args: argparse.Namespace) -> Iterator[dict]:
+    """Yields the balance of every account."""
+    base_currency = SettingsManager().get_base_currency()
+    for account in db.get_accounts():
+        balance = db.get_account_balance(account.id)
+        row = {
+            "id": account.id,
+            "name": account.name,
+            "currency": account.currency,
+            "balance": balance,
+        }
+        if args.convert:
+            row["base_currency"] = base_currency
+            row["base_balance"] = convert(balance, account.currency, base_currency)
+
+        yield row
+
+
+def summary(db: Database, args: argparse.Namespace) -> Iterator[dict]:
+    """Yields the income, expenses and net of a month, per currency or in the base currency."""
+    year_month = parse_month(args.month)
+    incomes = db.get_monthly_totals(True, year_month)
+    expenses = db.get_monthly_totals(False, year_month)
+
+    rows = []
+    for currency in sorted(set(incomes) | set(expenses)):
+        income = from_minor_units(incomes.get(currency, 0), currency)
+        expense = from_minor_units(expenses.get(currency, 0), currency)
+        rows.append((currency, income, expense))
+
+    if not args.convert:
+        for currency, income, expense in rows:
+            yield {
+                "month": format_month(year_month),
+                "currency": currency,
+                "income": income,
+                "expense": expense,
+                "net": round(income + expense, 2),
+            }
+        return
+
+    settings = SettingsManager()
+    base_currency = settings.get_base_currency()
+    budget = settings.load_budget()
+    income = sum(convert(row[1], row[0], base_currency) for row in rows)
+    expense = sum(convert(row[2], row[0], base_currency) for row in rows)
+    yield {
+        "month": format_month(year_month),
+        "currency": base_currency,
+        "income": round(income, 2),
+        "expense": round(expense, 2),
+        "net": round(income + expense, 2),
+        "budget_income": budget.get_income() if budget else None,
+    }
+
+
+def categories(db: Database, args: argparse.Namespace) -> Iterator[dict]:
+    """Yields the spending of a month per category, with the budget limits if converted."""
+    year_month = parse_month(args.month)
+    names = {category_id: name for name, category_id in db.get_category_ids().items()}
+    totals = db.get_monthly_category_totals(year_month)
+
+    if not args.convert:
+        for category_id, currency, total in sorted(
+            totals, key=lambda total: (names[total[0]], total[1])
+        ):
+            yield {
+                "month": format_month(year_month),
+                "category": names[category_id],
+                "currency": currency,
+                "spent": -from_minor_units(total, currency),
+            }
+        return
+
+    settings = SettingsManager()
+    base_currency = settings.get_base_currency()
+    budget = settings.load_budget()
+    limits = budget.get_all_limits() if budget else {}
+
+    spent: dict[str, float] = {}
+    for category_id, currency, total in totals:
+        name = names[category_id]
+        amount = -convert(from_minor_units(total, currency), currency, base_currency)
+        spent[name] = spent.get(name, 0.0) + amount
+
+    for name in sorted(set(spent) | set(limits)):
+        limit = limits.get(name)
+        yield {
+            "month": format_month(year_month),
+            "category": name,
+            "currency": base_currency,
+            "spent": round(spent.get(name, 0.0), 2),
+            "limit": limit,
+            "remaining": (
+                round(limit - spent.get(name, 0.0), 2) if limit is not None else None
+            ),
+        }
+
+
+def find_account_id(db: Database, name_or_id: str) -> int:
+    """Returns the ID of the account with the specified name or ID."""
+    account = db.get_account_by_name(name_or_id)
+    if account is None and name_or_id.isdigit():
+        try:
+            account = db.get_account_by_id(int(name_or_id))
+        except NoResultFound:
+            pass
+
+    if account is None:
+        raise CliError(f"Account '{name_or_id}' not found")
+
+    return account.id
+
+
+def export(db: Database, args: argparse.Namespace) -> Iterator[dict]:
+    """Yields every transaction, oldest first, streaming them from the database."""
+    account_id = find_account_id(db, args.account) if args.account else None
+    year_month = parse_month(args.month) if args.month else None
+    for row in db.stream_transactions(account_id, year_month):
+        yield {
+            "id": row.id,
+            "account": row.account,
+            "currency": row.currency,
+            "amount": from_minor_units(row.amount_minor, row.currency),
+            "date": datetime.fromtimestamp(row.timestamp).isoformat(timespec="seconds"),
+            "category": row.category,
+            "description": row.description,
+            "visible": row.visible,
+        }
+
+
+def import_statement(db: Database, args: argparse.Namespace) -> Iterator[dict]:
+    """Imports a CSV statement into an account and yields the result, with its throughput."""
+    # Imported here, only this command needs the import pipeline.
+    from budgetize.importer import CSVImporter, get_profile
+
+    account_id = find_account_id(db, args.account)
+    try:
+        importer = CSVImporter(db, get_profile(args.profile), workers=args.workers)
+        result = importer.run(
+            args.file,
+            account_id,
+            skip_invalid=args.skip_invalid,
+            dry_run=args.dry_run,
+            on_duplicate=args.duplicates,
+        )
+    except (CSVImportError, OSError, UnicodeDecodeError) as e:
+        raise CliError(f"Could not import {args.file}: {e}") from e
+
+    for line, message in result.errors:
+        print(f"budgetize: line {line}: {message}", file=sys.stderr)
+
+    yield {**result.to_dict(), "dry_run": args.dry_run}
+
+
+def recurring(db: Database, args: argparse.Namespace) -> Iterator[dict]:
+    """Lists, adds or deletes recurring rules, or adds the transactions that are due."""
+    if args.action == "run":
+        yield {"added": db.materialize_due_transactions()}
+        return
+
+    if args.action == "add":
+        account_id = find_account_id(db, args.account)
+        start = parse_date(args.start) if args.start else datetime.now().timestamp()
+        try:
+            db.add_recurring_rule(
+                account_id,
+                args.amount,
+                args.description,
+                args.category,
+                args.unit,
+                start,
+                every=args.every,
+                end=parse_date(args.end) if args.end else None,
+            )
+        except ValueError as e:
+            raise CliError(str(e)) from e
+    elif args.action == "delete":
+        db.delete_recurring_rule(args.rule_id)
+        return
+
+    accounts = {account.id: account.name for account in db.get_accounts()}
+    for rule in db.get_recurring_rules():
+        yield {
+            "id": rule.id,
+            "account": accounts.get(rule.account_id),
+            "amount": rule.amount,
+            "description": rule.description,
+            "category": rule.category,
+            "every": rule.every,
+            "unit": rule.unit,
+            "start": format_date(rule.start),
+            "end": format_date(rule.end),
+            "next_due": format_date(rule.next_due) if rule.active else None,
+            "active": rule.active,
+        }
+
+
+def report(db: Database, args: argparse.Namespace) -> Iterator[dict]:
+    """Yields the totals of each category per period in the base currency, then their sum."""
+    # Imported here, NumPy is slow to import and only the reports need it.
+    from budgetize.reports import ReportEngine
+
+    start = parse_month(args.start) if args.start else None
+    end = parse_month(args.end) if args.end else None
+    if start is not None and end is not None and start > end:
+        raise CliError("The start month is after the end month")
+
+    engine = ReportEngine(db)
+    try:
+        account_factors = asyncio.run(engine.get_account_factors())
+    except ExchangeRateFetchError as e:
+        raise CliError(str(e)) from e
+
+    period_report = engine.build(
+        account_factors,
+        period=args.period,
+        kind=args.kind,
+        start=start,
+        end=end,
+        account_ids=[find_account_id(db, args.account)] if args.account else None,
+    )
+    yield from period_report.to_rows()
+
+    total = period_report.get_total()
+    row: dict = {"category": "Total"}
+    row.update(
+        (period, round(amount, 2))
+        for period, amount in period_report.get_period_totals().items()
+    )
+    row["total"] = round(total, 2)
+    row["average"] = round(total / max(len(period_report.periods), 1), 2)
+    yield row
+
+
+def forecast(db: Database, args: argparse.Namespace) -> Iterator[dict]:
+    """Yields the forecast balance of each account at the end of the next months, then the net worth."""
+    # Imported here, NumPy is slow to import and only the forecast needs it.
+    from budgetize.forecast import ForecastEngine
+
+    if args.months < 1 or args.history_years < 1:
+        raise CliError("The months and years of history must be at least 1")
+
+    budget = SettingsManager().load_budget()
+    if args.scenario == "budget" and budget is None:
+        raise CliError("The budget scenario requires a budget")
+
+    engine = ForecastEngine(db)
+    try:
+        rates = asyncio.run(engine.get_rates())
+    except ExchangeRateFetchError as e:
+        raise CliError(str(e)) from e
+
+    yield from engine.build(
+        rates, budget, months=args.months, history_years=args.history_years
+    ).to_rows(args.scenario)
+
+
+COMMANDS = {
+    "balances": balances,
+    "summary": summary,
+    "categories": categories,
+    "export": export,
+    "import": import_statement,
+    "recurring": recurring,
+    "report": report,
+    "forecast": forecast,
+}
+
+
+# ======================== ENTRY POINT ========================
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Returns the parser of the headless commands."""
+    parser = argparse.ArgumentParser(
+        prog="budgetize",
+        description="Run without arguments to start the TUI, or use a command to query the ledger.",
+    )
+    parser.add_argument("--version", action="version", version=VERSION)
+    parser.add_argument(
+        "--db",
+        default=os.path.join(APP_FOLDER_PATH, DB_FILE_NAME),
+        help="Path of the ledger (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--format", choices=FORMATS, default="json", help="Output format"
+    )
+
+    # The options are accepted after the command too. Defaults come from the main parser.
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--db", default=argparse.SUPPRESS, help="Path of the ledger")
+    common.add_argument(
+        "--format", choices=FORMATS, default=argparse.SUPPRESS, help="Output format"
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    balances_parser = subparsers.add_parser(
+        "balances", parents=[common], help="Balance of each account"
+    )
+    balances_parser.add_argument(
+        "--convert", action="store_true", help="Add the balance in the base currency"
+    )
+
+    for name, help_text in (
+        ("summary", "Income, expenses and net of a month"),
+        ("categories", "Spending of a month by category"),
+    ):
+        month_parser = subparsers.add_parser(name, parents=[common], help=help_text)
+        month_parser.add_argument(
+            "--month", help="The month as YYYY-MM (default: current month)"
+        )
+        month_parser.add_argument(
+            "--convert",
+            action="store_true",
+            help="Add up the currencies in the base currency and show the budget",
+        )
+
+    export_parser = subparsers.add_parser(
+        "export", parents=[common], help="Every transaction"
+    )
+    export_parser.add_argument("--account", help="Name or ID of the account")
+    export_parser.add_argument("--month", help="Only export a month, as YYYY-MM")
+
+    import_parser = subparsers.add_parser(
+        "import", parents=[common], help="Import a CSV bank statement"
+    )
+    import_parser.add_argument("file", help="Path of the CSV statement")
+    import_parser.add_argument(
+        "--account", required=True, help="Name or ID of the account"
+    )
+    import_parser.add_argument(
+        "--profile",
+        default="default",
+        help="Mapping of the columns, from the settings (default: %(default)s)",
+    )
+    import_parser.add_argument(
+        "--skip-invalid",
+        action="store_true",
+        help="Import the valid rows even if others are invalid",
+    )
+    import_parser.add_argument(
+        "--duplicates",
+        choices=("skip", "merge", "insert"),
+        default="skip",
+        help="What to do with the transactions already in the ledger (default: %(default)s)",
+    )
+    import_parser.add_argument(
+        "--dry-run", action="store_true", help="Only parse and validate the statement"
+    )
+    import_parser.add_argument(
+        "--workers", type=int, help="Processes that parse large statements"
+    )
+
+    recurring_parser = subparsers.add_parser(
+        "recurring", parents=[common], help="Recurring transactions"
+    )
+    actions = recurring_parser.add_subparsers(dest="action", required=True)
+    actions.add_parser("list", parents=[common], help="Every recurring rule")
+    add_parser = actions.add_parser(
+        "add", parents=[common], help="Add a recurring rule and list the rules"
+    )
+    add_parser.add_argument(
+        "--account", required=True, help="Name or ID of the account"
+    )
+    add_parser.add_argument(
+        "--amount", type=float, required=True, help="Negative for expenses"
+    )
+    add_parser.add_argument("--description", required=True)
+    add_parser.add_argument("--category", default="")
+    add_parser.add_argument(
+        "--unit",
+        choices=RECURRENCE_UNITS,
+        default="month",
+        help="(default: %(default)s)",
+    )
+    add_parser.add_argument(
+        "--every", type=int, default=1, help="Units between transactions (default: 1)"
+    )
+    add_parser.add_argument(
+        "--start", help="Date of the first transaction, YYYY-MM-DD (default: today)"
+    )
+    add_parser.add_argument("--end", help="Date of the last transaction, YYYY-MM-DD")
+    delete_parser = actions.add_parser(
+        "delete", parents=[common], help="Delete a recurring rule"
+    )
+    delete_parser.add_argument("rule_id", type=int)
+    actions.add_parser(
+        "run", parents=[common], help="Add the transactions that are due"
+    )
+
+    report_parser = subparsers.add_parser(
+        "report",
+        parents=[common],
+        help="Totals of each category per period, in the base currency",
+    )
+    report_parser.add_argument(
+        "--period",
+        choices=REPORT_PERIODS,
+        default="month",
+        help="(default: %(default)s)",
+    )
+    report_parser.add_argument(
+        "--kind",
+        choices=REPORT_KINDS,
+        default="expenses",
+        help="(default: %(default)s)",
+    )
+    report_parser.add_argument("--start", help="First month, as YYYY-MM")
+    report_parser.add_argument("--end", help="Last month, as YYYY-MM")
+    report_parser.add_argument("--account", help="Name or ID of the account")
+
+    forecast_parser = subparsers.add_parser(
+        "forecast",
+        parents=[common],
+        help="Balance of each account at the end of the next months",
+    )
+    forecast_parser.add_argument(
+        "--months",
+        type=int,
+        default=FORECAST_MONTHS,
+        help="Months to forecast, the current one included (default: %(default)s)",
+    )
+    forecast_parser.add_argument(
+        "--scenario",
+        choices=FORECAST_SCENARIOS,
+        default="seasonal",
+        help="'budget' spends the budget limits (default: %(default)s)",
+    )
+    forecast_parser.add_argument(
+        "--history-years",
+        type=int,
+        default=FORECAST_HISTORY_YEARS,
+        help="Years the seasonal averages are taken from (default: %(default)s)",
+    )
+
+    return parser
+
+
+def writes_ledger(args: argparse.Namespace) -> bool:
+    """Returns whether the command writes to the ledger.
+
+    Other commands open it read-only, so they do not migrate or back it up.
+    """
+    if args.command == "import":
+        return not bool(args.dry_run)
+
+    return args.command == "recurring" and bool(args.action != "list")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Runs a headless command.
+
+    Args:
+        argv (list[str]): The arguments, without the program name. Defaults to sys.argv.
+
+    Returns:
+        int: The exit code.
+    """
+    args = build_parser().parse_args(argv)
+
+    if not os.path.exists(args.db):
+        print(f"budgetize: no ledger found at {args.db}", file=sys.stderr)
+        return 1
+
+    try:
+        db = Database(url=f"sqlite:///{args.db}", read_only=not writes_ledger(args))
+    except SchemaOutdatedError:
+        print(
+            f"budgetize: the ledger at {args.db} is out of date. "
+            "Start Budgetize once to update it.",
+            file=sys.stderr,
+        )
+        return 1
+
+    try:
+        count = write_rows(COMMANDS[args.command](db, args), args.format, sys.stdout)
+    except CliError as e:
+        print(f"budgetize: {e}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # The output was piped to a command that stopped reading, e.g. `head`.
+        sys.stderr.close()
+        return 0
+
+    logger.info("Command %s wrote %s rows", args.command, count)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
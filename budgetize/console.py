@@ -1,22 +1,23 @@
 """Entry point when running budgetize cmd"""
 
-import logging
-import os
+import sys
 
-from budgetize.consts import APP_FOLDER_PATH
-from budgetize.tui import TuiApp
+from budgetize.log import setup_logging
 
 
 def run() -> None:
-    """Runs Budgetize"""
+    """Runs Budgetize. With arguments, runs a headless command instead of the TUI."""
 
-    log_path = os.path.join(APP_FOLDER_PATH, "budgetize.log")
+    listener = setup_logging()
+    try:
+        if len(sys.argv) > 1:
+            # Imported here so the commands do not load Textual and the screens.
+            from budgetize.cli import main
 
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format="[%(asctime)s ] (%(module)s.%(funcName)s | %(levelname)s) %(message)s",
-        datefmt="%d/%m/%Y @ %H:%M:%S %Z",
-        filename=log_path,
-    )
+            sys.exit(main(sys.argv[1:]))
 
-    TuiApp().run()
+        from budgetize.tui import TuiApp
+
+        TuiApp().run()
+    finally:
+        listener.stop()
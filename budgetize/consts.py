@@ -1,9 +1,9 @@
 "Module that stores constant variables for the app such like names or paths"
 
 import os
+from typing import Any
 
-import pkg_resources
-from babel import Locale
+from budgetize.resources import get_available_languages, get_translations_path
 
 VERSION = "0.2.1"
 VALID_EXCHANGE_TIMESTAMP = 7 * 24 * 60 * 60  # 1 week in seconds
@@ -17,9 +17,85 @@ DB_FILE_NAME = "budgetize.sqlite"
 EXPORT_DATA_EXTENSION = "bdgz"
 PROD_DB_URL = f"sqlite:///{os.path.join(APP_FOLDER_PATH, DB_FILE_NAME)}"
 BACKUPS_FOLDER = os.path.join(APP_FOLDER_PATH, "backups")
+DEV_DB_URL = "sqlite:///test_db.sqlite"
+
+# SQLite performance profile. May be overridden with the "database" key of the settings file.
+DEFAULT_DATABASE_SETTINGS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 256 * 1024 * 1024,  # 256 MiB
+    "cache_size": -16 * 1024,  # Negative values are KiB, so 16 MiB
+    "statement_cache_size": 256,  # Prepared statements kept by each sqlite3 connection
+    "query_cache_size": 500,  # Compiled SQL statements kept by SQLAlchemy
+    "slow_query_ms": 100,  # Statements slower than this are logged with their plan. None disables it
+}
+
+# Logging
+LOG_FILE_NAME = "budgetize.log"
+LOG_LEVEL_ENV_VAR = "BUDGETIZE_LOG_LEVEL"
+
+# May be overridden with the "logging" key of the settings file.
+DEFAULT_LOGGING_SETTINGS = {
+    "level": "INFO",
+    "max_bytes": 1024 * 1024,  # Size at which the log is rotated, 1 MiB
+    "backup_count": 3,  # Rotated logs kept, e.g. budgetize.log.1
+    "when": None,  # Rotate by time instead of size, e.g. "midnight" (see TimedRotatingFileHandler)
+}
+
+# Instrumentation, always enabled with Textual's devtools
+INSTRUMENTATION_ENV_VAR = "BUDGETIZE_INSTRUMENT"
+INSTRUMENTATION_FILE_NAME = "instrumentation.json"
+
+# CSV import. Profiles map the columns of a bank statement, more may be added with the
+# "import_profiles" key of the settings file. Columns are header names or 0-based indexes.
+DEFAULT_IMPORT_PROFILES = {
+    "default": {
+        "delimiter": ",",
+        "encoding": "utf-8-sig",
+        "skip_rows": 0,  # Lines before the header
+        "header": True,  # Without a header, columns must be indexes
+        "locale": "en_US",  # Decimal and group separators of the amounts
+        "date_format": "%Y-%m-%d",  # None parses the dates with the formats of the locale
+        "columns": {
+            "date": "date",
+            "amount": "amount",  # Or "debit" and "credit" columns instead
+            "description": "description",
+            "category": "category",  # Optional
+        },
+        "negate": False,  # Expenses are positive in the statement
+        "default_category": "",
+    },
+    "european": {
+        "delimiter": ";",
+        "encoding": "utf-8-sig",
+        "skip_rows": 0,
+        "header": True,
+        "locale": "de_DE",
+        "date_format": "%d.%m.%Y",
+        "columns": {
+            "date": "date",
+            "amount": "amount",
+            "description": "description",
+            "category": "category",
+        },
+        "negate": False,
+        "default_category": "",
+    },
+}
+IMPORT_CHUNK_SIZE = 5000  # Rows parsed at a time, by each process of the pool
+IMPORT_PARALLEL_BYTES = 2 * 1024 * 1024  # Smaller files are parsed in the main process
+
+# Period reports. See `budgetize.reports`. Expenses are reported as positive amounts.
+REPORT_PERIODS = ("month", "quarter", "year")
+REPORT_KINDS = ("expenses", "income", "net")
+
+# Cash-flow forecasts. See `budgetize.forecast`.
+FORECAST_SCENARIOS = ("seasonal", "budget")
+FORECAST_MONTHS = 12
+FORECAST_HISTORY_YEARS = 2  # Years of history the seasonal averages are taken from
 
 # Localization
-TRANSLATIONS_PATH: str = pkg_resources.resource_filename("budgetize", "translations")
+TRANSLATIONS_PATH: str = get_translations_path()
 
 if not os.path.exists(APP_FOLDER_PATH):
     os.makedirs(APP_FOLDER_PATH)
@@ -43,16 +119,14 @@ DEFAULT_CATEGORIES = [
 
 del _
 
-AVAILABLE_LANGUAGES: list[tuple[str, str]] = [
-    (Locale("en").display_name, "en"),
-]
 
-locale_dirs = os.listdir(TRANSLATIONS_PATH)
-for locale_dir in locale_dirs:
-    if os.path.isdir(os.path.join(TRANSLATIONS_PATH, locale_dir)):
-        AVAILABLE_LANGUAGES.append(
-            (Locale(locale_dir).display_name.title(), locale_dir)
-        )
+def __getattr__(name: str) -> Any:
+    """Loads the constants that are slow to build when they are first accessed."""
+    if name == "AVAILABLE_LANGUAGES":
+        return get_available_languages()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Settings
 DEFAULT_SETTINGS = {
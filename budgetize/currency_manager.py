@@ -6,10 +6,7 @@ import os
 import traceback
 from typing import Optional
 
-import httpx
 from arrow import Arrow
-from bs4 import BeautifulSoup
-from httpx import HTTPStatusError, NetworkError, TimeoutException
 
 from budgetize.consts import APP_FOLDER_PATH
 from budgetize.exceptions import ExchangeRateFetchError
@@ -63,8 +60,8 @@ class CurrencyManager:
             float: The exchange rate.
         """
 
-        logger.info(
-            "Retrieving exchange rate for {}-{}...".format(self.base_currency, currency)
+        logger.debug(
+            "Retrieving exchange rate for %s-%s...", self.base_currency, currency
         )
 
         if self.base_currency not in CurrencyManager.CURRENT_RATES:
@@ -91,9 +88,7 @@ class CurrencyManager:
                 continue
 
             logger.info(
-                "Rate for {}-{} has expired. Updating...".format(
-                    self.base_currency, currency
-                )
+                "Rate for %s-%s has expired. Updating...", self.base_currency, currency
             )
             rate = await self.fetch_and_save_rate(currency)
             logger.info("Saving fetched exchange rate...")
@@ -156,6 +151,11 @@ class CurrencyManager:
 
 
         """
+        # Imported here since they are slow to import and only needed to refresh rates.
+        import httpx
+        from bs4 import BeautifulSoup
+        from httpx import HTTPStatusError, NetworkError, TimeoutException
+
         async with httpx.AsyncClient() as client:
             url = f"https://www.xe.com/currencyconverter/convert/?Amount=1&From={self.base_currency.upper()}&To={currency.upper()}"
             logger.info("Attempting to fetch exchange rate at {}".format(url))
@@ -247,11 +247,12 @@ class CurrencyManager:
 
         """
         logger.info(
-            "Saving exchange rate for {}-{} at {}...".format(
-                self.base_currency, currency, exchange
-            )
+            "Saving exchange rate for %s-%s at %s...",
+            self.base_currency,
+            currency,
+            exchange,
         )
-        logger.debug("Current rates: {}".format(CurrencyManager.CURRENT_RATES))
+        logger.debug("Current rates: %s", CurrencyManager.CURRENT_RATES)
         exchange_obj = ExchangeRate(
             currency=currency,
             rate=exchange,
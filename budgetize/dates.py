@@ -0,0 +1,60 @@
+"""Helpers to bucket and format transaction timestamps without building Arrow objects."""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable
+
+from arrow import Arrow
+
+# Formats used across the TUI, implemented without Arrow's tokenizer.
+_DATE_FORMATTERS: dict[str, Callable[[datetime], str]] = {
+    "MM/DD/YYYY": lambda date: f"{date.month:02}/{date.day:02}/{date.year}",
+    "M/D/YYYY": lambda date: f"{date.month}/{date.day}/{date.year}",
+}
+
+
+# Units of the interval of recurring transactions.
+RECURRENCE_UNITS = ("day", "week", "month", "year")
+
+
+def get_year_month(timestamp: float) -> int:
+    """Returns the local year and month of a timestamp as an integer (e.g. 202610 for October 2026)."""
+    date = datetime.fromtimestamp(timestamp)
+    return date.year * 100 + date.month
+
+
+@lru_cache(maxsize=4096)
+def format_date(epoch: int, fmt: str = "MM/DD/YYYY") -> str:
+    """Formats an epoch timestamp as a local date.
+
+    Args:
+        epoch (int): The timestamp in seconds.
+        fmt (str): An Arrow format string. Common formats skip Arrow entirely.
+
+    Returns:
+        str: The formatted date.
+    """
+    formatter = _DATE_FORMATTERS.get(fmt)
+    if formatter is None:
+        return Arrow.fromtimestamp(epoch).format(fmt)
+
+    return formatter(datetime.fromtimestamp(epoch))
+
+
+def get_occurrence(start: float, unit: str, every: int, occurrence: int) -> float:
+    """Returns the timestamp of the n-th occurrence of a recurring transaction.
+
+    Occurrences are computed from the start, so a rule that starts on the 31st falls on
+    the last day of shorter months and returns to the 31st afterwards.
+
+    Args:
+        start (float): The timestamp of the first occurrence.
+        unit (str): One of `RECURRENCE_UNITS`.
+        every (int): The number of units between occurrences.
+        occurrence (int): The index of the occurrence, 0 being the first one.
+
+    Returns:
+        float: The timestamp of the occurrence, at the local time of the start.
+    """
+    shift: dict[str, Any] = {f"{unit}s": every * occurrence}
+    return Arrow.fromtimestamp(start).shift(**shift).timestamp()
@@ -0,0 +1,96 @@
+"""Defines the in-memory cache of accounts used by the Database class."""
+
+from collections import OrderedDict
+from threading import RLock
+from typing import Optional
+
+from budgetize.db.orm.account import Account
+
+
+class AccountCache:
+    """LRU identity map of `Account` records keyed by their ID.
+
+    Accounts are read constantly (once per table row, per keystroke or per highlighted cell)
+    but change rarely, so `Database` keeps the detached records here and drops them
+    whenever an account is created or deleted. It is safe to use from the threads of
+    `AsyncDatabase`.
+
+    Parameters
+    ----------
+    max_size : int
+        The maximum amount of accounts kept in memory.
+    """
+
+    def __init__(self, max_size: int = 128) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        self._accounts: OrderedDict[int, Account] = OrderedDict()
+        self._ids_by_name: dict[str, int] = {}
+        self._lock = RLock()
+
+    def get(self, account_id: int) -> Optional[Account]:
+        """Returns the cached account with the specified ID, or None if it is not cached."""
+
+        with self._lock:
+            account = self._accounts.get(account_id)
+            if account is None:
+                self.misses += 1
+                return None
+
+            self._accounts.move_to_end(account_id)
+            self.hits += 1
+            return account
+
+    def get_by_name(self, name: str) -> Optional[Account]:
+        """Returns the cached account with the specified name, or None if it is not cached."""
+
+        with self._lock:
+            account_id = self._ids_by_name.get(name)
+            if account_id is None:
+                self.misses += 1
+                return None
+
+            return self.get(account_id)
+
+    def put(self, account: Account) -> None:
+        """Stores an account in the cache, evicting the least recently used one if full."""
+
+        with self._lock:
+            self._accounts[account.id] = account
+            self._accounts.move_to_end(account.id)
+            self._ids_by_name[account.name] = account.id
+
+            while len(self._accounts) > self.max_size:
+                _, evicted = self._accounts.popitem(last=False)
+                self._ids_by_name.pop(evicted.name, None)
+
+    def invalidate(self, account_id: Optional[int] = None) -> None:
+        """Drops the specified account from the cache. If no ID is given, the whole cache is cleared."""
+
+        with self._lock:
+            if account_id is None:
+                self._accounts.clear()
+                self._ids_by_name.clear()
+                return
+
+            account = self._accounts.pop(account_id, None)
+            if account is not None:
+                self._ids_by_name.pop(account.name, None)
+
+    def stats(self) -> dict[str, float]:
+        """Returns the hit/miss statistics of the cache.
+
+        Returns
+        -------
+            dict: The hits, misses, current size and hit rate of the cache.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._accounts),
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,240 @@
+"""Async facade of the Database class, so queries never block the Textual event loop.
+
+Reads run on a small pool of threads, which SQLite serves concurrently thanks to WAL.
+Writes are queued on a single thread, since SQLite only allows one writer at a time.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+from budgetize.db.database import Database
+from budgetize.db.orm.account import Account
+from budgetize.db.orm.transactions import Transaction
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncDatabase:
+    """Runs the queries of a `Database` outside the event loop.
+
+    Every method is a coroutine with the same arguments as its `Database` counterpart.
+    Methods that return iterators in `Database` return lists here, since the rows have to
+    be fetched before the session is closed by the worker thread.
+
+    Parameters
+    ----------
+    database : Database
+        The database whose methods are run.
+    """
+
+    READ_WORKERS = 4
+
+    # Shared between all instances since every screen creates its own facade.
+    _read_executor = ThreadPoolExecutor(
+        max_workers=READ_WORKERS, thread_name_prefix="budgetize-db-read"
+    )
+    _write_executor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="budgetize-db-write"
+    )
+
+    def __init__(self, database: Database) -> None:
+        self.db = database
+
+    async def _read(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """(Coroutine) Runs a read query in the reader threads."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            AsyncDatabase._read_executor, partial(func, *args, **kwargs)
+        )
+
+    async def _write(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """(Coroutine) Queues a write in the writer thread. Writes run in the order they were queued."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            AsyncDatabase._write_executor, partial(func, *args, **kwargs)
+        )
+
+    # ======================== GET INFO ========================
+
+    async def get_transactions_from_account(self, account_id: int) -> list[Transaction]:
+        """(Coroutine) Returns the transactions from the specified account."""
+        return await self._read(
+            lambda: list(self.db.get_transactions_from_account(account_id))
+        )
+
+    async def get_monthly_transactions_from_account(
+        self, account_id: int, month: str, year: str
+    ) -> list[Transaction]:
+        """(Coroutine) Returns the transactions from the specified account within the specified month and year."""
+        return await self._read(
+            lambda: list(
+                self.db.get_monthly_transactions_from_account(account_id, month, year)
+            )
+        )
+
+    async def get_accounts(self) -> list[Account]:
+        """(Coroutine) Returns all the accounts."""
+        return await self._read(lambda: list(self.db.get_accounts()))
+
+    async def get_account_by_id(self, account_id: int) -> Account:
+        """(Coroutine) Returns the account with the specified ID."""
+        # Cached accounts are returned right away, without the round trip to a thread.
+        cached_account = self.db.account_cache.get(account_id)
+        if cached_account is not None:
+            return cached_account
+
+        return await self._read(self.db.get_account_by_id, account_id)
+
+    async def get_account_by_name(self, name: str) -> Account:
+        """(Coroutine) Returns the account with the specified name."""
+        cached_account = self.db.account_cache.get_by_name(name)
+        if cached_account is not None:
+            return cached_account
+
+        return await self._read(self.db.get_account_by_name, name)
+
+    async def account_name_exists(self, name: str) -> bool:
+        """(Coroutine) Returns True if an account with the specified name exists, False otherwise."""
+        return await self._read(self.db.account_name_exists, name)
+
+    async def get_transaction_by_id(self, transaction_id: int) -> Transaction:
+        """(Coroutine) Returns the transaction with the specified ID."""
+        return await self._read(self.db.get_transaction_by_id, transaction_id)
+
+    async def get_all_recent_transactions(self) -> list[Transaction]:
+        """(Coroutine) Returns the last 5 transactions saved across all accounts."""
+        return await self._read(self.db.get_all_recent_transactions)
+
+    async def search_transactions(
+        self, query: str, limit: int = 20, offset: int = 0
+    ) -> list[Transaction]:
+        """(Coroutine) Returns the transactions whose description or category match the query."""
+        return await self._read(self.db.search_transactions, query, limit, offset)
+
+    async def get_account_balance(self, account_id: int) -> float:
+        """(Coroutine) Returns the balance of the specified account."""
+        return await self._read(self.db.get_account_balance, account_id)
+
+    async def get_account_balances(self, account_ids: list[int]) -> list[float]:
+        """(Coroutine) Returns the balance of each specified account, querying them concurrently.
+
+        Args:
+            account_ids (list[int]): The IDs of the accounts.
+
+        Returns:
+            list[float]: The balances, in the same order as the IDs.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.get_account_balance(account_id) for account_id in account_ids)
+            )
+        )
+
+    async def get_monthly_income(self) -> float:
+        """(Coroutine) Returns the total income for the current month in the base currency."""
+        totals = await self._read(self.db.get_monthly_totals, True)
+        return await self.db.get_totals_in_base_currency(totals)
+
+    async def get_monthly_expense(self) -> float:
+        """(Coroutine) Returns the total expenses for the current month in the base currency."""
+        totals = await self._read(self.db.get_monthly_totals, False)
+        return await self.db.get_totals_in_base_currency(totals)
+
+    async def get_monthly_expenses_by_category(self) -> dict[int, float]:
+        """(Coroutine) Returns the expenses of the current month in the base currency by category ID."""
+        totals = await self._read(self.db.get_monthly_category_totals)
+        return await self.db.get_category_totals_in_base_currency(totals)
+
+    async def get_categories(self) -> list[str]:
+        """(Coroutine) Returns the names of the categories the user can pick."""
+        return await self._read(self.db.get_categories)
+
+    async def get_category_ids(self) -> dict[str, int]:
+        """(Coroutine) Returns the ID of every category by name."""
+        return await self._read(self.db.get_category_ids)
+
+    async def get_db_as_dict(self) -> dict[int, dict]:
+        """(Coroutine) Returns the database as a dictionary."""
+        return await self._read(self.db.get_db_as_dict)
+
+    # ======================== ADD/UPDATE INFO ========================
+
+    async def add_account(
+        self, name: str, currency: str, starting_balance: float
+    ) -> None:
+        """(Coroutine) Adds a new account to the user."""
+        await self._write(self.db.add_account, name, currency, starting_balance)
+
+    async def add_transaction(
+        self,
+        account_id: int,
+        amount: float,
+        description: str,
+        category: str,
+        timestamp: float,
+        visible: bool = True,
+    ) -> None:
+        """(Coroutine) Registers a new transaction."""
+        await self._write(
+            self.db.add_transaction,
+            account_id,
+            amount,
+            description,
+            category,
+            timestamp,
+            visible,
+        )
+
+    async def update_transaction(
+        self,
+        transaction_id: int,
+        account_id: int,
+        amount: float,
+        description: str,
+        category: str,
+        timestamp: float,
+    ) -> None:
+        """(Coroutine) Updates the specified transaction."""
+        await self._write(
+            self.db.update_transaction,
+            transaction_id,
+            account_id,
+            amount,
+            description,
+            category,
+            timestamp,
+        )
+
+    async def materialize_due_transactions(self) -> int:
+        """(Coroutine) Adds the occurrences of the recurring rules that became due."""
+        return await self._write(self.db.materialize_due_transactions)
+
+    async def add_category(self, name: str) -> None:
+        """(Coroutine) Adds a category the user can pick."""
+        await self._write(self.db.add_category, name)
+
+    async def delete_category(self, name: str) -> None:
+        """(Coroutine) Stops offering the specified category to the user."""
+        await self._write(self.db.delete_category, name)
+
+    async def delete_account(self, account_id: int) -> None:
+        """(Coroutine) Deletes the specified account and its transactions."""
+        await self._write(self.db.delete_account, account_id)
+
+    async def delete_transaction(self, transaction_id: int) -> Transaction:
+        """(Coroutine) Deletes the specified transaction and returns it."""
+        return await self._write(self.db.delete_transaction, transaction_id)
+
+    async def populate_from_dict(self, data: dict[str, dict]) -> None:
+        """(Coroutine) Populates the database from a dictionary."""
+        await self._write(self.db.populate_from_dict, data)
+
+    async def revert_from_backup(self, backup_file: Path) -> bool:
+        """(Coroutine) Reverts the database to the specified backup file."""
+        return await self._write(self.db.revert_from_backup, backup_file)
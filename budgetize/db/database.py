@@ -2,19 +2,72 @@
 
 import logging
 import os
+import re
+import sqlite3
+from itertools import islice
 from pathlib import Path
-from typing import Iterator, Optional
+from threading import Lock
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 
 from arrow import Arrow
-from sqlalchemy import Engine, create_engine, select, update
+from sqlalchemy import (
+    Connection,
+    Engine,
+    Row,
+    bindparam,
+    delete,
+    func,
+    insert,
+    inspect,
+    select,
+    text,
+    update,
+)
 from sqlalchemy.orm import Session
-from textual.app import App
 
 from budgetize import CurrencyManager, SettingsManager
-from budgetize.consts import APP_FOLDER_PATH, BACKUPS_FOLDER, DB_FILE_NAME, PROD_DB_URL
+from budgetize.consts import (
+    APP_FOLDER_PATH,
+    BACKUPS_FOLDER,
+    DB_FILE_NAME,
+    DEV_DB_URL,
+    PROD_DB_URL,
+    REPORT_KINDS,
+)
+from budgetize.dates import RECURRENCE_UNITS, get_occurrence, get_year_month
+from budgetize.db.account_cache import AccountCache
+from budgetize.db.engine import dispose_engine, get_engine
+from budgetize.db.events import (
+    AccountsChanged,
+    CategoriesChanged,
+    DatabaseEvent,
+    EventBus,
+    RecurringRulesChanged,
+    TransactionsChanged,
+)
+from budgetize.db.fingerprint import (
+    DUPLICATE_MODES,
+    allocate_fingerprints,
+    find_fingerprints,
+    get_fingerprint_hash,
+    make_fingerprint,
+)
+from budgetize.db.migrations import (
+    has_search_index,
+    is_migration_pending,
+    migrate,
+)
 from budgetize.db.orm._base import Base
 from budgetize.db.orm.account import Account
+from budgetize.db.orm.category import Category
+from budgetize.db.orm.recurring_rule import RecurringRule
 from budgetize.db.orm.transactions import Transaction
+from budgetize.exceptions import SchemaOutdatedError
+from budgetize.money import from_minor_units, to_minor_units
+
+# Only needed for annotations, so the headless CLI does not import Textual.
+if TYPE_CHECKING:
+    from textual.app import App
 
 logger = logging.getLogger(__name__)
 
@@ -25,56 +78,134 @@ class Database:
     All read and writes are done here which may include utilities for converting currencies, for example.
     """
 
-    engine = create_engine(PROD_DB_URL)
     backup_done = False
 
-    def __init__(self, app: Optional[App] = None):
+    # Every screen creates its own Database, so the accounts cached by the instances
+    # connected to the same engine are shared.
+    _account_caches: dict[Engine, AccountCache] = {}
+
+    # Whether the database of each engine has the FTS5 index of transactions.
+    _search_indexes: dict[Engine, bool] = {}
+
+    # Number of writes done to each table during this session. Screens compare them
+    # against the versions they last rendered to skip redundant updates.
+    _versions: dict[str, int] = {
+        "accounts": 0,
+        "transactions": 0,
+        "categories": 0,
+        "recurring_rules": 0,
+    }
+    _versions_lock = Lock()
+
+    # Receives a change event after every write.
+    events = EventBus()
+
+    def __init__(
+        self,
+        app: Optional["App"] = None,
+        url: Optional[str] = None,
+        read_only: bool = False,
+    ):
         """Initializes a Database instance.
 
         Args:
         ----
             app (App): The application instance.
+            url (str): The SQLAlchemy URL of the database to connect to, e.g. for benchmarks.
+                Takes precedence over the database chosen from the app.
+            read_only (bool): Check the schema instead of creating missing tables and
+                migrating it, so only reading the database never writes to it.
+
+        Raises:
+        ------
+            SchemaOutdatedError: If `read_only` and the schema is not up to date.
 
         """
         self.app = app
+        self.url = url
+        self.read_only = read_only
         self.settings = SettingsManager()
         self.dev_db = True
         self._init_connection()
 
     def _init_connection(self) -> None:
-        """Initializes the connection to the database."""
+        """Initializes the connection to the database.
+
+        Engines are shared between the instances connected to the same URL, so the schema
+        is only checked the first time an instance connects to a new engine.
+        """
         logger.info("Initializing database connection...")
-        if self.app is None:
-            Database.engine = create_engine("sqlite:///test_db.sqlite")
+        db_settings = self.settings.get_database_settings()
+        if self.url is not None:
+            self.engine = get_engine(self.url, db_settings)
+            self.dev_db = True
+        elif self.app is None:
+            self.engine = get_engine(DEV_DB_URL, db_settings)
             self.dev_db = True
         else:
-            Database.engine = create_engine(
-                (
-                    PROD_DB_URL
-                    if "devtools" not in self.app.features
-                    else "sqlite:///test_db.sqlite"
-                ),
+            self.engine = get_engine(
+                (PROD_DB_URL if "devtools" not in self.app.features else DEV_DB_URL),
+                db_settings,
             )
             self.dev_db = True if "devtools" in self.app.features else False
 
-            if "devtools" not in self.app.features and not Database.backup_done:
-                self._backup_database()
+        if self.engine not in Database._account_caches:
+            if self.read_only:
+                self._check_schema()
+            else:
+                # Migrations rewrite existing data, so it is backed up before they start.
+                if is_migration_pending(self.engine):
+                    self._backup_before_migration()
+
+                Base.metadata.create_all(self.engine)
+                migrate(self.engine, self.settings.get_categories())
+
+            with self.engine.connect() as conn:
+                Database._search_indexes[self.engine] = has_search_index(conn)
+
+            Database._account_caches[self.engine] = AccountCache()
+            self._bump_version(*Database._versions)
+
+        self.account_cache = Database._account_caches[self.engine]
+        self.search_index_available = Database._search_indexes[self.engine]
 
-        Base.metadata.create_all(Database.engine)
         logger.info("Connected to database successfully!")
 
+    def _check_schema(self) -> None:
+        """Raises SchemaOutdatedError if the database has tables or migrations missing."""
+        missing_tables = set(Base.metadata.tables) - set(
+            inspect(self.engine).get_table_names()
+        )
+        if missing_tables or is_migration_pending(self.engine):
+            raise SchemaOutdatedError(
+                f"The database at {self.engine.url.database} is out of date"
+            )
+
+    def close(self) -> None:
+        """Closes every connection to the database and forgets its cached accounts.
+
+        Instances created afterwards connect to a new engine.
+        """
+        Database._account_caches.pop(self.engine, None)
+        Database._search_indexes.pop(self.engine, None)
+        self.account_cache.invalidate()
+        dispose_engine(str(self.engine.url))
+
     # ======================== Backups/Reverts ========================
 
-    def _backup_database(self) -> None:
-        """Creates a backup of the current database into the backups folder"""
+    def backup_database(self) -> None:
+        """Creates a backup of the current database into the backups folder.
+
+        Uses SQLite's online backup, so the copy is consistent even if the database is
+        written while it runs. Only the first call of the session creates a backup.
+        """
+        if Database.backup_done:
+            return
 
         logger.info("Backing up database...")
         now = Arrow.now()
         db_path = os.path.join(APP_FOLDER_PATH, DB_FILE_NAME)
-        logger.debug("Production Database Path: " + db_path)
-
-        if not os.path.exists(BACKUPS_FOLDER):
-            os.makedirs(BACKUPS_FOLDER)
+        logger.debug("Production Database Path: %s", db_path)
 
         if not os.path.exists(db_path):
             logger.warning("Database file not found. Skipping backup...")
@@ -83,23 +214,54 @@ class Database:
         db_backup_filename = (
             f"budgetize-backup-{now.format('DD-MM-YYYY (HH.mm)')}.sqlite"
         )
-        logger.debug("Backup filename: " + db_backup_filename)
-
-        with open(db_path, mode="rb") as original_db:
-            with open(
-                os.path.join(BACKUPS_FOLDER, db_backup_filename),
-                mode="wb",
-            ) as backup:
-                backup.write(original_db.read())
+        logger.debug("Backup filename: %s", db_backup_filename)
+        self._write_backup(os.path.join(BACKUPS_FOLDER, db_backup_filename))
 
         Database.backup_done = True
         logger.info("Backed up database successfully!")
 
+    def _backup_before_migration(self) -> None:
+        """Backs up the database before pending migrations rewrite it.
+
+        Runs synchronously, whether or not the routine backup of the session was done.
+        Backups of the production database go to the backups folder, so they can be
+        reverted from the settings. Other databases are backed up next to their file.
+        """
+        db_path = self.engine.url.database
+        if not db_path or db_path == ":memory:":
+            return
+
+        db_path = os.path.abspath(db_path)
+        now = Arrow.now().format("DD-MM-YYYY (HH.mm.ss)")
+        if db_path == os.path.join(APP_FOLDER_PATH, DB_FILE_NAME):
+            backup_path = os.path.join(
+                BACKUPS_FOLDER, f"budgetize-backup-{now} (before migration).sqlite"
+            )
+        else:
+            backup_path = (
+                f"{os.path.splitext(db_path)[0]}-backup-{now} (before migration).sqlite"
+            )
+
+        logger.info("Migrations are pending. Backing up database to %s...", backup_path)
+        self._write_backup(backup_path)
+        logger.info("Backed up database successfully!")
+
+    def _write_backup(self, backup_path: str) -> None:
+        """Copies the database to the specified file with SQLite's online backup."""
+        os.makedirs(os.path.dirname(backup_path), exist_ok=True)
+
+        backup = sqlite3.connect(backup_path)
+        try:
+            with self.engine.connect() as conn:
+                conn.connection.dbapi_connection.backup(backup)  # type: ignore
+        finally:
+            backup.close()
+
     def revert_from_backup(self, backup_file: Path) -> bool:
         """Reverts the database to the specified backup file."""
 
         # Close connections to the current database.
-        Database.engine.dispose()
+        self.close()
 
         # Write backup file to the database file
 
@@ -109,12 +271,47 @@ class Database:
             contents = f.read()
 
         db_path = os.path.join(APP_FOLDER_PATH, DB_FILE_NAME)
+
+        # Leftovers of the write-ahead log would be replayed over the reverted database.
+        for suffix in ("-wal", "-shm"):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+
         with open(db_path, mode="wb") as f:
             f.write(contents)
 
         self._init_connection()
         return True
 
+    # ======================== CHANGE TRACKING ========================
+
+    def get_versions(self) -> dict[str, int]:
+        """Returns the current version of each table.
+
+        A version only increases, every time the table is written. If the versions did not
+        change since a screen was rendered, the data it shows is still up to date.
+
+        Returns:
+            dict[str, int]: The version of the `accounts`, `transactions`, `categories` and
+            `recurring_rules` tables.
+        """
+        with Database._versions_lock:
+            return dict(Database._versions)
+
+    def _bump_version(self, *tables: str) -> None:
+        """Increases the version of the specified tables after they have been written."""
+        with Database._versions_lock:
+            for table in tables:
+                Database._versions[table] += 1
+
+    def _notify(self, *events: DatabaseEvent) -> None:
+        """Bumps the versions of the tables changed by the events, then publishes them."""
+        for event in events:
+            self._bump_version(*event.tables)
+
+        for event in events:
+            Database.events.publish(event)
+
     # ======================== GET INFO ========================
 
     def get_transactions_from_account(self, account_id: int) -> Iterator[Transaction]:
@@ -131,10 +328,56 @@ class Database:
         """
         stmt = select(Transaction).where(Transaction.account_id == account_id)
 
-        with Session(Database.engine) as session:
+        with Session(self.engine) as session:
             for transaction in session.scalars(stmt):
                 yield transaction
 
+    def stream_transactions(
+        self,
+        account_id: Optional[int] = None,
+        year_month: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Row]:
+        """Yields the transactions with the name and currency of their account, oldest first.
+
+        Rows are fetched in batches, so any number of transactions can be exported
+        without loading them all in memory.
+
+        Args:
+        ----
+            account_id (int): Only yield the transactions of this account.
+            year_month (int): Only yield the transactions of this month, e.g. 202610.
+            batch_size (int): The number of rows fetched at a time.
+
+        Yields:
+        ------
+            Row: The `id`, `account`, `currency`, `amount_minor`, `timestamp`, `category`,
+            `description` and `visible` columns of a transaction.
+
+        """
+        stmt = (
+            select(
+                Transaction.id,
+                Account.name.label("account"),
+                Account.currency,
+                Transaction.amount_minor,
+                Transaction.timestamp,
+                Transaction.category,
+                Transaction.description,
+                Transaction.visible,
+            )
+            .join(Account, Account.id == Transaction.account_id)
+            .order_by(Transaction.epoch, Transaction.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if account_id is not None:
+            stmt = stmt.where(Transaction.account_id == account_id)
+        if year_month is not None:
+            stmt = stmt.where(Transaction.year_month == year_month)
+
+        with Session(self.engine) as session:
+            yield from session.execute(stmt)
+
     def get_monthly_transactions_from_account(
         self,
         account_id: int,
@@ -154,13 +397,13 @@ class Database:
             Transaction: A transaction from the specified account within the specified month and year.
 
         """
-        transactions = self.get_transactions_from_account(account_id)
-
-        # Filter transactions by month and year
-        for transaction in transactions:
-            date = Arrow.fromtimestamp(transaction.timestamp)
+        stmt = select(Transaction).where(
+            Transaction.account_id == account_id,
+            Transaction.year_month == int(year) * 100 + int(month),
+        )
 
-            if date.format("M") == month and date.format("YYYY") == year:
+        with Session(self.engine) as session:
+            for transaction in session.scalars(stmt):
                 yield transaction
 
     def get_accounts(self) -> Iterator[Account]:
@@ -173,8 +416,9 @@ class Database:
         """
         stmt = select(Account)
 
-        with Session(Database.engine) as session:
+        with Session(self.engine) as session:
             for account in session.scalars(stmt):
+                self.account_cache.put(account)
                 yield account
 
     def get_account_by_id(self, account_id: int) -> Account:
@@ -189,8 +433,13 @@ class Database:
             Account: The account with the specified ID.
 
         """
-        with Session(Database.engine) as session:
+        cached_account = self.account_cache.get(account_id)
+        if cached_account is not None:
+            return cached_account
+
+        with Session(self.engine) as session:
             found_account: Account = session.get_one(Account, account_id)
+            self.account_cache.put(found_account)
             return found_account
 
     def get_account_by_name(self, name: str) -> Account:
@@ -205,11 +454,26 @@ class Database:
             Account: The account with the specified name.
 
         """
-        with Session(Database.engine) as session:
+        cached_account = self.account_cache.get_by_name(name)
+        if cached_account is not None:
+            return cached_account
+
+        with Session(self.engine) as session:
             stmt = select(Account).where(Account.name == name)
-            account: Account = session.execute(stmt).scalars().first()  # type:ignore
+            account: Account = session.execute(stmt).scalars().first()  # type: ignore
+
+            if account is not None:
+                self.account_cache.put(account)
             return account
 
+    def get_account_cache_stats(self) -> dict[str, float]:
+        """Returns the hit/miss statistics of the account cache of the database.
+
+        Returns:
+            dict: The hits, misses, current size and hit rate of the cache.
+        """
+        return self.account_cache.stats()
+
     def account_name_exists(self, name: str) -> bool:
         """Returns True if an account with the specified name exists, False otherwise.
 
@@ -222,7 +486,7 @@ class Database:
             bool: True if an account with the specified name exists, False otherwise.
 
         """
-        with Session(Database.engine) as session:
+        with Session(self.engine) as session:
             stmt = select(Account).where(Account.name == name)
             account = session.execute(stmt).scalars().first()
             return account is not None
@@ -239,7 +503,7 @@ class Database:
             Transaction: The transaction with the specified ID.
 
         """
-        with Session(Database.engine) as session:
+        with Session(self.engine) as session:
             found_transaction: Transaction = session.get_one(
                 Transaction,
                 transaction_id,
@@ -252,16 +516,66 @@ class Database:
         Returns:
             list[Transaction]: A list of recent transactions.
         """
-        with Session(Database.engine) as session:
+        with Session(self.engine) as session:
             stmt = (
                 select(Transaction)
                 .where(Transaction.visible == True)
-                .order_by(Transaction.timestamp.desc())
+                .order_by(Transaction.epoch.desc(), Transaction.timestamp.desc())
                 .limit(5)
             )
             transactions: list[Transaction] = session.execute(stmt).scalars().all()  # type: ignore
             return transactions
 
+    def search_transactions(
+        self, query: str, limit: int = 20, offset: int = 0
+    ) -> list[Transaction]:
+        """Returns the transactions whose description or category match the query, best matches first.
+
+        Every word of the query must match the start of a word in the description or category.
+        If SQLite was built without FTS5, transactions are scanned and sorted by date instead.
+
+        Args:
+            query (str): The text to search for.
+            limit (int): The maximum amount of transactions to return.
+            offset (int): The amount of matching transactions to skip. Used for pagination.
+
+        Returns:
+            list[Transaction]: The matching transactions.
+        """
+        words = re.findall(r"\w+", query)
+        if not words:
+            return []
+
+        with Session(self.engine) as session:
+            if not self.search_index_available:
+                stmt = select(Transaction)
+                for word in words:
+                    # Words may contain "_", which LIKE would match as any character.
+                    stmt = stmt.where(
+                        (Transaction.description.contains(word, autoescape=True))
+                        | (Transaction.category.contains(word, autoescape=True))
+                    )
+                stmt = (
+                    stmt.order_by(Transaction.epoch.desc()).limit(limit).offset(offset)
+                )
+                return list(session.scalars(stmt))
+
+            # Quote every word so FTS5 operators typed by the user are treated as text.
+            match = " ".join(f'"{word}"*' for word in words)
+            fts_stmt = text(
+                "SELECT transactions.* FROM transactions_fts "
+                "JOIN transactions ON transactions.id = transactions_fts.rowid "
+                "WHERE transactions_fts MATCH :match "
+                "ORDER BY transactions_fts.rank, transactions.epoch DESC "
+                "LIMIT :limit OFFSET :offset"
+            )
+            return list(
+                session.scalars(
+                    select(Transaction).from_statement(fts_stmt),
+                    {"match": match, "limit": limit, "offset": offset},
+                )
+            )
+
     def get_account_balance(self, account_id: int) -> float:
         """Returns the balance of the specified account.
 
@@ -272,15 +586,64 @@ class Database:
             float: The balance of the account.
         """
 
-        stmt = select(Transaction).where(Transaction.account_id == account_id)
-        with Session(Database.engine) as session:
-            transactions = session.execute(stmt).scalars().all()
+        stmt = select(func.coalesce(func.sum(Transaction.amount_minor), 0)).where(
+            Transaction.account_id == account_id
+        )
+        with Session(self.engine) as session:
+            balance: int = session.execute(stmt).scalar_one()
+
+        return from_minor_units(balance, self.get_account_by_id(account_id).currency)
+
+    def get_account_totals(self) -> dict[int, int]:
+        """Returns the balance of every account in minor units, with a single query.
+
+        Returns:
+            dict[int, int]: The balance of each account ID. Accounts without transactions are left out.
+        """
+        stmt = select(
+            Transaction.account_id, func.sum(Transaction.amount_minor)
+        ).group_by(Transaction.account_id)
+        with Session(self.engine) as session:
+            return {
+                int(account_id): int(balance)
+                for account_id, balance in session.execute(stmt)
+                if account_id is not None
+            }
 
-            balance = 0.0
-            for transaction in transactions:
-                balance += transaction.amount
+    def get_monthly_totals(
+        self, income: bool, year_month: Optional[int] = None
+    ) -> dict[str, int]:
+        """Returns the sum of the visible incomes or expenses of a month per currency.
 
-            return balance
+        Args:
+            income (bool): If True, incomes are summed. Otherwise, expenses are summed.
+            year_month (int): The month, e.g. 202610. Defaults to the current month.
+
+        Returns:
+            dict[str, int]: The total in minor units for each account currency.
+        """
+        if year_month is None:
+            year_month = get_year_month(Arrow.now().timestamp())
+
+        stmt = (
+            select(Account.currency, func.sum(Transaction.amount_minor))
+            .join(Account, Account.id == Transaction.account_id)
+            .where(
+                Transaction.visible == True,
+                Transaction.year_month == year_month,
+                (
+                    Transaction.amount_minor > 0
+                    if income
+                    else Transaction.amount_minor < 0
+                ),
+            )
+            .group_by(Account.currency)
+        )
+
+        with Session(self.engine) as session:
+            return {
+                currency: int(total) for currency, total in session.execute(stmt).all()
+            }
 
     async def get_monthly_income(self) -> float:
         """(Coroutine) Returns the total income for the current month.
@@ -288,19 +651,7 @@ class Database:
         Returns:
             float: The total income for the current month.
         """
-        now = Arrow.now()
-
-        income = 0.0
-        for account in self.get_accounts():
-            for transaction in self.get_monthly_transactions_from_account(
-                account.id, now.format("M"), now.format("YYYY")
-            ):
-                if transaction.amount > 0 and transaction.visible:
-                    income += await self.get_amount_in_base_currency(
-                        amount=transaction.amount, currency=account.currency
-                    )
-
-        return round(income, 2)
+        return await self.get_totals_in_base_currency(self.get_monthly_totals(True))
 
     async def get_monthly_expense(self) -> float:
         """(Coroutine) Returns the total expenses for the current month.
@@ -308,19 +659,17 @@ class Database:
         Returns:
             float: The total expenses for the current month.
         """
-        now = Arrow.now()
+        return await self.get_totals_in_base_currency(self.get_monthly_totals(False))
 
-        expense = 0.0
-        for account in self.get_accounts():
-            for transaction in self.get_monthly_transactions_from_account(
-                account.id, now.format("M"), now.format("YYYY")
-            ):
-                if transaction.amount < 0 and transaction.visible:
-                    expense += await self.get_amount_in_base_currency(
-                        amount=transaction.amount, currency=account.currency
-                    )
+    async def get_totals_in_base_currency(self, totals: dict[str, int]) -> float:
+        """(Coroutine) Converts totals in minor units per currency to a single amount in the base currency."""
 
-        return round(expense, 2)
+        amount = 0.0
+        for currency, total in totals.items():
+            amount += await self.get_amount_in_base_currency(
+                amount=from_minor_units(total, currency), currency=currency
+            )
+        return amount
 
     async def get_amount_in_base_currency(self, amount: float, currency: str) -> float:
         """(Coroutine) Returns the amount in the base currency.
@@ -340,6 +689,26 @@ class Database:
         ).get_exchange(currency)
         return amount / exchange_rate
 
+    async def get_exchange_rates(self, currencies: Iterable[str]) -> dict[str, float]:
+        """(Coroutine) Returns the units of each currency per unit of the base currency.
+
+        Args:
+            currencies (Iterable[str]): The currencies to look up.
+
+        Returns:
+            dict[str, float]: The exchange rate of each currency, 1.0 for the base currency.
+        """
+        base_currency = self.settings.get_base_currency()
+        manager = CurrencyManager(base_currency)
+        return {
+            currency: (
+                1.0
+                if currency == base_currency
+                else await manager.get_exchange(currency)
+            )
+            for currency in set(currencies)
+        }
+
     def get_db_as_dict(self) -> dict[int, dict]:
         """Returns the database as a dictionary.
 
@@ -379,7 +748,9 @@ class Database:
 
             for transaction in self.get_transactions_from_account(account.id):
                 d[account.id]["transactions"][transaction.id] = {
-                    "amount": transaction.amount,
+                    "amount": from_minor_units(
+                        transaction.amount_minor, account.currency
+                    ),
                     "description": transaction.description,
                     "category": transaction.category,
                     "timestamp": transaction.timestamp,
@@ -391,30 +762,416 @@ class Database:
     def populate_from_dict(self, data: dict[str, dict]) -> None:
         """Populates the database from a dictionary.
 
+        Accounts that already exist are reused and transactions already in the ledger are
+        skipped, so importing the same file twice does not duplicate anything.
+
         Args:
         ----
             data (dict): The dictionary to populate the database from.
 
         """
         for account_id, account_data in data.items():
-            self._add_account(
+            target_id = self._get_or_add_account(
                 id=int(account_id),
                 name=account_data["name"],
                 currency=account_data["currency"],
             )
 
-            for transaction_id, transaction_data in account_data[
-                "transactions"
-            ].items():
-                self.add_transaction(
-                    account_id=int(account_id),
-                    amount=transaction_data["amount"],
-                    description=transaction_data["description"],
-                    category=transaction_data["category"],
-                    timestamp=transaction_data["timestamp"],
-                    visible=transaction_data["visible"],
+            self.bulk_add_transactions(
+                (
+                    {**transaction_data, "account_id": target_id}
+                    for transaction_data in account_data["transactions"].values()
+                ),
+                on_duplicate="skip",
+            )
+
+    # ======================== CATEGORIES ========================
+
+    def get_categories(self) -> list[str]:
+        """Returns the names of the categories the user can pick, in creation order.
+
+        Returns:
+            list[str]: The names of the active categories.
+        """
+        stmt = (
+            select(Category.name).where(Category.active == True).order_by(Category.id)
+        )
+
+        with Session(self.engine) as session:
+            return list(session.scalars(stmt))
+
+    def get_category_ids(self) -> dict[str, int]:
+        """Returns the ID of every category, including inactive ones, by name.
+
+        Returns:
+            dict[str, int]: The IDs of the categories.
+        """
+        with Session(self.engine) as session:
+            return {
+                name: category_id
+                for category_id, name in session.execute(
+                    select(Category.id, Category.name)
+                )
+            }
+
+    def add_category(self, name: str) -> None:
+        """Adds a category the user can pick. Reactivates it if it already exists.
+
+        Args:
+            name (str): The name of the category.
+        """
+        with Session(self.engine) as session:
+            category = session.scalars(
+                select(Category).where(Category.name == name)
+            ).first()
+
+            if category is None:
+                session.add(Category(name=name, active=True))
+            else:
+                category.active = True
+
+            session.commit()
+
+        self._notify(CategoriesChanged([name]))
+
+    def delete_category(self, name: str) -> None:
+        """Stops offering the specified category to the user.
+
+        The category is kept so its transactions can still be grouped by it.
+
+        Args:
+            name (str): The name of the category.
+        """
+        with Session(self.engine) as session:
+            session.execute(
+                update(Category).values(active=False).where(Category.name == name)
+            )
+            session.commit()
+
+        self._notify(CategoriesChanged([name]))
+
+    def _get_category_id(
+        self, session: Session, name: str, new_categories: list[str]
+    ) -> Optional[int]:
+        """Returns the ID of the category with the specified name.
+
+        Categories that do not exist are added inactive to the session, so they are not
+        offered to the user, and their name is appended to `new_categories` so the caller
+        can notify them once the session is committed.
+
+        Args:
+            session (Session): The session that writes the transaction.
+            name (str): The name of the category.
+            new_categories (list[str]): The names of the categories added so far.
+
+        Returns:
+            Optional[int]: The ID of the category. None if the name is empty.
+        """
+        if not name:
+            return None
+
+        category_id = session.scalars(
+            select(Category.id).where(Category.name == name)
+        ).first()
+
+        if category_id is None:
+            category = Category(name=name, active=False)
+            session.add(category)
+            session.flush()
+            category_id = category.id
+            new_categories.append(name)
+
+        return category_id
+
+    async def get_monthly_expenses_by_category(self) -> dict[int, float]:
+        """(Coroutine) Returns the visible expenses of the current month grouped by category.
+
+        Returns:
+            dict[int, float]: The expenses in the base currency by category ID. Expenses are positive.
+        """
+        return await self.get_category_totals_in_base_currency(
+            self.get_monthly_category_totals()
+        )
+
+    def get_monthly_category_totals(
+        self, year_month: Optional[int] = None
+    ) -> list[tuple[int, str, int]]:
+        """Returns the sum of the visible expenses of a month per category and currency.
+
+        Args:
+            year_month (int): The month, e.g. 202610. Defaults to the current month.
+
+        Returns:
+            list[tuple[int, str, int]]: The category ID, account currency and total in minor units.
+        """
+        if year_month is None:
+            year_month = get_year_month(Arrow.now().timestamp())
+
+        stmt = (
+            select(
+                Transaction.category_id,
+                Account.currency,
+                func.sum(Transaction.amount_minor),
+            )
+            .join(Account, Account.id == Transaction.account_id)
+            .where(
+                Transaction.visible == True,
+                Transaction.amount_minor < 0,
+                Transaction.category_id.is_not(None),
+                Transaction.year_month == year_month,
+            )
+            .group_by(Transaction.category_id, Account.currency)
+        )
+
+        with Session(self.engine) as session:
+            return [
+                (category_id, currency, int(total))
+                for category_id, currency, total in session.execute(stmt).all()
+                if category_id is not None
+            ]
+
+    async def get_category_totals_in_base_currency(
+        self, totals: list[tuple[int, str, int]]
+    ) -> dict[int, float]:
+        """(Coroutine) Converts expense totals per category and currency to positive amounts in the base currency."""
+
+        expenses: dict[int, float] = {}
+        for category_id, currency, total in totals:
+            expense = await self.get_amount_in_base_currency(
+                amount=from_minor_units(total, currency), currency=currency
+            )
+            expenses[category_id] = expenses.get(category_id, 0.0) - expense
+
+        return expenses
+
+    # ======================== REPORTS ========================
+
+    def get_period_report_cells(
+        self,
+        kind: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        account_ids: Optional[Iterable[int]] = None,
+    ) -> list[tuple[int, int, int, int]]:
+        """Returns the visible totals of each month, category and account.
+
+        SQLite sums the transactions over `ix_transactions_period_report`, which covers the
+        query, so the reports read a row per cell instead of a row per transaction.
+
+        Args:
+            kind (str): One of `REPORT_KINDS`. Expenses are summed as negative amounts.
+            start (int): The first month, e.g. 201701. Defaults to the first transaction.
+            end (int): The last month, included, e.g. 202612. Defaults to the last transaction.
+            account_ids (Iterable[int]): Only sum the transactions of these accounts.
+
+        Returns:
+            list[tuple[int, int, int, int]]: The month, category ID (0 for transactions
+            without a category), account ID and total in minor units of every cell.
+        """
+        if kind not in REPORT_KINDS:
+            raise ValueError(f"Unknown report kind '{kind}'")
+
+        stmt = (
+            select(
+                Transaction.year_month,
+                Transaction.category_id,
+                Transaction.account_id,
+                func.sum(Transaction.amount_minor),
+            )
+            .where(Transaction.visible == True)
+            .group_by(
+                Transaction.year_month, Transaction.category_id, Transaction.account_id
+            )
+        )
+        if kind == "expenses":
+            stmt = stmt.where(Transaction.amount_minor < 0)
+        elif kind == "income":
+            stmt = stmt.where(Transaction.amount_minor > 0)
+        if start is not None:
+            stmt = stmt.where(Transaction.year_month >= start)
+        if end is not None:
+            stmt = stmt.where(Transaction.year_month <= end)
+        if account_ids is not None:
+            stmt = stmt.where(Transaction.account_id.in_(list(account_ids)))
+
+        with Session(self.engine) as session:
+            return [
+                (year_month, category_id or 0, int(account_id), int(total))
+                for year_month, category_id, account_id, total in session.execute(stmt)
+                if account_id is not None
+            ]
+
+    # ======================== RECURRING RULES ========================
+
+    def get_recurring_rules(self) -> list[RecurringRule]:
+        """Returns every recurring rule, the next due first.
+
+        Returns:
+            list[RecurringRule]: The active and ended rules.
+        """
+        stmt = select(RecurringRule).order_by(
+            RecurringRule.active.desc(), RecurringRule.next_due, RecurringRule.id
+        )
+
+        with Session(self.engine) as session:
+            return list(session.scalars(stmt))
+
+    def add_recurring_rule(
+        self,
+        account_id: int,
+        amount: float,
+        description: str,
+        category: str,
+        unit: str,
+        start: float,
+        every: int = 1,
+        end: Optional[float] = None,
+    ) -> int:
+        """Adds a rule that creates a transaction every interval, starting at `start`.
+
+        Occurrences that are already due are added the next time
+        `materialize_due_transactions` runs.
+
+        Args:
+            account_id (int): The ID of the account of the transactions.
+            amount (float): The amount of each transaction.
+            description (str): The description of each transaction.
+            category (str): The category of each transaction.
+            unit (str): "day", "week", "month" or "year".
+            start (float): The timestamp of the first transaction.
+            every (int): The number of units between transactions.
+            end (float): No transaction is created after this timestamp. None repeats forever.
+
+        Returns:
+            int: The ID of the rule.
+
+        Raises:
+            ValueError: If the interval is not valid.
+        """
+        if unit not in RECURRENCE_UNITS or every < 1:
+            raise ValueError(
+                f"Invalid interval: every {every} {unit}, expected a unit in {RECURRENCE_UNITS}"
+            )
+
+        rule = RecurringRule(
+            account_id=account_id,
+            amount=amount,
+            description=description,
+            category=category,
+            unit=unit,
+            every=every,
+            start=start,
+            end=end,
+            occurrences=0,
+            next_due=int(start),
+            active=end is None or start <= end,
+        )
+
+        with Session(self.engine) as session:
+            session.add(rule)
+            session.commit()
+            rule_id = rule.id
+
+        logger.info("Added recurring rule #%s (every %s %s)", rule_id, every, unit)
+        self._notify(RecurringRulesChanged([rule_id]))
+        return rule_id
+
+    def delete_recurring_rule(self, rule_id: int) -> None:
+        """Deletes a recurring rule. The transactions it created are kept.
+
+        Args:
+            rule_id (int): The ID of the rule.
+        """
+        with Session(self.engine) as session:
+            session.execute(delete(RecurringRule).where(RecurringRule.id == rule_id))
+            session.commit()
+
+        self._notify(RecurringRulesChanged([rule_id]))
+
+    def materialize_due_transactions(self, now: Optional[float] = None) -> int:
+        """Adds every occurrence of the recurring rules that became due since the last run.
+
+        Only the due rules are read, through the index of `next_due`, so the cost depends
+        on the occurrences to add rather than on the number of rules. All of them are
+        inserted in one batch.
+
+        The transactions are inserted before the rules are advanced. If the rules could
+        not be advanced, the next run finds the same transactions by their fingerprint
+        and skips them.
+
+        Args:
+            now (float): The timestamp up to which occurrences are due. Defaults to now.
+
+        Returns:
+            int: The number of transactions added.
+        """
+        if now is None:
+            now = Arrow.now().timestamp()
+
+        stmt = select(RecurringRule).where(
+            RecurringRule.active == True, RecurringRule.next_due <= now
+        )
+
+        transactions: list[dict] = []
+        updates: list[dict] = []
+        with Session(self.engine) as session:
+            for rule in session.scalars(stmt):
+                occurrence = rule.occurrences
+                timestamp = get_occurrence(
+                    rule.start, rule.unit, rule.every, occurrence
+                )
+                while timestamp <= now and (rule.end is None or timestamp <= rule.end):
+                    transactions.append(
+                        {
+                            "account_id": rule.account_id,
+                            "amount": rule.amount,
+                            "description": rule.description,
+                            "category": rule.category,
+                            "timestamp": timestamp,
+                        }
+                    )
+                    occurrence += 1
+                    timestamp = get_occurrence(
+                        rule.start, rule.unit, rule.every, occurrence
+                    )
+
+                updates.append(
+                    {
+                        "rule_id": rule.id,
+                        "new_occurrences": occurrence,
+                        "new_next_due": int(timestamp),
+                        "new_active": rule.end is None or timestamp <= rule.end,
+                    }
                 )
 
+        if not updates:
+            return 0
+
+        added = self.bulk_add_transactions(transactions, on_duplicate="skip")
+
+        table = RecurringRule.__table__
+        with Session(self.engine) as session:
+            session.connection().execute(
+                update(table)  # type: ignore
+                .where(table.c.id == bindparam("rule_id"))
+                .values(
+                    occurrences=bindparam("new_occurrences"),
+                    next_due=bindparam("new_next_due"),
+                    active=bindparam("new_active"),
+                ),
+                updates,
+            )
+            session.commit()
+
+        logger.info(
+            "Materialized %s occurrences of %s recurring rules (%s already added)",
+            len(transactions),
+            len(updates),
+            added["skipped"],
+        )
+        self._notify(RecurringRulesChanged(update["rule_id"] for update in updates))
+        return added["added"]
+
     # ======================== ADD/UPDATE INFO ========================
 
     def add_account(
@@ -433,22 +1190,38 @@ class Database:
             account_type_name (str): The type of the account.
 
         """
-        with Session(Database.engine) as session:
+        with Session(self.engine) as session:
             new_account = Account(name=name, currency=currency)
             session.add(new_account)
             session.commit()
 
+            # The initial balance is left without a category.
+            values = self._get_derived_values(
+                session, currency, starting_balance, Arrow.now().timestamp(), "", []
+            )
             initial_balance_transaction = Transaction(
                 account_id=new_account.id,
-                amount=starting_balance,
                 description="Initial balance",
-                category="-",
-                timestamp=Arrow.now().timestamp(),
                 visible=False,
+                fingerprint=self._allocate_fingerprint(
+                    session, new_account.id, values, "Initial balance"
+                ),
+                **values,
             )
             session.add(initial_balance_transaction)
             session.commit()
 
+            self.account_cache.invalidate(new_account.id)
+
+            self._notify(
+                AccountsChanged([new_account.id]),
+                TransactionsChanged(
+                    [initial_balance_transaction.id],
+                    [new_account.id],
+                    [initial_balance_transaction.year_month],
+                ),
+            )
+
     def _add_account(self, id: int, name: str, currency: str) -> None:
         """Adds a new account to the user.
         This function is used to populate the DB when importing data.
@@ -462,11 +1235,58 @@ class Database:
             account_type_name (str): The type of the account.
 
         """
-        with Session(Database.engine) as session:
+        with Session(self.engine) as session:
             new_account = Account(id=id, name=name, currency=currency)
             session.add(new_account)
             session.commit()
 
+        self.account_cache.invalidate(id)
+        self._notify(AccountsChanged([id]))
+
+    def _get_or_add_account(self, id: int, name: str, currency: str) -> int:
+        """Returns the ID of an existing account with the name and currency, adding it if missing.
+        This function is used to populate the DB when importing data.
+
+        Args:
+        ----
+            id (int): The ID of the account in the imported data. Kept if it is free.
+            name (str): The name of the account.
+            currency (str): The currency of the account.
+
+        Returns:
+        -------
+            int: The ID of the account in this database.
+
+        """
+        with Session(self.engine) as session:
+            account = session.get(Account, id)
+            if account is not None and (account.name, account.currency) == (
+                name,
+                currency,
+            ):
+                return id
+
+            same_account = session.scalars(
+                select(Account.id)
+                .where(Account.name == name, Account.currency == currency)
+                .order_by(Account.id)
+            ).first()
+            if same_account is not None:
+                return same_account
+
+            # The ID belongs to another account, a new one is picked.
+            new_account = Account(
+                id=id if account is None else None, name=name, currency=currency
+            )
+            session.add(new_account)
+            session.commit()
+            new_id = new_account.id
+
+        logger.info("Added account #%s (#%s in the imported data)", new_id, id)
+        self.account_cache.invalidate(new_id)
+        self._notify(AccountsChanged([new_id]))
+        return new_id
+
     def add_transaction(
         self,
         account_id: int,
@@ -487,19 +1307,249 @@ class Database:
             timestamp (float): The timestamp of the transaction.
 
         """
-        transaction = Transaction(
-            account_id=account_id,
-            amount=amount,
-            description=description,
-            category=category,
-            timestamp=timestamp,
-            visible=visible,
-        )
+        currency = self.get_account_by_id(account_id).currency
+        new_categories: list[str] = []
 
-        with Session(Database.engine) as session:
+        with Session(self.engine) as session:
+            values = self._get_derived_values(
+                session, currency, amount, timestamp, category, new_categories
+            )
+            transaction = Transaction(
+                account_id=account_id,
+                description=description,
+                visible=visible,
+                fingerprint=self._allocate_fingerprint(
+                    session, account_id, values, description
+                ),
+                **values,
+            )
             session.add(transaction)
             session.commit()
 
+            events: list[DatabaseEvent] = []
+            if new_categories:
+                events.append(CategoriesChanged(new_categories))
+            events.append(
+                TransactionsChanged(
+                    [transaction.id], [account_id], [transaction.year_month]
+                )
+            )
+            self._notify(*events)
+
+    def bulk_add_transactions(
+        self,
+        transactions: Iterable[dict],
+        batch_size: int = 5000,
+        on_duplicate: str = "insert",
+    ) -> dict[str, int]:
+        """Registers many transactions at once, e.g. when importing data.
+
+        The currencies of the accounts and the IDs of the categories are queried once, and
+        every batch of transactions is inserted with a single statement in one DB transaction.
+
+        Duplicates are detected by fingerprint (see `budgetize.db.fingerprint`): the n-th
+        transaction of the import with the same account, day, amount and description
+        matches the n-th one in the ledger. Each batch is checked with a few lookups of
+        the unique index of fingerprints, so the history is never scanned.
+
+        Args:
+        ----
+            transactions (Iterable[dict]): The transactions, with the arguments of
+                `add_transaction`: `account_id`, `amount`, `description`, `category`,
+                `timestamp` and optionally `visible`.
+            batch_size (int): The number of transactions inserted per statement.
+            on_duplicate (str): What to do with the transactions already in the ledger.
+                "insert" adds them anyway, "skip" ignores them and "merge" updates the
+                description, category, exact time and visibility of the existing ones.
+
+        Returns:
+        -------
+            dict[str, int]: The number of transactions `added`, `skipped` and `merged`.
+
+        """
+        if on_duplicate not in DUPLICATE_MODES:
+            raise ValueError(
+                f"Invalid duplicate mode {on_duplicate!r}, expected one of {DUPLICATE_MODES}"
+            )
+
+        transaction_ids: list[int] = []
+        merged_ids: list[int] = []
+        skipped = 0
+        account_ids: set[int] = set()
+        year_months: set[int] = set()
+        new_categories: list[str] = []
+
+        # Occurrences of each fingerprint hash so far, to match the n-th one in the ledger.
+        occurrences: dict[str, int] = {}
+
+        with Session(self.engine) as session:
+            currencies = dict(
+                session.execute(select(Account.id, Account.currency)).tuples().all()
+            )
+            category_ids: dict[str, int] = dict(
+                session.execute(select(Category.name, Category.id)).tuples().all()
+            )
+
+            iterator = iter(transactions)
+            while batch := list(islice(iterator, batch_size)):
+                # Categories that do not exist are created inactive, like in `_get_category_id`.
+                missing = {
+                    transaction["category"]
+                    for transaction in batch
+                    if transaction["category"]
+                    and transaction["category"] not in category_ids
+                }
+                if missing:
+                    categories = [
+                        Category(name=name, active=False) for name in sorted(missing)
+                    ]
+                    session.add_all(categories)
+                    session.flush()
+                    category_ids.update(
+                        (category.name, category.id) for category in categories
+                    )
+                    new_categories.extend(missing)
+
+                values = []
+                hashes = []
+                for transaction in batch:
+                    account_id = int(transaction["account_id"])
+                    currency = currencies[account_id]
+                    amount_minor = to_minor_units(transaction["amount"], currency)
+                    timestamp = transaction["timestamp"]
+
+                    values.append(
+                        {
+                            "account_id": account_id,
+                            "description": transaction["description"],
+                            "visible": transaction.get("visible", True),
+                            "amount": from_minor_units(amount_minor, currency),
+                            "amount_minor": amount_minor,
+                            "timestamp": timestamp,
+                            "epoch": int(timestamp),
+                            "year_month": get_year_month(timestamp),
+                            "category": transaction["category"],
+                            "category_id": category_ids.get(transaction["category"]),
+                        }
+                    )
+                    hashes.append(
+                        get_fingerprint_hash(
+                            account_id,
+                            timestamp,
+                            amount_minor,
+                            transaction["description"],
+                        )
+                    )
+
+                connection = session.connection()
+                if on_duplicate == "insert":
+                    for value, fingerprint in zip(
+                        values, allocate_fingerprints(connection, hashes)
+                    ):
+                        value["fingerprint"] = fingerprint
+                else:
+                    for value, fingerprint_hash in zip(values, hashes):
+                        ordinal = occurrences.get(fingerprint_hash, 0)
+                        occurrences[fingerprint_hash] = ordinal + 1
+                        value["fingerprint"] = make_fingerprint(
+                            fingerprint_hash, ordinal
+                        )
+
+                    existing = find_fingerprints(
+                        connection, [value["fingerprint"] for value in values]
+                    )
+                    duplicates = [
+                        value for value in values if value["fingerprint"] in existing
+                    ]
+                    values = [
+                        value
+                        for value in values
+                        if value["fingerprint"] not in existing
+                    ]
+
+                    if on_duplicate == "skip":
+                        skipped += len(duplicates)
+                    elif duplicates:
+                        merged_ids.extend(
+                            self._merge_duplicates(connection, duplicates, existing)
+                        )
+                        account_ids.update(value["account_id"] for value in duplicates)
+                        year_months.update(value["year_month"] for value in duplicates)
+
+                if not values:
+                    continue
+
+                # A Core insert skips the ORM bookkeeping, which dominates with many rows.
+                table = Transaction.__table__
+                transaction_ids.extend(
+                    connection.execute(
+                        insert(table).returning(table.c.id), values  # type: ignore
+                    ).scalars()
+                )
+                account_ids.update(value["account_id"] for value in values)
+                year_months.update(value["year_month"] for value in values)
+
+            session.commit()
+
+        logger.info(
+            "Added %s transactions in bulk (%s duplicates skipped, %s merged)",
+            len(transaction_ids),
+            skipped,
+            len(merged_ids),
+        )
+
+        events: list[DatabaseEvent] = []
+        if new_categories:
+            events.append(CategoriesChanged(new_categories))
+        if transaction_ids or merged_ids:
+            events.append(
+                TransactionsChanged(
+                    transaction_ids + merged_ids, account_ids, year_months
+                )
+            )
+        self._notify(*events)
+
+        return {
+            "added": len(transaction_ids),
+            "skipped": skipped,
+            "merged": len(merged_ids),
+        }
+
+    def _merge_duplicates(
+        self, connection: Connection, duplicates: list[dict], existing: dict[str, int]
+    ) -> list[int]:
+        """Updates the transactions matched by imported duplicates with their values.
+
+        The category is only replaced by imported transactions that have one.
+
+        Returns:
+        -------
+            list[int]: The IDs of the updated transactions.
+
+        """
+        table = Transaction.__table__
+        columns = ("description", "timestamp", "epoch", "visible")
+        ids = [existing[value["fingerprint"]] for value in duplicates]
+        for with_category in (True, False):
+            names = columns + (("category", "category_id") if with_category else ())
+            params = [
+                {
+                    "merged_id": transaction_id,
+                    **{f"new_{name}": value[name] for name in names},
+                }
+                for transaction_id, value in zip(ids, duplicates)
+                if bool(value["category"]) == with_category
+            ]
+            if params:
+                connection.execute(
+                    update(table)  # type: ignore
+                    .where(table.c.id == bindparam("merged_id"))
+                    .values({name: bindparam(f"new_{name}") for name in names}),
+                    params,
+                )
+
+        return ids
+
     def update_transaction(
         self,
         transaction_id: int,
@@ -521,16 +1571,34 @@ class Database:
             timestamp (float): The new timestamp of the transaction.
 
         """
-        values = {
-            "account_id": account_id,
-            "amount": amount,
-            "description": description,
-            "category": category,
-            "timestamp": timestamp,
-        }
+        currency = self.get_account_by_id(account_id).currency
+        new_categories: list[str] = []
+
+        logger.info("Updating transaction #%s", transaction_id)
+        with Session(self.engine) as session:
+            values = {
+                "account_id": account_id,
+                "description": description,
+                **self._get_derived_values(
+                    session, currency, amount, timestamp, category, new_categories
+                ),
+            }
+            logger.debug("New values of transaction #%s: %s", transaction_id, values)
+            previous = session.execute(
+                select(
+                    Transaction.account_id,
+                    Transaction.year_month,
+                    Transaction.fingerprint,
+                ).where(Transaction.id == transaction_id)
+            ).first()
+            values["fingerprint"] = self._allocate_fingerprint(
+                session,
+                account_id,
+                values,
+                description,
+                previous.fingerprint if previous is not None else None,
+            )
 
-        logger.info(f"Updating transaction with values: {values}")
-        with Session(Database.engine) as session:
             upd = (
                 update(Transaction)
                 .values(values)
@@ -539,6 +1607,87 @@ class Database:
             session.execute(upd)
             session.commit()
 
+        account_ids = {account_id}
+        year_months = {values["year_month"]}
+        if previous is not None and previous.account_id is not None:
+            account_ids.add(int(previous.account_id))
+            year_months.add(previous.year_month)
+
+        events: list[DatabaseEvent] = []
+        if new_categories:
+            events.append(CategoriesChanged(new_categories))
+        events.append(TransactionsChanged([transaction_id], account_ids, year_months))
+        self._notify(*events)
+
+    def _allocate_fingerprint(
+        self,
+        session: Session,
+        account_id: int,
+        values: dict,
+        description: str,
+        current: Optional[str] = None,
+    ) -> str:
+        """Returns a fingerprint for a transaction that no other transaction has.
+
+        Args:
+        ----
+            session (Session): The session that writes the transaction.
+            account_id (int): The ID of the account of the transaction.
+            values (dict): The values returned by `_get_derived_values`.
+            description (str): The description of the transaction.
+            current (str): The fingerprint of the transaction being updated. Kept if the
+                fields it covers did not change.
+
+        Returns:
+        -------
+            str: The fingerprint.
+
+        """
+        fingerprint_hash = get_fingerprint_hash(
+            account_id, values["timestamp"], values["amount_minor"], description
+        )
+        if current is not None and current.rsplit(":", 1)[0] == fingerprint_hash:
+            return current
+
+        return allocate_fingerprints(session.connection(), [fingerprint_hash])[0]
+
+    def _get_derived_values(
+        self,
+        session: Session,
+        currency: str,
+        amount: float,
+        timestamp: float,
+        category: str,
+        new_categories: list[str],
+    ) -> dict:
+        """Returns the amount, timestamp and category columns of a transaction, including the derived ones.
+
+        Args:
+        ----
+            session (Session): The session that writes the transaction.
+            currency (str): The currency of the transaction's account.
+            amount (float): The amount of the transaction. May be a string coming from an input.
+            timestamp (float): The timestamp of the transaction.
+            category (str): The name of the category of the transaction.
+            new_categories (list[str]): Collects the categories added by `_get_category_id`.
+
+        Returns:
+        -------
+            dict: The `amount`, `amount_minor`, `timestamp`, `epoch`, `year_month`,
+            `category` and `category_id` values.
+
+        """
+        amount_minor = to_minor_units(amount, currency)
+        return {
+            "amount": from_minor_units(amount_minor, currency),
+            "amount_minor": amount_minor,
+            "timestamp": timestamp,
+            "epoch": int(timestamp),
+            "year_month": get_year_month(timestamp),
+            "category": category,
+            "category_id": self._get_category_id(session, category, new_categories),
+        }
+
     def delete_account(self, account_id: int) -> None:
         """Deletes the specified account from the database.
 
@@ -549,7 +1698,7 @@ class Database:
         """
         stmt = select(Account).where(Account.id == account_id)
 
-        with Session(Database.engine) as session:
+        with Session(self.engine) as session:
             res = session.execute(stmt)
 
             row = res.fetchone()
@@ -565,12 +1714,35 @@ class Database:
             )
             transaction_rows = session.execute(transaction_stmt).fetchall()
 
+            transaction_ids = []
+            year_months = set()
             for transaction in transaction_rows:
                 transaction_obj = transaction.tuple()[0]
+                transaction_ids.append(transaction_obj.id)
+                year_months.add(transaction_obj.year_month)
                 session.delete(transaction_obj)
 
+            rule_ids = list(
+                session.scalars(
+                    delete(RecurringRule)
+                    .where(RecurringRule.account_id == account_id)
+                    .returning(RecurringRule.id)
+                )
+            )
+
             session.commit()
 
+        self.account_cache.invalidate(account_id)
+        events: list[DatabaseEvent] = [
+            AccountsChanged([account_id], deleted=True),
+            TransactionsChanged(
+                transaction_ids, [account_id], year_months, deleted=True
+            ),
+        ]
+        if rule_ids:
+            events.append(RecurringRulesChanged(rule_ids))
+        self._notify(*events)
+
     def delete_transaction(self, transaction_id: int) -> Transaction:
         """Deletes the specified transaction from the DB and returns it.
 
@@ -581,11 +1753,23 @@ class Database:
             Transaction: The deleted transaction.
         """
         stmt = select(Transaction).where(Transaction.id == transaction_id)
-        with Session(Database.engine) as session:
+        with Session(self.engine) as session:
             res = session.execute(stmt)
             row = res.fetchone()
 
             selected_transaction: Transaction = row.tuple()[0]  # type: ignore
+            event = TransactionsChanged(
+                [selected_transaction.id],
+                (
+                    [int(selected_transaction.account_id)]
+                    if selected_transaction.account_id is not None
+                    else []
+                ),
+                [selected_transaction.year_month],
+                deleted=True,
+            )
             session.delete(selected_transaction)
             session.commit()
-            return selected_transaction
+
+        self._notify(event)
+        return selected_transaction
@@ -0,0 +1,130 @@
+"""Factory of the SQLAlchemy engines shared by every Database instance.
+
+Every screen creates its own `Database`, so engines (and their connection pools) are
+created once per database URL and reused for the rest of the session.
+"""
+
+import logging
+from typing import Any, Optional
+
+from sqlalchemy import Engine, create_engine, event
+
+from budgetize.consts import DEFAULT_DATABASE_SETTINGS
+from budgetize.db.slow_queries import SlowQueryLog
+
+logger = logging.getLogger(__name__)
+
+_engines: dict[str, Engine] = {}
+
+# Values accepted for the pragmas taken from the settings. PRAGMA statements cannot bind
+# parameters, so the values are formatted into the SQL and must be checked first.
+_PRAGMA_CHOICES = {
+    "journal_mode": ("WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "OFF"),
+    "synchronous": ("OFF", "NORMAL", "FULL", "EXTRA"),
+}
+_INTEGER_PRAGMAS = ("mmap_size", "cache_size")
+
+
+def get_engine(url: str, settings: Optional[dict] = None) -> Engine:
+    """Returns the shared engine for the specified database URL, creating it on first use.
+
+    Args:
+    ----
+        url (str): The SQLAlchemy URL of the database.
+        settings (dict): Overrides for `budgetize.consts.DEFAULT_DATABASE_SETTINGS`.
+            Only used when the engine is created.
+
+    Returns:
+    -------
+        Engine: The engine connected to the database.
+
+    """
+    engine = _engines.get(url)
+    if engine is not None:
+        return engine
+
+    db_settings = {**DEFAULT_DATABASE_SETTINGS, **(settings or {})}
+    logger.info("Creating engine for %s with settings %s", url, db_settings)
+
+    engine = create_engine(
+        url,
+        query_cache_size=db_settings["query_cache_size"],
+        connect_args={
+            "cached_statements": db_settings["statement_cache_size"],
+            "check_same_thread": False,
+        },
+    )
+    event.listen(engine, "connect", _pragmas_listener(db_settings))
+    if db_settings["slow_query_ms"] is not None:
+        SlowQueryLog(db_settings["slow_query_ms"]).attach(engine)
+
+    _engines[url] = engine
+    return engine
+
+
+def dispose_engine(url: str) -> None:
+    """Closes every connection of the engine for the specified URL and forgets it.
+
+    The next call to `get_engine` creates a brand new engine.
+    """
+    engine = _engines.pop(url, None)
+    if engine is not None:
+        engine.dispose()
+
+
+def get_pragmas(db_settings: dict) -> dict:
+    """Returns the pragmas set on every connection, with the defaults for invalid values.
+
+    Args:
+    ----
+        db_settings (dict): The database settings, see `budgetize.consts.DEFAULT_DATABASE_SETTINGS`.
+
+    Returns:
+    -------
+        dict: The value of each pragma, safe to format into a PRAGMA statement.
+
+    """
+    pragmas: dict[str, Any] = {}
+    for pragma, choices in _PRAGMA_CHOICES.items():
+        value = db_settings[pragma]
+        if isinstance(value, str) and value.upper() in choices:
+            pragmas[pragma] = value.upper()
+        else:
+            pragmas[pragma] = DEFAULT_DATABASE_SETTINGS[pragma]
+            logger.warning(
+                "Invalid database setting %s=%r, expected one of %s. Using %s instead",
+                pragma,
+                value,
+                ", ".join(choices),
+                pragmas[pragma],
+            )
+
+    for pragma in _INTEGER_PRAGMAS:
+        value = db_settings[pragma]
+        # bool is a subclass of int, but true/false are no sizes.
+        if isinstance(value, int) and not isinstance(value, bool):
+            pragmas[pragma] = value
+        else:
+            pragmas[pragma] = DEFAULT_DATABASE_SETTINGS[pragma]
+            logger.warning(
+                "Invalid database setting %s=%r, expected an integer. Using %s instead",
+                pragma,
+                value,
+                pragmas[pragma],
+            )
+
+    return pragmas
+
+
+def _pragmas_listener(db_settings: dict) -> Any:
+    """Returns a `connect` event listener that applies the performance pragmas to new connections."""
+
+    pragmas = get_pragmas(db_settings)
+
+    def set_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma, value in pragmas.items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+        cursor.close()
+
+    return set_pragmas
@@ -0,0 +1,153 @@
+"""Defines the change events published by the Database class after every write.
+
+Screens subscribe to the events they care about instead of re-querying everything
+when they are resumed.
+"""
+
+import logging
+from threading import RLock
+from typing import Callable, Iterable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseEvent:
+    """Base class of every change event."""
+
+    # The tables whose version is increased by the event.
+    tables: tuple[str, ...] = ()
+
+    def __repr__(self) -> str:
+        attributes = ", ".join(f"{key}={value!r}" for key, value in vars(self).items())
+        return f"{type(self).__name__}({attributes})"
+
+
+class AccountsChanged(DatabaseEvent):
+    """Accounts have been created or deleted.
+
+    Parameters
+    ----------
+    account_ids : Iterable[int]
+        The IDs of the changed accounts.
+    deleted : bool
+        Whether the accounts were deleted.
+    """
+
+    tables = ("accounts",)
+
+    def __init__(self, account_ids: Iterable[int], deleted: bool = False) -> None:
+        self.account_ids = frozenset(account_ids)
+        self.deleted = deleted
+
+
+class TransactionsChanged(DatabaseEvent):
+    """Transactions have been created, updated or deleted.
+
+    Parameters
+    ----------
+    transaction_ids : Iterable[int]
+        The IDs of the changed transactions.
+    account_ids : Iterable[int]
+        The accounts whose balance changed. Includes the previous account of moved transactions.
+    year_months : Iterable[int]
+        The months affected (e.g. 202610), before and after the change.
+    deleted : bool
+        Whether the transactions were deleted.
+    """
+
+    tables = ("transactions",)
+
+    def __init__(
+        self,
+        transaction_ids: Iterable[int],
+        account_ids: Iterable[int],
+        year_months: Iterable[int],
+        deleted: bool = False,
+    ) -> None:
+        self.transaction_ids = frozenset(transaction_ids)
+        self.account_ids = frozenset(account_ids)
+        self.year_months = frozenset(year_months)
+        self.deleted = deleted
+
+
+class CategoriesChanged(DatabaseEvent):
+    """Categories have been created, reactivated or deactivated.
+
+    Parameters
+    ----------
+    names : Iterable[str]
+        The names of the changed categories.
+    """
+
+    tables = ("categories",)
+
+    def __init__(self, names: Iterable[str]) -> None:
+        self.names = frozenset(names)
+
+
+class RecurringRulesChanged(DatabaseEvent):
+    """Recurring rules have been created, deleted or advanced.
+
+    Parameters
+    ----------
+    rule_ids : Iterable[int]
+        The IDs of the changed rules.
+    """
+
+    tables = ("recurring_rules",)
+
+    def __init__(self, rule_ids: Iterable[int]) -> None:
+        self.rule_ids = frozenset(rule_ids)
+
+
+E = TypeVar("E", bound=DatabaseEvent)
+
+
+class EventBus:
+    """In-process publish/subscribe bus of database events.
+
+    Subscribers are called in the thread that published the event, which may be a
+    thread of `AsyncDatabase`. Textual apps should only post messages from them.
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: dict[type[DatabaseEvent], list[Callable]] = {}
+        self._lock = RLock()
+
+    def subscribe(self, event_type: type[E], callback: Callable[[E], None]) -> None:
+        """Calls the callback every time an event of the specified type (or a subclass) is published."""
+        with self._lock:
+            self._subscribers.setdefault(event_type, []).append(callback)
+
+    def unsubscribe(
+        self, event_type: type[E], callback: Optional[Callable[[E], None]] = None
+    ) -> None:
+        """Stops calling the callback for the specified event type. If no callback is given, all are removed."""
+        with self._lock:
+            if callback is None:
+                self._subscribers.pop(event_type, None)
+                return
+
+            callbacks = self._subscribers.get(event_type, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    def publish(self, event: DatabaseEvent) -> None:
+        """Calls every subscriber of the event's type.
+
+        Errors raised by subscribers are logged, so a failing screen never breaks a write.
+        """
+        with self._lock:
+            callbacks = [
+                callback
+                for event_type, subscribed in self._subscribers.items()
+                if isinstance(event, event_type)
+                for callback in subscribed
+            ]
+
+        logger.debug("Publishing %s to %s subscribers", event, len(callbacks))
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Subscriber %s failed to handle %s", callback, event)
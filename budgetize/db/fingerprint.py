@@ -0,0 +1,144 @@
+"""Fingerprints that identify a transaction, however it was entered or imported.
+
+A fingerprint is "<hash>:<ordinal>". The hash covers the account, the local day, the
+amount in minor units and the normalized description of the transaction. The ordinal
+tells apart identical transactions of the same day (e.g. two coffees), so the n-th
+occurrence of a hash in an imported statement matches the n-th one in the ledger.
+
+Fingerprints have a unique index, so whether a transaction exists is a lookup of the
+index instead of a scan of the history.
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Connection, bindparam, text
+
+# What imports do with the transactions whose fingerprint is already in the ledger.
+DUPLICATE_MODES = ("insert", "skip", "merge")
+
+# Fingerprints looked up per statement. SQLite limits the parameters of a statement.
+LOOKUP_BATCH_SIZE = 500
+
+_FIND_FINGERPRINTS = text(
+    "SELECT fingerprint, id FROM transactions WHERE fingerprint IN :fingerprints"
+).bindparams(bindparam("fingerprints", expanding=True))
+
+# Every ordinal of a hash, read from the index: ":" sorts right before ";".
+_FIND_ORDINALS = text(
+    "SELECT fingerprint FROM transactions "
+    "WHERE fingerprint >= :hash || ':' AND fingerprint < :hash || ';'"
+)
+
+
+def normalize_description(description: Optional[str]) -> str:
+    """Returns the description in lowercase with its whitespace collapsed."""
+    return " ".join((description or "").casefold().split())
+
+
+def get_fingerprint_hash(
+    account_id: Optional[int],
+    timestamp: float,
+    amount_minor: int,
+    description: Optional[str],
+) -> str:
+    """Returns the hash of the fields that identify a transaction.
+
+    Args:
+        account_id (int): The ID of the account of the transaction.
+        timestamp (float): The timestamp of the transaction. Only its local day is used.
+        amount_minor (int): The amount in minor units.
+        description (str): The description, compared without case or extra whitespace.
+
+    Returns:
+        str: 16 hexadecimal characters.
+    """
+    date = datetime.fromtimestamp(timestamp)
+    key = (
+        f"{account_id}|{date.year}{date.month:02}{date.day:02}|{amount_minor}|"
+        f"{normalize_description(description)}"
+    )
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+def make_fingerprint(fingerprint_hash: str, ordinal: int) -> str:
+    """Returns the fingerprint of the n-th transaction with the hash."""
+    return f"{fingerprint_hash}:{ordinal}"
+
+
+def find_fingerprints(conn: Connection, fingerprints: list[str]) -> dict[str, int]:
+    """Returns the IDs of the transactions with the specified fingerprints.
+
+    Args:
+        conn (Connection): The connection, so rows written by its transaction are seen.
+        fingerprints (list[str]): The fingerprints to look up.
+
+    Returns:
+        dict[str, int]: The ID of the transaction of each fingerprint found.
+    """
+    found: dict[str, int] = {}
+    for start in range(0, len(fingerprints), LOOKUP_BATCH_SIZE):
+        batch = fingerprints[start : start + LOOKUP_BATCH_SIZE]
+        found.update(
+            (fingerprint, transaction_id)
+            for fingerprint, transaction_id in conn.execute(
+                _FIND_FINGERPRINTS, {"fingerprints": batch}
+            )
+        )
+
+    return found
+
+
+def get_used_ordinals(conn: Connection, fingerprint_hash: str) -> set[int]:
+    """Returns the ordinals of the transactions with the hash."""
+    return {
+        int(fingerprint.rsplit(":", 1)[1])
+        for fingerprint in conn.execute(
+            _FIND_ORDINALS, {"hash": fingerprint_hash}
+        ).scalars()
+    }
+
+
+def allocate_fingerprints(conn: Connection, hashes: list[str]) -> list[str]:
+    """Returns a fingerprint for each hash that no transaction has yet.
+
+    Occurrences of a hash take the lowest free ordinals. The ledger is only searched for
+    the hashes whose first candidates are taken, which is rare outside of re-imports.
+
+    Args:
+        conn (Connection): The connection, so rows written by its transaction are seen.
+        hashes (list[str]): The hashes of the new transactions, repeated for identical ones.
+
+    Returns:
+        list[str]: The fingerprints, in the order of the hashes.
+    """
+    counters: dict[str, int] = {}
+    candidates = []
+    for fingerprint_hash in hashes:
+        ordinal = counters.get(fingerprint_hash, 0)
+        counters[fingerprint_hash] = ordinal + 1
+        candidates.append(make_fingerprint(fingerprint_hash, ordinal))
+
+    taken = find_fingerprints(conn, candidates)
+    if not taken:
+        return candidates
+
+    used = {
+        fingerprint_hash: get_used_ordinals(conn, fingerprint_hash)
+        for fingerprint_hash in {fingerprint.rsplit(":", 1)[0] for fingerprint in taken}
+    }
+    next_ordinals: dict[str, int] = {}
+    fingerprints = []
+    for fingerprint_hash, candidate in zip(hashes, candidates):
+        if fingerprint_hash not in used:
+            fingerprints.append(candidate)
+            continue
+
+        ordinal = next_ordinals.get(fingerprint_hash, 0)
+        while ordinal in used[fingerprint_hash]:
+            ordinal += 1
+        next_ordinals[fingerprint_hash] = ordinal + 1
+        fingerprints.append(make_fingerprint(fingerprint_hash, ordinal))
+
+    return fingerprints
@@ -0,0 +1,238 @@
+"""Offline audit of the indexes used by the queries of the Database class.
+
+Replays the queries the screens run through `Database` on a copy of a ledger, captures
+every statement they issue and reports the plans that read whole tables. The copy is
+also used to replay the writes (updating, deleting...), so the ledger is never modified.
+
+Scans of small tables (accounts, categories) are cheap, the number of rows of each
+scanned table is shown to tell them apart.
+
+Usage:
+    python -m budgetize.db.index_audit [--db ~/.budgetize/budgetize.sqlite] [--json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import sys
+import tempfile
+from typing import Any, Callable, Optional
+
+from arrow import Arrow
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from budgetize.consts import APP_FOLDER_PATH, DB_FILE_NAME
+from budgetize.db.slow_queries import explain_query_plan, find_full_scans
+
+logger = logging.getLogger(__name__)
+
+
+def count_rows(connection: sqlite3.Connection, tables: list[str]) -> dict[str, int]:
+    """Returns the number of rows of each table."""
+    return {
+        table: connection.execute(f'SELECT count(*) FROM "{table}"').fetchone()[0]
+        for table in tables
+    }
+
+
+class StatementRecorder:
+    """Explains the statements an engine runs, grouped by the replayed method.
+
+    Statements are explained before they run, so the plans (and row counts) of the
+    statements replayed before the writes are not affected by them.
+    """
+
+    def __init__(self) -> None:
+        self.method: Optional[str] = None
+        self.report: dict[str, list[dict]] = {}
+
+    def __call__(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        if self.method is None:
+            return
+
+        sql = " ".join(statement.split())
+        recorded = self.report.setdefault(self.method, [])
+        if any(sql == previous["sql"] for previous in recorded):
+            return
+
+        plan = explain_query_plan(
+            cursor.connection,
+            statement,
+            parameters[0] if executemany and parameters else parameters,
+        )
+        if plan:
+            recorded.append(
+                {
+                    "sql": sql,
+                    "plan": plan,
+                    "full_scans": count_rows(cursor.connection, find_full_scans(plan)),
+                }
+            )
+
+
+def get_replays(db: Any) -> list[tuple[str, Callable[[], Any]]]:
+    """Returns the methods of `Database` to replay, with arguments taken from the ledger.
+
+    The writes are last, since they change the ledger.
+    """
+    # Imported here so the audit can be imported without loading the ORM.
+    from budgetize.db.database import Database
+    from budgetize.db.orm.account import Account
+    from budgetize.db.orm.transactions import Transaction
+
+    with Session(db.engine) as session:
+        account = session.scalars(select(Account).order_by(Account.id)).first()
+        transaction = session.scalars(
+            select(Transaction).order_by(Transaction.timestamp.desc())
+        ).first()
+
+    replays: list[tuple[str, Callable[[], Any]]] = [
+        ("get_accounts", lambda: list(db.get_accounts())),
+        ("get_all_recent_transactions", db.get_all_recent_transactions),
+        ("get_monthly_totals", lambda: db.get_monthly_totals(False)),
+        ("get_monthly_category_totals", db.get_monthly_category_totals),
+        ("get_categories", db.get_categories),
+        ("get_category_ids", db.get_category_ids),
+        ("search_transactions", lambda: db.search_transactions("a")),
+        ("get_db_as_dict", db.get_db_as_dict),
+        ("get_recurring_rules", db.get_recurring_rules),
+        ("get_period_report_cells", lambda: db.get_period_report_cells("expenses")),
+        ("get_account_totals", db.get_account_totals),
+    ]
+
+    if account is not None:
+        now = Arrow.now()
+        db.account_cache.invalidate()
+        replays += [
+            ("get_account_by_id", lambda: db.get_account_by_id(account.id)),
+            ("get_account_by_name", lambda: db.get_account_by_name(account.name)),
+            ("account_name_exists", lambda: db.account_name_exists(account.name)),
+            ("get_account_balance", lambda: db.get_account_balance(account.id)),
+            (
+                "get_transactions_from_account",
+                lambda: list(db.get_transactions_from_account(account.id)),
+            ),
+            (
+                "get_monthly_transactions_from_account",
+                lambda: list(
+                    db.get_monthly_transactions_from_account(
+                        account.id, str(now.month), str(now.year)
+                    )
+                ),
+            ),
+        ]
+
+    if transaction is not None and transaction.account_id is not None:
+        account_id = int(transaction.account_id)
+        replays += [
+            (
+                "get_transaction_by_id",
+                lambda: db.get_transaction_by_id(transaction.id),
+            ),
+            (
+                "update_transaction",
+                lambda: db.update_transaction(
+                    transaction.id,
+                    account_id,
+                    transaction.amount,
+                    transaction.description or "",
+                    transaction.category,
+                    transaction.timestamp,
+                ),
+            ),
+            ("materialize_due_transactions", db.materialize_due_transactions),
+            ("delete_transaction", lambda: db.delete_transaction(transaction.id)),
+            ("delete_account", lambda: db.delete_account(account_id)),
+        ]
+
+    return replays
+
+
+def audit(db_path: str) -> dict[str, list[dict]]:
+    """Replays the queries of `Database` on a copy of the ledger and explains them.
+
+    Args:
+        db_path (str): The path of the ledger.
+
+    Returns:
+        dict[str, list[dict]]: The statements of each method, with their `sql`, `plan`
+        and the number of rows of the tables they scan (`full_scans`).
+    """
+    from budgetize.db.database import Database
+
+    with tempfile.TemporaryDirectory() as folder:
+        copy_path = os.path.join(folder, DB_FILE_NAME)
+        source = sqlite3.connect(db_path)
+        copy = sqlite3.connect(copy_path)
+        try:
+            source.backup(copy)
+        finally:
+            source.close()
+            copy.close()
+
+        url = f"sqlite:///{copy_path}"
+        db = Database(url=url)
+        recorder = StatementRecorder()
+        event.listen(db.engine, "before_cursor_execute", recorder)
+
+        for method, replay in get_replays(db):
+            recorder.method = method
+            try:
+                replay()
+            except Exception:
+                logger.exception("Could not replay %s", method)
+        recorder.method = None
+
+        event.remove(db.engine, "before_cursor_execute", recorder)
+        db.close()
+
+    return recorder.report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--db",
+        default=os.path.join(APP_FOLDER_PATH, DB_FILE_NAME),
+        help="Path of the ledger to audit",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"Database not found: {args.db}")
+        sys.exit(2)
+
+    report = audit(args.db)
+    if args.json:
+        print(json.dumps(report, indent=4))
+        return
+
+    scans = 0
+    for method, statements in report.items():
+        print(method)
+        for statement in statements:
+            status = "SCAN" if statement["full_scans"] else "OK  "
+            scans += bool(statement["full_scans"])
+            print(f"  {status} {statement['sql'][:120]}")
+            for step in statement["plan"]:
+                print(f"         {step}")
+            for table, rows in statement["full_scans"].items():
+                print(f"         -> reads all {rows} rows of {table}")
+
+    print(f"\n{scans} statements read whole tables.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+"""Opt-in instrumentation of the time spent in `Database` and `CurrencyManager`.
+
+When enabled, the public methods of `Database` and the rate lookups of `CurrencyManager`
+are wrapped to record how long each call takes. SQLAlchemy cursor events record every
+statement, which is attributed to the outermost instrumented method running in the same
+thread or task (its "call site").
+
+It is enabled by the TUI when running with Textual's devtools or when the
+`BUDGETIZE_INSTRUMENT` environment variable is set. It has no cost when disabled.
+"""
+
+import atexit
+import bisect
+import functools
+import inspect
+import json
+import logging
+import time
+from contextvars import ContextVar
+from threading import Lock
+from typing import Any, Callable, Iterator, Optional
+
+from sqlalchemy import Engine, event
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN_CALL_SITE = "<unknown>"
+
+# The instrumented method currently running in this thread or task.
+_call_site: ContextVar[Optional[str]] = ContextVar("call_site", default=None)
+
+
+class Histogram:
+    """Latency histogram with fixed buckets, so recording a value is cheap."""
+
+    # Upper bound of each bucket, in milliseconds. The last bucket has no bound.
+    BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(Histogram.BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms: float) -> None:
+        """Adds a measurement to the histogram."""
+        self.counts[bisect.bisect_left(Histogram.BUCKETS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def percentile(self, percent: float) -> float:
+        """Returns the upper bound of the bucket that contains the percentile, in milliseconds."""
+        if self.count == 0:
+            return 0.0
+
+        target = self.count * percent / 100
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                if index < len(Histogram.BUCKETS_MS):
+                    return min(float(Histogram.BUCKETS_MS[index]), self.max_ms)
+                break
+
+        return self.max_ms
+
+    def to_dict(self) -> dict:
+        """Returns the histogram as a JSON serializable dict."""
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "buckets": {
+                (f"<={bound}" if index < len(Histogram.BUCKETS_MS) else "inf"): count
+                for index, (bound, count) in enumerate(
+                    zip(Histogram.BUCKETS_MS + (None,), self.counts)
+                )
+                if count
+            },
+        }
+
+
+class CallSiteStats:
+    """Measurements of an instrumented method."""
+
+    def __init__(self) -> None:
+        self.calls = Histogram()
+        self.statements = Histogram()
+        self.rows = 0
+
+    def to_dict(self) -> dict:
+        """Returns the measurements as a JSON serializable dict."""
+        return {
+            "calls": self.calls.to_dict(),
+            "statements": self.statements.to_dict(),
+            "rows": self.rows,
+        }
+
+
+class Instrumentation:
+    """Records the latency of the instrumented methods and of the statements they run."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.stats: dict[str, CallSiteStats] = {}
+        self._lock = Lock()
+        self._originals: list[tuple[type, str, Any]] = []
+
+    # ======================== SETUP ========================
+
+    def enable(self, dump_path: Optional[str] = None) -> None:
+        """Starts recording. Calling it again does nothing.
+
+        Args:
+            dump_path (str): If specified, the stats are saved there as JSON when Python exits.
+        """
+        if self.enabled:
+            return
+
+        # Imported here, the database module imports this one.
+        from budgetize.currency_manager import CurrencyManager
+        from budgetize.db.database import Database
+
+        for name, attribute in list(vars(Database).items()):
+            if not name.startswith("_") and inspect.isfunction(attribute):
+                self._wrap(Database, name)
+
+        for name in ("get_exchange", "fetch_and_save_rate"):
+            self._wrap(CurrencyManager, name)
+
+        event.listen(Engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", self._after_cursor_execute)
+        self.enabled = True
+
+        if dump_path is not None:
+            atexit.register(self.dump, dump_path)
+
+        logger.info("Instrumented %s methods", len(self._originals))
+
+    def disable(self) -> None:
+        """Stops recording and restores the original methods. The stats are kept."""
+        if not self.enabled:
+            return
+
+        event.remove(Engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(Engine, "after_cursor_execute", self._after_cursor_execute)
+        for cls, name, original in reversed(self._originals):
+            setattr(cls, name, original)
+
+        self._originals = []
+        self.enabled = False
+
+    def _wrap(self, cls: type, name: str) -> None:
+        """Replaces the method of the class with a version that records its calls."""
+        original = vars(cls)[name]
+        call_site = f"{cls.__name__}.{name}"
+
+        wrapper: Callable
+        if inspect.iscoroutinefunction(original):
+
+            @functools.wraps(original)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                token, started_at = self._enter(call_site)
+                try:
+                    return await original(*args, **kwargs)
+                finally:
+                    self._exit(call_site, token, started_at)
+
+        elif inspect.isgeneratorfunction(original):
+
+            @functools.wraps(original)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                # Queries run while the generator is consumed, so each step is measured.
+                return self._wrap_iterator(call_site, original(*args, **kwargs))
+
+        else:
+
+            @functools.wraps(original)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                token, started_at = self._enter(call_site)
+                try:
+                    result = original(*args, **kwargs)
+                finally:
+                    self._exit(call_site, token, started_at)
+
+                self._count_rows(call_site, result)
+                return result
+
+        self._originals.append((cls, name, original))
+        setattr(cls, name, wrapper)
+
+    def _wrap_iterator(self, call_site: str, iterator: Iterator) -> Iterator:
+        """Yields the items of the iterator, adding the time taken by each to the call site."""
+        elapsed_ms = 0.0
+        rows = 0
+        try:
+            while True:
+                token = _call_site.set(_call_site.get() or call_site)
+                started_at = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed_ms += (time.perf_counter() - started_at) * 1000
+                    _call_site.reset(token)
+
+                rows += 1
+                yield item
+        finally:
+            with self._lock:
+                stats = self._get_stats(call_site)
+                stats.calls.record(elapsed_ms)
+                stats.rows += rows
+
+    # ======================== RECORDING ========================
+
+    def _get_stats(self, call_site: str) -> CallSiteStats:
+        """Returns the stats of the call site. Must be called with the lock held."""
+        stats = self.stats.get(call_site)
+        if stats is None:
+            stats = self.stats[call_site] = CallSiteStats()
+
+        return stats
+
+    def _enter(self, call_site: str) -> tuple[Any, float]:
+        """Marks the call site as running, unless it was called by another instrumented method."""
+        return _call_site.set(_call_site.get() or call_site), time.perf_counter()
+
+    def _exit(self, call_site: str, token: Any, started_at: float) -> None:
+        """Records the duration of the call and restores the previous call site."""
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+        _call_site.reset(token)
+        with self._lock:
+            self._get_stats(call_site).calls.record(elapsed_ms)
+
+    def _count_rows(self, call_site: str, result: Any) -> None:
+        """Adds the rows returned by a call to the stats of the call site."""
+        if result is None or isinstance(result, (bool, int, float, str)):
+            return
+
+        rows = len(result) if isinstance(result, (list, tuple, dict, set)) else 1
+        with self._lock:
+            self._get_stats(call_site).rows += rows
+
+    def _before_cursor_execute(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        conn.info.setdefault("instrumentation_started_at", []).append(
+            time.perf_counter()
+        )
+
+    def _after_cursor_execute(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        started_at = conn.info["instrumentation_started_at"].pop()
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+        call_site = _call_site.get() or UNKNOWN_CALL_SITE
+
+        with self._lock:
+            stats = self._get_stats(call_site)
+            stats.statements.record(elapsed_ms)
+            # SQLite only reports the rows changed by writes. Reads are counted by the methods.
+            if cursor.rowcount > 0:
+                stats.rows += cursor.rowcount
+
+    # ======================== REPORTS ========================
+
+    def reset(self) -> None:
+        """Forgets every measurement."""
+        with self._lock:
+            self.stats = {}
+
+    def get_report(self) -> dict[str, dict]:
+        """Returns the measurements of every call site, slowest in total first."""
+        with self._lock:
+            report = {
+                call_site: stats.to_dict() for call_site, stats in self.stats.items()
+            }
+
+        return dict(
+            sorted(
+                report.items(),
+                key=lambda item: max(
+                    item[1]["calls"]["total_ms"], item[1]["statements"]["total_ms"]
+                ),
+                reverse=True,
+            )
+        )
+
+    def dump(self, path: str) -> None:
+        """Saves the measurements to a JSON file."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.get_report(), f, indent=4)
+
+        logger.info("Saved instrumentation stats to %s", path)
+
+
+instrumentation = Instrumentation()
@@ -0,0 +1,560 @@
+"""Versioned migrations that bring existing databases up to date with the ORM models.
+
+`Base.metadata.create_all` only creates missing tables, so new columns, indexes and the
+data they need are handled here. The version of the schema is recorded in the
+`schema_version` table and only pending migrations are run.
+
+Each migration runs in up to three steps:
+    1. `schema`: DDL changes, in a single transaction.
+    2. `backfill`: Data changes, applied to ranges of transaction IDs with one transaction per
+       batch. Backfills only touch rows that were not migrated yet, so an interrupted
+       migration resumes where it stopped the next time Budgetize starts.
+    3. `finalize`: Changes that are cheaper after the backfill, such as creating indexes.
+
+Every step must be safe to run more than once.
+"""
+
+import logging
+import time
+from typing import Callable, Optional
+
+from sqlalchemy import Connection, Engine, inspect, text
+from sqlalchemy.exc import OperationalError
+
+from budgetize.db.fingerprint import allocate_fingerprints, get_fingerprint_hash
+from budgetize.money import get_currency_exponent, scale_to_minor_units
+
+logger = logging.getLogger(__name__)
+
+# Exponent used for transactions whose account no longer exists.
+DEFAULT_EXPONENT = 2
+
+# Amount of transaction IDs covered by each backfill transaction.
+DEFAULT_BATCH_SIZE = 5000
+
+SchemaStep = Callable[[Connection], None]
+BackfillStep = Callable[[Connection, int, int], int]
+
+
+class Migration:  # pylint: disable=too-few-public-methods
+    """A versioned change to the database.
+
+    Parameters
+    ----------
+    version : int
+        The schema version the database is at once the migration finishes.
+
+    description : str
+        A short description of the migration, used in logs.
+
+    schema : Callable[[Connection], None]
+        Applies the DDL changes of the migration.
+
+    backfill : Callable[[Connection, int, int], int]
+        Migrates the transactions with IDs between the two arguments (inclusive) and returns the
+        amount of rows changed.
+
+    finalize : Callable[[Connection], None]
+        Runs once the backfill is done.
+    """
+
+    def __init__(
+        self,
+        version: int,
+        description: str,
+        schema: Optional[SchemaStep] = None,
+        backfill: Optional[BackfillStep] = None,
+        finalize: Optional[SchemaStep] = None,
+    ):
+        self.version = version
+        self.description = description
+        self.schema = schema
+        self.backfill = backfill
+        self.finalize = finalize
+
+
+def get_migrations(categories: list[str]) -> list[Migration]:
+    """Returns every migration, sorted by version.
+
+    Args:
+    ----
+        categories (list[str]): The user's categories from the settings file.
+            Used to seed the categories table the first time it is created.
+
+    """
+    return [
+        Migration(
+            version=1,
+            description="Store amounts as integer minor units",
+            schema=lambda conn: _add_column(
+                conn, "transactions", "amount_minor", "INTEGER"
+            ),
+            backfill=_backfill_amount_minor,
+        ),
+        Migration(
+            version=2,
+            description="Add integer epoch and year_month columns",
+            schema=_add_date_columns,
+            backfill=_backfill_dates,
+            finalize=_create_date_indexes,
+        ),
+        Migration(
+            version=3,
+            description="Reference categories by ID",
+            schema=lambda conn: _add_category_column(conn, categories),
+            backfill=_backfill_category_ids,
+            finalize=_create_category_index,
+        ),
+        Migration(
+            version=4,
+            description="Index descriptions and categories for full-text search",
+            schema=_create_search_index,
+            backfill=_backfill_search_index,
+        ),
+        Migration(
+            version=5,
+            description="Fingerprint transactions to detect duplicated imports",
+            schema=_add_fingerprint_column,
+            backfill=_backfill_fingerprints,
+        ),
+        Migration(
+            version=6,
+            description="Cover the period reports with an index",
+            schema=_create_period_report_index,
+        ),
+    ]
+
+
+def migrate(
+    engine: Engine, categories: list[str], batch_size: int = DEFAULT_BATCH_SIZE
+) -> list[dict]:
+    """Applies every pending migration to the database of the specified engine.
+
+    Args:
+    ----
+        engine (Engine): The engine of the database to migrate.
+        categories (list[str]): The user's categories from the settings file.
+        batch_size (int): The amount of transaction IDs migrated by each backfill transaction.
+
+    Returns:
+    -------
+        list[dict]: A report of every migration applied, including the time spent on each step.
+
+    """
+    with engine.begin() as conn:
+        conn.execute(
+            text("CREATE TABLE IF NOT EXISTS schema_version (version INTEGER NOT NULL)")
+        )
+        current_version = get_schema_version(conn)
+
+    reports = []
+    for migration in get_migrations(categories):
+        if migration.version <= current_version:
+            continue
+
+        logger.info(
+            "Applying migration %s: %s...", migration.version, migration.description
+        )
+        report = _run_migration(engine, migration, batch_size)
+        reports.append(report)
+        logger.info(
+            "Migration %s done. Schema: %.3fs | Backfill: %.3fs (%s rows in %s batches) | Finalize: %.3fs",
+            migration.version,
+            report["schema_seconds"],
+            report["backfill_seconds"],
+            report["rows"],
+            report["batches"],
+            report["finalize_seconds"],
+        )
+
+    return reports
+
+
+def get_schema_version(conn: Connection) -> int:
+    """Returns the version recorded in the schema_version table. 0 if none was recorded."""
+
+    version = conn.execute(text("SELECT MAX(version) FROM schema_version")).scalar()
+    return int(version or 0)
+
+
+def get_latest_version() -> int:
+    """Returns the version of the schema once every migration is applied."""
+    return max(migration.version for migration in get_migrations([]))
+
+
+def is_migration_pending(engine: Engine) -> bool:
+    """Returns whether the existing data of the database has migrations to apply.
+
+    New databases have no data to migrate, so they are not pending.
+    """
+    tables = inspect(engine).get_table_names()
+    if "transactions" not in tables:
+        return False
+
+    if "schema_version" not in tables:
+        return True
+
+    with engine.connect() as conn:
+        return get_schema_version(conn) < get_latest_version()
+
+
+def _run_migration(engine: Engine, migration: Migration, batch_size: int) -> dict:
+    """Runs the steps of a migration and records its version once all of them succeed."""
+
+    report: dict = {
+        "version": migration.version,
+        "description": migration.description,
+        "schema_seconds": 0.0,
+        "backfill_seconds": 0.0,
+        "finalize_seconds": 0.0,
+        "rows": 0,
+        "batches": 0,
+    }
+
+    if migration.schema is not None:
+        start = time.perf_counter()
+        with engine.begin() as conn:
+            migration.schema(conn)
+        report["schema_seconds"] = time.perf_counter() - start
+
+    if migration.backfill is not None:
+        start = time.perf_counter()
+        with engine.connect() as conn:
+            max_id = conn.execute(text("SELECT MAX(id) FROM transactions")).scalar()
+
+        first_id = 1
+        while max_id is not None and first_id <= max_id:
+            last_id = first_id + batch_size - 1
+            with engine.begin() as conn:
+                report["rows"] += migration.backfill(conn, first_id, last_id)
+            report["batches"] += 1
+            first_id = last_id + 1
+
+        report["backfill_seconds"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        if migration.finalize is not None:
+            migration.finalize(conn)
+        conn.execute(text("DELETE FROM schema_version"))
+        conn.execute(
+            text("INSERT INTO schema_version (version) VALUES (:version)"),
+            {"version": migration.version},
+        )
+    report["finalize_seconds"] = time.perf_counter() - start
+
+    return report
+
+
+# ======================== Helpers ========================
+
+
+def _add_column(conn: Connection, table: str, column: str, column_type: str) -> None:
+    """Adds a column to the specified table if it is missing."""
+
+    existing_columns = [info["name"] for info in inspect(conn).get_columns(table)]
+    if column in existing_columns:
+        return
+
+    logger.info("Adding %s column to %s...", column, table)
+    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}"))
+
+
+# ======================== 1: Minor units ========================
+
+
+def _backfill_amount_minor(conn: Connection, first_id: int, last_id: int) -> int:
+    """Converts the float amounts that were not converted yet into integer minor units.
+
+    Amounts are rounded in Python like `to_minor_units`, since SQLite's ROUND works on the
+    binary float (e.g. ROUND(1.005 * 100) is 100, not 101). The float amount is rewritten
+    from the rounded minor units too, like new transactions store it.
+    """
+
+    transactions = conn.execute(
+        text(
+            "SELECT transactions.id, transactions.amount, accounts.currency "
+            "FROM transactions LEFT JOIN accounts ON accounts.id = transactions.account_id "
+            "WHERE transactions.id BETWEEN :first_id AND :last_id "
+            "AND transactions.amount_minor IS NULL"
+        ),
+        {"first_id": first_id, "last_id": last_id},
+    )
+
+    values = []
+    for transaction_id, amount, currency in transactions:
+        # Orphaned transactions have no currency to take the exponent from.
+        exponent = (
+            DEFAULT_EXPONENT if currency is None else get_currency_exponent(currency)
+        )
+        amount_minor = scale_to_minor_units(amount, exponent)
+        values.append(
+            {
+                "id": transaction_id,
+                "amount": amount_minor / float(10**exponent),
+                "amount_minor": amount_minor,
+            }
+        )
+
+    if values:
+        conn.execute(
+            text(
+                "UPDATE transactions SET amount = :amount, amount_minor = :amount_minor "
+                "WHERE id = :id"
+            ),
+            values,
+        )
+
+    return len(values)
+
+
+# ======================== 2: Date columns ========================
+
+
+def _add_date_columns(conn: Connection) -> None:
+    """Adds the integer epoch and year_month columns to the transactions table."""
+
+    _add_column(conn, "transactions", "epoch", "INTEGER")
+    _add_column(conn, "transactions", "year_month", "INTEGER")
+
+
+def _backfill_dates(conn: Connection, first_id: int, last_id: int) -> int:
+    """Fills the integer epoch and local YYYYMM bucket of transactions that do not have them."""
+
+    result = conn.execute(
+        text(
+            "UPDATE transactions SET epoch = CAST(timestamp AS INTEGER), "
+            "year_month = CAST(strftime('%Y%m', timestamp, 'unixepoch', 'localtime') AS INTEGER) "
+            "WHERE id BETWEEN :first_id AND :last_id "
+            "AND (epoch IS NULL OR year_month IS NULL)"
+        ),
+        {"first_id": first_id, "last_id": last_id},
+    )
+    return result.rowcount
+
+
+def _create_date_indexes(conn: Connection) -> None:
+    """Creates the indexes of the date columns, which `create_all` skips on existing tables."""
+
+    conn.execute(
+        text("CREATE INDEX IF NOT EXISTS ix_transactions_epoch ON transactions (epoch)")
+    )
+    conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_transactions_year_month ON transactions (year_month)"
+        )
+    )
+    conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_transactions_account_year_month "
+            "ON transactions (account_id, year_month)"
+        )
+    )
+
+
+# ======================== 3: Categories ========================
+
+
+def _add_category_column(conn: Connection, categories: list[str]) -> None:
+    """Adds the category_id column and creates the categories from the settings file
+    and the ones used by transactions."""
+
+    _add_column(conn, "transactions", "category_id", "INTEGER")
+
+    if conn.execute(text("SELECT COUNT(*) FROM categories")).scalar_one() == 0:
+        logger.info("Seeding categories table from settings...")
+        for name in categories:
+            conn.execute(
+                text(
+                    "INSERT OR IGNORE INTO categories (name, active) VALUES (:name, 1)"
+                ),
+                {"name": name},
+            )
+
+    conn.execute(
+        text(
+            "INSERT OR IGNORE INTO categories (name, active) "
+            "SELECT DISTINCT category, 0 FROM transactions "
+            "WHERE category_id IS NULL AND category != ''"
+        )
+    )
+
+
+def _backfill_category_ids(conn: Connection, first_id: int, last_id: int) -> int:
+    """Links transactions to the categories table by the name of their category."""
+
+    result = conn.execute(
+        text(
+            "UPDATE transactions SET category_id = "
+            "(SELECT id FROM categories WHERE categories.name = transactions.category) "
+            "WHERE id BETWEEN :first_id AND :last_id "
+            "AND category_id IS NULL AND category != ''"
+        ),
+        {"first_id": first_id, "last_id": last_id},
+    )
+    return result.rowcount
+
+
+def _create_category_index(conn: Connection) -> None:
+    """Creates the index of the category_id column."""
+
+    conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_transactions_category_id "
+            "ON transactions (category_id)"
+        )
+    )
+
+
+# ======================== 4: Full-text search ========================
+
+
+def has_search_index(conn: Connection) -> bool:
+    """Returns True if the FTS5 index of transactions exists."""
+
+    return (
+        conn.execute(
+            text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'transactions_fts'"
+            )
+        ).first()
+        is not None
+    )
+
+
+def _create_search_index(conn: Connection) -> None:
+    """(Re)creates the FTS5 index of transactions and the triggers that keep it in sync.
+
+    The index is dropped first so an interrupted backfill never leaves duplicated rows.
+    Nothing is created if SQLite was built without FTS5.
+    """
+
+    for trigger in ("insert", "delete", "update"):
+        conn.execute(text(f"DROP TRIGGER IF EXISTS transactions_fts_{trigger}"))
+    conn.execute(text("DROP TABLE IF EXISTS transactions_fts"))
+
+    try:
+        conn.execute(
+            text(
+                "CREATE VIRTUAL TABLE transactions_fts USING fts5("
+                "description, category, content='transactions', content_rowid='id', "
+                "tokenize='unicode61 remove_diacritics 2')"
+            )
+        )
+    except OperationalError:
+        logger.warning("SQLite was built without FTS5. Search will scan transactions.")
+        return
+
+    conn.execute(
+        text(
+            "CREATE TRIGGER transactions_fts_insert AFTER INSERT ON transactions BEGIN "
+            "INSERT INTO transactions_fts (rowid, description, category) "
+            "VALUES (new.id, new.description, new.category); "
+            "END"
+        )
+    )
+    conn.execute(
+        text(
+            "CREATE TRIGGER transactions_fts_delete AFTER DELETE ON transactions BEGIN "
+            "INSERT INTO transactions_fts (transactions_fts, rowid, description, category) "
+            "VALUES ('delete', old.id, old.description, old.category); "
+            "END"
+        )
+    )
+    conn.execute(
+        text(
+            "CREATE TRIGGER transactions_fts_update "
+            "AFTER UPDATE OF description, category ON transactions BEGIN "
+            "INSERT INTO transactions_fts (transactions_fts, rowid, description, category) "
+            "VALUES ('delete', old.id, old.description, old.category); "
+            "INSERT INTO transactions_fts (rowid, description, category) "
+            "VALUES (new.id, new.description, new.category); "
+            "END"
+        )
+    )
+
+
+def _backfill_search_index(conn: Connection, first_id: int, last_id: int) -> int:
+    """Indexes the descriptions and categories of existing transactions."""
+
+    if not has_search_index(conn):
+        return 0
+
+    result = conn.execute(
+        text(
+            "INSERT INTO transactions_fts (rowid, description, category) "
+            "SELECT id, description, category FROM transactions "
+            "WHERE id BETWEEN :first_id AND :last_id"
+        ),
+        {"first_id": first_id, "last_id": last_id},
+    )
+    return result.rowcount
+
+
+# ======================== 5: Fingerprints ========================
+
+
+def _add_fingerprint_column(conn: Connection) -> None:
+    """Adds the fingerprint column and its unique index.
+
+    The index is created before the backfill, which looks up the fingerprints taken by
+    the previous batches.
+    """
+
+    _add_column(conn, "transactions", "fingerprint", "VARCHAR(32)")
+    conn.execute(
+        text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_transactions_fingerprint "
+            "ON transactions (fingerprint)"
+        )
+    )
+
+
+def _backfill_fingerprints(conn: Connection, first_id: int, last_id: int) -> int:
+    """Fingerprints the transactions that do not have a fingerprint yet, in ID order."""
+
+    rows = conn.execute(
+        text(
+            "SELECT id, account_id, timestamp, amount_minor, description FROM transactions "
+            "WHERE id BETWEEN :first_id AND :last_id AND fingerprint IS NULL ORDER BY id"
+        ),
+        {"first_id": first_id, "last_id": last_id},
+    ).all()
+    if not rows:
+        return 0
+
+    fingerprints = allocate_fingerprints(
+        conn,
+        [
+            get_fingerprint_hash(
+                row.account_id, row.timestamp, row.amount_minor, row.description
+            )
+            for row in rows
+        ],
+    )
+    conn.execute(
+        text("UPDATE transactions SET fingerprint = :fingerprint WHERE id = :id"),
+        [
+            {"id": row.id, "fingerprint": fingerprint}
+            for row, fingerprint in zip(rows, fingerprints)
+        ],
+    )
+    return len(rows)
+
+
+# ======================== 6: Period reports ========================
+
+
+def _create_period_report_index(conn: Connection) -> None:
+    """Creates the index that covers the period reports.
+
+    Its first column is year_month, so it replaces the index of that column.
+    """
+
+    conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_transactions_period_report ON transactions "
+            "(year_month, category_id, account_id, visible, amount_minor)"
+        )
+    )
+    conn.execute(text("DROP INDEX IF EXISTS ix_transactions_year_month"))
@@ -0,0 +1,23 @@
+"""Category ORM model."""
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ._base import Base
+
+
+class Category(Base):  # pylint: disable=too-few-public-methods
+    """ORM model for the categories table. Represents a category transactions can be grouped by."""
+
+    __tablename__ = "categories"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(unique=True)
+
+    # Only active categories are offered to the user. Categories created implicitly by
+    # transactions (e.g. transfers) or deleted by the user are kept inactive so rows can still reference them.
+    active: Mapped[bool] = mapped_column(default=True)
+
+    def __repr__(self) -> str:
+        """String representation of the Category object."""
+
+        return f"<Category(id={self.id}, name={self.name}, active={self.active})>"
@@ -0,0 +1,46 @@
+"""Recurring rule ORM model."""
+
+from typing import Optional
+
+from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ._base import Base
+
+
+class RecurringRule(Base):  # pylint: disable=too-few-public-methods
+    """ORM model for the recurring_rules table. Represents a transaction that repeats, like rent or a salary."""
+
+    __tablename__ = "recurring_rules"
+    __table_args__ = (
+        # The catch-up only reads the active rules that are due.
+        Index("ix_recurring_rules_active_next_due", "active", "next_due"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    account_id: Mapped[int] = mapped_column(ForeignKey("accounts.id"), index=True)
+    amount: Mapped[float]
+    description: Mapped[str] = mapped_column(String(255))
+    category: Mapped[str]
+
+    # Repeats every `every` days, weeks, months or years from `start`.
+    unit: Mapped[str] = mapped_column(String(5))
+    every: Mapped[int] = mapped_column(default=1)
+    start: Mapped[float]
+    end: Mapped[Optional[float]]
+
+    # Occurrences already added as transactions, and the epoch of the next one.
+    occurrences: Mapped[int] = mapped_column(default=0)
+    next_due: Mapped[int]
+
+    # Inactive rules are kept once they end.
+    active: Mapped[bool] = mapped_column(default=True)
+
+    def __repr__(self) -> str:
+        """String representation of the RecurringRule object."""
+
+        return (
+            f"<RecurringRule(id={self.id}, account_id={self.account_id}, amount={self.amount}, "
+            f"description={self.description}, every={self.every} {self.unit}, "
+            f"next_due={self.next_due}, active={self.active})>"
+        )
@@ -2,7 +2,7 @@
 
 from typing import Optional
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ._base import Base
@@ -12,14 +12,41 @@ class Transaction(Base):  # pylint: disable=too-few-public-methods
     """Database ORM for transactions table. Represents a transaction on an account."""
 
     __tablename__ = "transactions"
+    __table_args__ = (
+        Index("ix_transactions_account_year_month", "account_id", "year_month"),
+        Index("ix_transactions_fingerprint", "fingerprint", unique=True),
+        # Covers the monthly summaries and period reports, which group months without
+        # reading the rows. Also serves the lookups by year_month.
+        Index(
+            "ix_transactions_period_report",
+            "year_month",
+            "category_id",
+            "account_id",
+            "visible",
+            "amount_minor",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     account_id: Mapped[Optional[str]] = mapped_column(ForeignKey("accounts.id"))
     amount: Mapped[float]
+
+    # Amount scaled by the currency exponent (e.g. cents). Used for exact aggregates.
+    amount_minor: Mapped[int]
     description: Mapped[Optional[str]] = mapped_column(String(255))
     category: Mapped[str]
+    category_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("categories.id"), index=True
+    )
     timestamp: Mapped[float]
 
+    # Derived from timestamp on every write so filtering and grouping by date stays in SQL.
+    epoch: Mapped[int] = mapped_column(index=True)
+    year_month: Mapped[int]  # YYYYMM in local time
+
+    # "<hash>:<ordinal>" of the account, day, amount and description. See `budgetize.db.fingerprint`.
+    fingerprint: Mapped[Optional[str]] = mapped_column(String(32))
+
     # If its visible it will contribute to balance and expenses. If not, its an hidden expense. For example the initial balance or transfers
     visible: Mapped[bool] = mapped_column(default=True)
 
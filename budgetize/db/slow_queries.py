@@ -0,0 +1,136 @@
+"""Slow-query log of the SQLite engines, with the query plan of every slow statement.
+
+Statements slower than the `slow_query_ms` database setting are logged as warnings with
+their parameters, duration and `EXPLAIN QUERY PLAN` output.
+"""
+
+import logging
+import re
+import time
+from typing import Any, Optional
+
+from sqlalchemy import Engine, event
+
+logger = logging.getLogger(__name__)
+
+# Statements SQLite can explain. PRAGMAs and DDL are never reported.
+_EXPLAINABLE = re.compile(r"^\s*(SELECT|INSERT|UPDATE|DELETE|WITH)\b", re.IGNORECASE)
+
+# A plan step that reads every row of a table, instead of searching it or reading an index.
+_FULL_SCAN = re.compile(r"^SCAN (\w+)\b(?! USING| VIRTUAL TABLE)")
+
+MAX_PARAMETERS_LENGTH = 200
+
+
+def explain_query_plan(
+    dbapi_connection: Any, statement: str, parameters: Any = ()
+) -> list[str]:
+    """Returns the steps of the query plan of a statement, indented by depth.
+
+    Args:
+        dbapi_connection: The sqlite3 connection that runs the statement.
+        statement (str): The SQL statement.
+        parameters: The parameters of the statement.
+
+    Returns:
+        list[str]: The plan, e.g. ["SEARCH transactions USING INDEX ix_... (account_id=?)"].
+        Empty if the statement can not be explained.
+    """
+    if not _EXPLAINABLE.match(statement):
+        return []
+
+    cursor = dbapi_connection.cursor()
+    try:
+        rows = cursor.execute(
+            f"EXPLAIN QUERY PLAN {statement}", parameters or ()
+        ).fetchall()
+    except Exception as e:  # The plan is only informative, never fail the query
+        logger.debug("Could not explain %s: %s", statement, e)
+        return []
+    finally:
+        cursor.close()
+
+    depths: dict[int, int] = {0: -1}
+    plan = []
+    for step_id, parent_id, _, detail in rows:
+        depths[step_id] = depths.get(parent_id, -1) + 1
+        plan.append("  " * depths[step_id] + detail)
+
+    return plan
+
+
+def find_full_scans(plan: list[str]) -> list[str]:
+    """Returns the tables read row by row in a query plan."""
+    tables = []
+    for step in plan:
+        match = _FULL_SCAN.match(step.strip())
+        if match is not None:
+            tables.append(match.group(1))
+
+    return tables
+
+
+class SlowQueryLog:
+    """Logs the statements of an engine that take longer than a threshold.
+
+    Parameters
+    ----------
+    threshold_ms : float
+        The duration from which a statement is logged, in milliseconds.
+    """
+
+    def __init__(self, threshold_ms: float) -> None:
+        self.threshold_ms = threshold_ms
+
+    def attach(self, engine: Engine) -> None:
+        """Starts timing the statements of the engine."""
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        conn.info.setdefault("slow_query_started_at", []).append(time.perf_counter())
+
+    def _after_cursor_execute(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        started_at = conn.info["slow_query_started_at"].pop()
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+        if elapsed_ms < self.threshold_ms:
+            return
+
+        # Batches have one set of parameters per row, their plan is the one of a single row.
+        plan = explain_query_plan(
+            cursor.connection,
+            statement,
+            parameters[0] if executemany and parameters else parameters,
+        )
+        logger.warning(
+            "Slow query (%.1f ms): %s\nParameters: %s\nQuery plan:\n%s",
+            elapsed_ms,
+            statement,
+            _format_parameters(parameters),
+            "\n".join(plan) or "(not available)",
+        )
+
+
+def _format_parameters(parameters: Optional[Any]) -> str:
+    """Returns the parameters as a string, truncated so batches do not flood the log."""
+    text = repr(parameters)
+    if len(text) > MAX_PARAMETERS_LENGTH:
+        return text[:MAX_PARAMETERS_LENGTH] + "..."
+
+    return text
@@ -3,3 +3,11 @@
 
 class ExchangeRateFetchError(Exception):
     """Exception that is raised when an error ocurred fetching the exchange rate from another currency."""
+
+
+class CSVImportError(Exception):
+    """Exception that is raised when a CSV statement can not be imported, e.g. a mapped column is missing."""
+
+
+class SchemaOutdatedError(Exception):
+    """Exception that is raised when a database opened read-only has tables or migrations missing."""
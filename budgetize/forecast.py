@@ -0,0 +1,373 @@
+"""Cash-flow forecasts: the balance of each account and the net worth at the end of the next months.
+
+A forecast starts from the current balances and adds, month by month:
+
+1. Recurring rules: every occurrence from their next due date, like
+   `Database.materialize_due_transactions` will add them.
+2. Seasonal averages: what each account got or spent on each category in the same
+   calendar month of the previous years, from the monthly rollups of the period reports
+   (`Database.get_period_report_cells`). The categories an account has a recurring rule
+   for are left to the rule, so they are not counted twice.
+3. The budget: in the "budget" scenario, each budgeted category costs its limit instead
+   of its seasonal average, split between the accounts like its past expenses.
+
+The rest of the current month only counts the part of its averages that is still ahead.
+Every scenario, account and month is computed at once, in arrays shaped
+(scenarios, accounts, months).
+"""
+
+import logging
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+from arrow import Arrow
+
+from budgetize.budget import Budget
+from budgetize.consts import (
+    FORECAST_HISTORY_YEARS,
+    FORECAST_MONTHS,
+    FORECAST_SCENARIOS,
+)
+from budgetize.dates import get_occurrence, get_year_month
+from budgetize.money import get_currency_exponent
+from budgetize.utils import _
+
+if TYPE_CHECKING:
+    from budgetize.db.database import Database
+
+logger = logging.getLogger(__name__)
+
+
+def shift_year_month(year_month: int, months: int) -> int:
+    """Returns the month that is a number of months after another one, e.g. 202612 + 1 = 202701."""
+    index = (year_month // 100) * 12 + year_month % 100 - 1 + months
+    return (index // 12) * 100 + index % 12 + 1
+
+
+class Forecast:
+    """Projected balances of the accounts and the net worth at the end of each month.
+
+    Parameters
+    ----------
+    scenarios : list[str]
+        The scenarios, from `FORECAST_SCENARIOS`.
+
+    accounts : list[str]
+        The names of the accounts.
+
+    currencies : list[str]
+        The currency of each account.
+
+    months : list[str]
+        The months, as YYYY-MM. The first one is the current month.
+
+    balances : np.ndarray
+        The balance of each scenario, account and month, in the currency of the account.
+
+    net_worth : np.ndarray
+        The sum of the balances of each scenario and month, in the base currency.
+
+    base_currency : str
+        The currency of the net worth.
+    """
+
+    def __init__(
+        self,
+        scenarios: list[str],
+        accounts: list[str],
+        currencies: list[str],
+        months: list[str],
+        balances: np.ndarray,
+        net_worth: np.ndarray,
+        base_currency: str,
+    ):
+        self.scenarios = scenarios
+        self.accounts = accounts
+        self.currencies = currencies
+        self.months = months
+        self.balances = balances
+        self.net_worth = net_worth
+        self.base_currency = base_currency
+
+    def get_lowest_net_worth(self, scenario: str) -> tuple[str, float]:
+        """Returns the month with the lowest net worth of a scenario, and the net worth."""
+        net_worth = self.net_worth[self.scenarios.index(scenario)]
+        month = int(net_worth.argmin())
+        return self.months[month], float(net_worth[month])
+
+    def to_rows(self, scenario: str) -> Iterator[dict]:
+        """Yields a row per account with its balance at the end of each month, then the net worth."""
+        index = self.scenarios.index(scenario)
+        for account, currency, balances in zip(
+            self.accounts, self.currencies, self.balances[index].tolist()
+        ):
+            row: dict = {"account": account, "currency": currency}
+            row.update(zip(self.months, (round(balance, 2) for balance in balances)))
+            yield row
+
+        row = {"account": _("Net worth"), "currency": self.base_currency}
+        row.update(
+            zip(
+                self.months,
+                (round(balance, 2) for balance in self.net_worth[index].tolist()),
+            )
+        )
+        yield row
+
+
+class ForecastEngine:
+    """Builds the cash-flow forecasts of a ledger.
+
+    Parameters
+    ----------
+    db : Database
+        The database of the ledger.
+    """
+
+    def __init__(self, db: "Database"):
+        self.db = db
+
+    async def get_rates(self) -> dict[str, float]:
+        """(Coroutine) Returns the exchange rates of the currencies of the accounts."""
+        return await self.db.get_exchange_rates(
+            account.currency for account in self.db.get_accounts()
+        )
+
+    def build(
+        self,
+        rates: dict[str, float],
+        budget: Optional[Budget] = None,
+        months: int = FORECAST_MONTHS,
+        history_years: int = FORECAST_HISTORY_YEARS,
+        now: Optional[float] = None,
+    ) -> Forecast:
+        """Returns the forecast of every account for the next months.
+
+        Args:
+            rates (dict[str, float]): The units of each currency per unit of the base
+                currency, as returned by `get_rates`.
+            budget (Budget): The budget of the "budget" scenario. Without it, only the
+                "seasonal" scenario is forecast.
+            months (int): The number of months, the current one included.
+            history_years (int): The years before the current month the seasonal
+                averages are taken from.
+            now (float): The timestamp the forecast starts at. Defaults to now.
+
+        Returns:
+            Forecast: The forecast.
+        """
+        if months < 1:
+            raise ValueError("A forecast needs at least one month")
+
+        now = Arrow.now().timestamp() if now is None else now
+        accounts = sorted(self.db.get_accounts(), key=lambda account: account.id)
+        account_index = {account.id: index for index, account in enumerate(accounts)}
+        category_ids = self.db.get_category_ids()
+        limits = budget.get_limits_by_category_id(category_ids) if budget else {}
+        scenarios = [
+            scenario
+            for scenario in FORECAST_SCENARIOS
+            if scenario != "budget" or limits
+        ]
+
+        # Factors of each account: minor to major units, and major units to the base currency.
+        scales = np.array(
+            [10.0 ** -get_currency_exponent(account.currency) for account in accounts]
+        )
+        to_base = np.array([1 / rates[account.currency] for account in accounts])
+
+        totals = self.db.get_account_totals()
+        balances = (
+            np.array([totals.get(account.id, 0) for account in accounts]) * scales
+        )
+
+        # Bounds of the months, the first one being the start of the next month.
+        month_start = Arrow.fromtimestamp(now).floor("month")
+        bounds = np.array(
+            [month_start.shift(months=i + 1).timestamp() for i in range(months)]
+        )
+        current_month = get_year_month(now)
+        year_months = [shift_year_month(current_month, i) for i in range(months)]
+        calendar_months = np.array([year_month % 100 - 1 for year_month in year_months])
+        weights = np.ones(months)
+        weights[0] = (bounds[0] - now) / (bounds[0] - month_start.timestamp())
+
+        recurring, covered = self._get_recurring(account_index, category_ids, bounds)
+        seasonal, categories = self._get_seasonal(
+            account_index, scales, current_month, history_years, covered, limits
+        )
+
+        # (scenarios, accounts, categories, calendar months)
+        averages = np.repeat(seasonal[np.newaxis], len(scenarios), axis=0)
+        if "budget" in scenarios:
+            averages[scenarios.index("budget")] = self._apply_budget(
+                seasonal, categories, limits, to_base, covered
+            )
+
+        changes = (
+            averages.sum(axis=2)[:, :, calendar_months] * weights
+            + recurring[np.newaxis]
+        )
+        projected = balances[np.newaxis, :, np.newaxis] + np.cumsum(changes, axis=2)
+
+        return Forecast(
+            scenarios=scenarios,
+            accounts=[account.name for account in accounts],
+            currencies=[account.currency for account in accounts],
+            months=[f"{ym // 100}-{ym % 100:02}" for ym in year_months],
+            balances=projected,
+            net_worth=np.einsum("sam,a->sm", projected, to_base),
+            base_currency=self.db.settings.get_base_currency(),
+        )
+
+    def _get_recurring(
+        self,
+        account_index: dict[int, int],
+        category_ids: dict[str, int],
+        bounds: np.ndarray,
+    ) -> tuple[np.ndarray, set[tuple[int, int]]]:
+        """Returns the amounts of the recurring rules of each account and month.
+
+        Returns:
+            tuple[np.ndarray, set[tuple[int, int]]]: The amounts, shaped (accounts, months),
+            and the (account index, category ID) pairs the rules cover.
+        """
+        rule_accounts: list[int] = []
+        timestamps: list[float] = []
+        amounts: list[float] = []
+        covered: set[tuple[int, int]] = set()
+
+        for rule in self.db.get_recurring_rules():
+            if not rule.active or rule.account_id not in account_index:
+                continue
+
+            index = account_index[rule.account_id]
+            if rule.category in category_ids:
+                covered.add((index, category_ids[rule.category]))
+
+            occurrence = rule.occurrences
+            timestamp = get_occurrence(rule.start, rule.unit, rule.every, occurrence)
+            while timestamp < bounds[-1] and (
+                rule.end is None or timestamp <= rule.end
+            ):
+                rule_accounts.append(index)
+                timestamps.append(timestamp)
+                amounts.append(rule.amount)
+                occurrence += 1
+                timestamp = get_occurrence(
+                    rule.start, rule.unit, rule.every, occurrence
+                )
+
+        # Occurrences still due are added to the current month.
+        recurring = np.zeros((len(account_index), len(bounds)))
+        np.add.at(
+            recurring,
+            (
+                np.array(rule_accounts, dtype=np.int64),
+                np.searchsorted(bounds, np.array(timestamps), side="right"),
+            ),
+            np.array(amounts),
+        )
+        return recurring, covered
+
+    def _get_seasonal(
+        self,
+        account_index: dict[int, int],
+        scales: np.ndarray,
+        current_month: int,
+        history_years: int,
+        covered: set[tuple[int, int]],
+        limits: dict[int, float],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the average of each account and category per calendar month.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The averages in the currency of each account,
+            shaped (accounts, categories, 12), and the IDs of the categories. Budgeted
+            categories are included even without history.
+        """
+        first_month = shift_year_month(current_month, -12 * history_years)
+        last_month = shift_year_month(current_month, -1)
+        cells = self.db.get_period_report_cells("net", first_month, last_month)
+
+        data = np.array(cells, dtype=np.int64).reshape(-1, 4)
+        year_months, cell_categories, account_ids, totals = data.T
+
+        # Accounts deleted meanwhile map to -1 and are dropped.
+        lookup = np.full(
+            max(*account_index, int(account_ids.max(initial=0)), 0) + 1, -1
+        )
+        lookup[list(account_index)] = list(account_index.values())
+        accounts = lookup[account_ids]
+        known = accounts >= 0
+
+        categories, category_index = np.unique(
+            np.concatenate([cell_categories, np.array(list(limits), dtype=np.int64)]),
+            return_inverse=True,
+        )
+        category_index = category_index[: len(cell_categories)]
+
+        shape = (len(account_index), len(categories), 12)
+        sums = np.zeros(shape)
+        np.add.at(
+            sums,
+            (accounts[known], category_index[known], year_months[known] % 100 - 1),
+            totals[known] * scales[accounts[known]],
+        )
+
+        # Times each calendar month is in the history, since the first transaction.
+        history_start = max(first_month, int(year_months.min(initial=last_month)))
+        counts = np.zeros(12)
+        year_month = history_start
+        while year_month <= last_month:
+            counts[year_month % 100 - 1] += 1
+            year_month = shift_year_month(year_month, 1)
+
+        seasonal = sums / np.maximum(counts, 1)
+        self._clear_covered(seasonal, categories, covered)
+        return seasonal, categories
+
+    def _apply_budget(
+        self,
+        seasonal: np.ndarray,
+        categories: np.ndarray,
+        limits: dict[int, float],
+        to_base: np.ndarray,
+        covered: set[tuple[int, int]],
+    ) -> np.ndarray:
+        """Returns the seasonal averages with the budgeted categories costing their limit.
+
+        The limit of a category is split between the accounts by their share of its past
+        expenses, or of all the past expenses if it has none.
+        """
+        budgeted = np.searchsorted(categories, np.array(list(limits), dtype=np.int64))
+        monthly_limits = np.array(list(limits.values()))
+
+        # Past expenses of each account and category in the base currency.
+        expenses = np.maximum(-seasonal.sum(axis=2), 0) * to_base[:, np.newaxis]
+        shares = expenses[:, budgeted]
+        fallback = expenses.sum(axis=1, keepdims=True)
+        if not fallback.any():
+            fallback = np.ones_like(fallback)
+        shares = np.where(shares.sum(axis=0) > 0, shares, fallback)
+        shares = shares / shares.sum(axis=0)
+
+        averages = seasonal.copy()
+        averages[:, budgeted, :] = -(shares * monthly_limits / to_base[:, np.newaxis])[
+            :, :, np.newaxis
+        ]
+        self._clear_covered(averages, categories, covered)
+        return averages
+
+    def _clear_covered(
+        self,
+        averages: np.ndarray,
+        categories: np.ndarray,
+        covered: set[tuple[int, int]],
+    ) -> None:
+        """Zeroes the averages of the categories the recurring rules already forecast."""
+        for account, category_id in covered:
+            category = np.searchsorted(categories, category_id)
+            if category < len(categories) and categories[category] == category_id:
+                averages[account, category, :] = 0
@@ -0,0 +1,484 @@
+"""CSV import of bank statements.
+
+A statement goes through these stages:
+
+1. Reading: the file is streamed in chunks of rows, it is never loaded whole.
+2. Mapping: a profile maps its columns to the fields of a transaction.
+3. Parsing: amounts and dates are parsed with the separators and formats of the profile.
+   Statements larger than `IMPORT_PARALLEL_BYTES` are parsed by a pool of processes.
+4. Validation: rows that can not be parsed are reported with their line number.
+5. Insertion: the transactions are inserted in batches by `Database.bulk_add_transactions`,
+   in a single DB transaction, so a failed import leaves the ledger untouched. The ones
+   already in the ledger, e.g. from an overlapping statement, are skipped by default.
+"""
+
+import csv
+import logging
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Union
+
+from budgetize.consts import (
+    DEFAULT_IMPORT_PROFILES,
+    IMPORT_CHUNK_SIZE,
+    IMPORT_PARALLEL_BYTES,
+)
+from budgetize.exceptions import CSVImportError
+
+if TYPE_CHECKING:
+    from budgetize.db.database import Database
+
+logger = logging.getLogger(__name__)
+
+# Rows of the statement with their line number, for the error messages.
+Chunk = list[tuple[int, list[str]]]
+
+# Errors of the rows that could not be parsed, as (line number, message).
+RowErrors = list[tuple[int, str]]
+
+# Characters left in an amount once its separators are normalized.
+_NOT_NUMERIC = re.compile(r"[^\d.+-]")
+
+# Number of errors kept in the result. Every invalid row is still counted.
+MAX_REPORTED_ERRORS = 100
+
+
+# ======================== PARSING ========================
+
+
+@lru_cache(maxsize=None)
+def _get_number_symbols(locale: str) -> tuple[str, str]:
+    """Returns the decimal and group separators of a locale."""
+    from babel.numbers import get_decimal_symbol, get_group_symbol
+
+    return get_decimal_symbol(locale), get_group_symbol(locale)
+
+
+def parse_amount(value: str, locale: str) -> Decimal:
+    """Parses an amount written with the separators of a locale, e.g. "1.234,56" in de_DE.
+
+    Currency symbols and spaces are ignored. "(12.50)" and "12.50-" are negative.
+
+    Args:
+        value (str): The amount as written in the statement.
+        locale (str): The locale of the statement, e.g. "en_US".
+
+    Returns:
+        Decimal: The amount.
+
+    Raises:
+        ValueError: If the value is not an amount.
+    """
+    decimal_symbol, group_symbol = _get_number_symbols(locale)
+    text = value.strip()
+    negative = text.startswith("(") and text.endswith(")")
+
+    text = text.replace(group_symbol, "")
+    if decimal_symbol != ".":
+        text = text.replace(decimal_symbol, ".")
+    text = _NOT_NUMERIC.sub("", text)
+
+    if text.endswith("-"):
+        negative = True
+        text = text[:-1]
+
+    try:
+        amount = Decimal(text)
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount '{value}'") from None
+
+    return -amount if negative else amount
+
+
+@lru_cache(maxsize=4096)
+def parse_date(value: str, locale: str, date_format: Optional[str] = None) -> float:
+    """Parses a date of a statement into a local timestamp.
+
+    Args:
+        value (str): The date as written in the statement.
+        locale (str): The locale of the statement, used when there is no format.
+        date_format (str): A `strptime` format, e.g. "%d/%m/%Y". Much faster than the locale.
+
+    Statements repeat the same few dates, so the timestamps are cached.
+
+    Returns:
+        float: The timestamp of the date, at midnight if it has no time.
+
+    Raises:
+        ValueError: If the value is not a date.
+    """
+    text = value.strip()
+    if date_format:
+        try:
+            return datetime.strptime(text, date_format).timestamp()
+        except ValueError:
+            raise ValueError(
+                f"Invalid date '{value}', expected the format {date_format}"
+            ) from None
+
+    from babel.dates import parse_date as parse_locale_date
+
+    try:
+        day = parse_locale_date(text, locale=locale)
+    except Exception:
+        raise ValueError(f"Invalid date '{value}' for the locale {locale}") from None
+
+    return datetime(day.year, day.month, day.day).timestamp()
+
+
+class ImportProfile:
+    """Maps the columns of a CSV statement to the fields of a transaction.
+
+    Parameters
+    ----------
+    name : str
+        The name of the profile.
+    settings : dict
+        The profile, with the keys of the ones in `DEFAULT_IMPORT_PROFILES`. Missing keys
+        take the values of the "default" profile.
+    """
+
+    FIELDS = ("date", "amount", "debit", "credit", "description", "category")
+
+    # Fields left empty when their column is not in the statement.
+    OPTIONAL_FIELDS = ("description", "category")
+
+    def __init__(self, name: str, settings: dict) -> None:
+        defaults = DEFAULT_IMPORT_PROFILES["default"]
+        settings = {**defaults, **settings}
+
+        self.name = name
+        self.delimiter: str = settings["delimiter"]
+        self.encoding: str = settings["encoding"]
+        self.skip_rows: int = settings["skip_rows"]
+        self.header: bool = settings["header"]
+        self.locale: str = settings["locale"]
+        self.date_format: Optional[str] = settings["date_format"]
+        self.columns: dict[str, Union[str, int]] = settings["columns"]
+        self.negate: bool = settings["negate"]
+        self.default_category: str = settings["default_category"]
+
+        unknown = set(self.columns) - set(ImportProfile.FIELDS)
+        if unknown:
+            raise CSVImportError(
+                f"Profile '{name}' maps unknown fields: {', '.join(sorted(unknown))}"
+            )
+        if "date" not in self.columns:
+            raise CSVImportError(f"Profile '{name}' does not map the date column")
+        if "amount" not in self.columns and not (
+            "debit" in self.columns or "credit" in self.columns
+        ):
+            raise CSVImportError(
+                f"Profile '{name}' maps neither an amount nor debit/credit columns"
+            )
+
+    def resolve_columns(self, header: Optional[list[str]]) -> dict[str, int]:
+        """Returns the index of each mapped column.
+
+        Args:
+            header (list[str]): The first row of the statement. None if it has no header.
+
+        Returns:
+            dict[str, int]: The index of the column of each field.
+
+        Raises:
+            CSVImportError: If a required column is not in the header.
+        """
+        names = [column.strip().lower() for column in header] if header else []
+        indexes = {}
+        for field, column in self.columns.items():
+            if isinstance(column, int):
+                indexes[field] = column
+            elif column.strip().lower() in names:
+                indexes[field] = names.index(column.strip().lower())
+            elif field in ImportProfile.OPTIONAL_FIELDS:
+                logger.debug("Column %s of the %s is not in the header", column, field)
+            else:
+                raise CSVImportError(
+                    f"Column '{column}' of the {field} is not in the header of the statement"
+                )
+
+        return indexes
+
+    def parse_row(self, row: list[str], indexes: dict[str, int]) -> dict:
+        """Returns the transaction of a row, without its account.
+
+        Raises:
+            ValueError: If the amount or date can not be parsed.
+        """
+        if "amount" in indexes:
+            amount = parse_amount(row[indexes["amount"]], self.locale)
+        else:
+            # Debits are expenses, whether the statement writes them with a sign or not.
+            debit = row[indexes["debit"]].strip() if "debit" in indexes else ""
+            credit = row[indexes["credit"]].strip() if "credit" in indexes else ""
+            amount = (parse_amount(credit, self.locale) if credit else Decimal(0)) - (
+                abs(parse_amount(debit, self.locale)) if debit else Decimal(0)
+            )
+
+        category = row[indexes["category"]].strip() if "category" in indexes else ""
+        return {
+            "amount": -amount if self.negate else amount,
+            "timestamp": parse_date(
+                row[indexes["date"]], self.locale, self.date_format
+            ),
+            "description": (
+                row[indexes["description"]].strip() if "description" in indexes else ""
+            ),
+            "category": category or self.default_category,
+        }
+
+
+def get_profile(name: str) -> ImportProfile:
+    """Returns the import profile with the specified name, built-in or from the settings.
+
+    Raises:
+        CSVImportError: If the profile does not exist.
+    """
+    from budgetize import SettingsManager
+
+    profiles = SettingsManager().get_import_profiles()
+    if name not in profiles:
+        raise CSVImportError(
+            f"Unknown import profile '{name}'. Available: {', '.join(sorted(profiles))}"
+        )
+
+    return ImportProfile(name, profiles[name])
+
+
+def parse_chunk(
+    chunk: Chunk, profile: ImportProfile, indexes: dict[str, int]
+) -> tuple[list[dict], RowErrors]:
+    """Parses and validates a chunk of rows. Runs in the processes of the pool.
+
+    Args:
+        chunk (Chunk): The rows, with their line numbers.
+        profile (ImportProfile): The profile of the statement.
+        indexes (dict[str, int]): The index of the column of each field.
+
+    Returns:
+        tuple[list[dict], RowErrors]: The transactions of the valid rows and the errors
+        of the invalid ones.
+    """
+    transactions = []
+    errors = []
+    width = max(indexes.values()) + 1
+    for line, row in chunk:
+        if len(row) < width:
+            errors.append((line, f"Expected {width} columns, found {len(row)}"))
+            continue
+
+        try:
+            transactions.append(profile.parse_row(row, indexes))
+        except ValueError as e:
+            errors.append((line, str(e)))
+
+    return transactions, errors
+
+
+# ======================== PIPELINE ========================
+
+
+class ImportResult:
+    """Outcome of the import of a statement."""
+
+    def __init__(self, path: str, profile: str) -> None:
+        self.path = path
+        self.profile = profile
+        self.rows = 0
+        self.imported = 0
+        self.skipped = 0
+        self.merged = 0
+        self.invalid = 0
+        self.errors: RowErrors = []
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Returns the rows of the statement processed per second."""
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def add_errors(self, errors: RowErrors) -> None:
+        """Counts the invalid rows, keeping the first `MAX_REPORTED_ERRORS` errors."""
+        self.invalid += len(errors)
+        self.errors.extend(errors[: MAX_REPORTED_ERRORS - len(self.errors)])
+
+    def to_dict(self) -> dict:
+        """Returns the result as a JSON serializable dict."""
+        return {
+            "file": self.path,
+            "profile": self.profile,
+            "rows": self.rows,
+            "imported": self.imported,
+            "skipped": self.skipped,
+            "merged": self.merged,
+            "invalid": self.invalid,
+            "seconds": round(self.elapsed, 3),
+            "rows_per_second": round(self.rows_per_second),
+        }
+
+
+class CSVImporter:
+    """Imports CSV statements into the transactions of an account.
+
+    Parameters
+    ----------
+    db : Database
+        The database where the transactions are inserted.
+    profile : ImportProfile
+        The mapping of the columns of the statements.
+    chunk_size : int
+        The rows parsed at a time.
+    workers : int
+        The processes that parse large statements. Defaults to the number of CPUs.
+    """
+
+    def __init__(
+        self,
+        db: "Database",
+        profile: ImportProfile,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        workers: Optional[int] = None,
+    ) -> None:
+        self.db = db
+        self.profile = profile
+        self.chunk_size = chunk_size
+        self.workers = workers or os.cpu_count() or 1
+
+    def run(
+        self,
+        path: str,
+        account_id: int,
+        skip_invalid: bool = False,
+        dry_run: bool = False,
+        on_duplicate: str = "skip",
+    ) -> ImportResult:
+        """Imports a statement.
+
+        Args:
+            path (str): The path of the CSV file.
+            account_id (int): The account of the transactions.
+            skip_invalid (bool): If True, valid rows are imported even if others are invalid.
+                Otherwise, nothing is imported if any row is invalid.
+            dry_run (bool): If True, the statement is only parsed and validated.
+            on_duplicate (str): What to do with the transactions already in the ledger:
+                "skip", "merge" or "insert" (see `Database.bulk_add_transactions`).
+
+        Returns:
+            ImportResult: The rows read, imported, skipped, merged and invalid, with the
+            throughput.
+
+        Raises:
+            CSVImportError: If the statement can not be read, or has invalid rows and
+                `skip_invalid` is False.
+        """
+        result = ImportResult(path, self.profile.name)
+        started_at = time.perf_counter()
+        parallel = self.workers > 1 and os.path.getsize(path) >= IMPORT_PARALLEL_BYTES
+
+        with open(path, encoding=self.profile.encoding, newline="") as f:
+            for _ in range(self.profile.skip_rows):
+                f.readline()
+
+            reader = csv.reader(f, delimiter=self.profile.delimiter)
+            header = next(reader, None) if self.profile.header else None
+            indexes = self.profile.resolve_columns(header)
+
+            chunks = self._read_chunks(reader, result)
+            parsed = (
+                self._parse_in_pool(chunks, indexes)
+                if parallel
+                else (parse_chunk(chunk, self.profile, indexes) for chunk in chunks)
+            )
+            transactions = self._validate(parsed, account_id, result, skip_invalid)
+
+            if dry_run:
+                result.imported = sum(1 for _ in transactions)
+            else:
+                added = self.db.bulk_add_transactions(
+                    transactions, on_duplicate=on_duplicate
+                )
+                result.imported = added["added"]
+                result.skipped = added["skipped"]
+                result.merged = added["merged"]
+
+        result.elapsed = time.perf_counter() - started_at
+        logger.info(
+            "Imported %s of %s rows from %s (%s duplicates) in %.2f s (%.0f rows/s, %s)",
+            result.imported,
+            result.rows,
+            path,
+            result.skipped + result.merged,
+            result.elapsed,
+            result.rows_per_second,
+            f"{self.workers} processes" if parallel else "1 process",
+        )
+        return result
+
+    def _read_chunks(self, reader: Any, result: ImportResult) -> Iterator[Chunk]:
+        """Yields the non-empty rows of the statement in chunks, with their line numbers."""
+        chunk: Chunk = []
+        for row in reader:
+            if not any(field.strip() for field in row):
+                continue
+
+            chunk.append((reader.line_num, row))
+            if len(chunk) >= self.chunk_size:
+                result.rows += len(chunk)
+                yield chunk
+                chunk = []
+
+        if chunk:
+            result.rows += len(chunk)
+            yield chunk
+
+    def _parse_in_pool(
+        self, chunks: Iterator[Chunk], indexes: dict[str, int]
+    ) -> Iterator[tuple[list[dict], RowErrors]]:
+        """Parses the chunks in a pool of processes, yielding the results in order.
+
+        Only a couple of chunks per process are in flight, so memory stays bounded while
+        the main process inserts the previous ones.
+        """
+        executor = ProcessPoolExecutor(max_workers=self.workers)
+        pending: deque[Future] = deque()
+        try:
+            for chunk in chunks:
+                pending.append(
+                    executor.submit(parse_chunk, chunk, self.profile, indexes)
+                )
+                if len(pending) >= self.workers * 2:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def _validate(
+        self,
+        parsed: Iterable[tuple[list[dict], RowErrors]],
+        account_id: int,
+        result: ImportResult,
+        skip_invalid: bool,
+    ) -> Iterator[dict]:
+        """Yields the transactions of the valid rows, stopping at the first invalid one unless skipped.
+
+        Raising while the transactions are inserted rolls back the whole import.
+        """
+        for transactions, errors in parsed:
+            if errors:
+                result.add_errors(errors)
+                if not skip_invalid:
+                    line, message = errors[0]
+                    raise CSVImportError(f"Line {line}: {message}")
+
+            for transaction in transactions:
+                transaction["account_id"] = account_id
+                yield transaction
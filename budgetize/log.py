@@ -0,0 +1,134 @@
+"""Module that configures the logging of Budgetize.
+
+Log records are put in a queue by the thread that logs them, and written to disk by a
+background listener thread, so the UI never waits for the log file. The log is rotated
+by size (or by time) so it does not grow without bound.
+
+The level is read from the `BUDGETIZE_LOG_LEVEL` environment variable, or the "logging"
+key of the settings file. Use lazy %-style arguments in hot paths, e.g.
+`logger.debug("Rates: %s", rates)`, so the message is only built if it is logged.
+"""
+
+import copy
+import logging
+import os
+import queue
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
+from typing import Optional
+
+from budgetize.consts import (
+    APP_FOLDER_PATH,
+    DEFAULT_LOGGING_SETTINGS,
+    LOG_FILE_NAME,
+    LOG_LEVEL_ENV_VAR,
+)
+
+LOG_FORMAT = "[%(asctime)s ] (%(module)s.%(funcName)s | %(levelname)s) %(message)s"
+DATE_FORMAT = "%d/%m/%Y @ %H:%M:%S %Z"
+
+
+class LocalQueueHandler(QueueHandler):
+    """Queue handler for a listener in the same process.
+
+    `QueueHandler` fully formats every record before queueing it, so it can be pickled.
+    Records never leave the process here, so only the message is merged with its
+    arguments (they could change before the listener runs). Timestamps, tracebacks and
+    the final line are formatted by the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def create_file_handler(
+    log_path: str, settings: Optional[dict] = None
+) -> logging.Handler:
+    """Creates the handler that writes the log file, rotating it by size or by time.
+
+    Args:
+        log_path (str): The path of the log file.
+        settings (dict): Overrides for `budgetize.consts.DEFAULT_LOGGING_SETTINGS`.
+
+    Returns:
+        logging.Handler: The file handler, with the log format set.
+    """
+    log_settings = {**DEFAULT_LOGGING_SETTINGS, **(settings or {})}
+
+    handler: logging.Handler
+    if log_settings["when"]:
+        handler = TimedRotatingFileHandler(
+            log_path,
+            when=log_settings["when"],
+            backupCount=log_settings["backup_count"],
+            encoding="utf-8",
+        )
+    else:
+        handler = RotatingFileHandler(
+            log_path,
+            maxBytes=log_settings["max_bytes"],
+            backupCount=log_settings["backup_count"],
+            encoding="utf-8",
+        )
+
+    handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
+    return handler
+
+
+def get_log_level(settings: Optional[dict] = None) -> str:
+    """Returns the configured log level. The environment variable takes precedence over the settings."""
+    log_settings = {**DEFAULT_LOGGING_SETTINGS, **(settings or {})}
+    return str(os.environ.get(LOG_LEVEL_ENV_VAR) or log_settings["level"]).upper()
+
+
+def setup_logging(
+    level: Optional[str] = None, log_path: Optional[str] = None
+) -> QueueListener:
+    """Sends every log record to the rotating log file through a background thread.
+
+    Replaces any handler of the root logger. Call `stop()` on the returned listener before
+    exiting so the queued records are written. Unknown levels fall back to INFO.
+
+    Args:
+        level (str): The minimum level logged. Defaults to the configured level.
+        log_path (str): The path of the log file. Defaults to the log of the app folder.
+
+    Returns:
+        QueueListener: The started listener that writes the records.
+    """
+    # Imported here so the settings (and Budget) are only loaded by the entry points.
+    from budgetize.settings_manager import SettingsManager
+
+    settings = SettingsManager().get_logging_settings()
+    file_handler = create_file_handler(
+        log_path or os.path.join(APP_FOLDER_PATH, LOG_FILE_NAME), settings
+    )
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler)
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+
+    level_name = level.upper() if level else get_log_level(settings)
+    # getLevelName() returns the number of known levels, and a "Level X" string otherwise.
+    known_level = isinstance(logging.getLevelName(level_name), int)
+
+    root.addHandler(LocalQueueHandler(log_queue))
+    root.setLevel(level_name if known_level else logging.INFO)
+
+    listener.start()
+    if not known_level:
+        logging.getLogger(__name__).warning(
+            "Unknown log level %r. Logging at INFO instead.", level_name
+        )
+    return listener
@@ -0,0 +1,57 @@
+"""Helpers to convert amounts between floats and integer minor units (e.g. cents).
+
+Amounts are stored as integers scaled by the currency exponent, so sums are exact and
+run as integer aggregates in SQLite. Floats are only produced to format amounts.
+"""
+
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
+from typing import Union
+
+from babel.numbers import get_currency_precision
+
+
+@lru_cache(maxsize=None)
+def get_currency_exponent(currency: str) -> int:
+    """Returns the amount of decimal places used by the currency (2 for USD, 0 for JPY...)."""
+    return int(get_currency_precision(currency))
+
+
+def to_minor_units(amount: Union[float, str], currency: str) -> int:
+    """Converts an amount of the specified currency to integer minor units.
+
+    Args:
+        amount (float | str): The amount to convert. Strings are accepted since inputs return them.
+        currency (str): The currency of the amount.
+
+    Returns:
+        int: The amount in minor units, rounded half away from zero.
+    """
+    return scale_to_minor_units(amount, get_currency_exponent(currency))
+
+
+def scale_to_minor_units(amount: Union[float, str], exponent: int) -> int:
+    """Converts an amount to integer minor units of the specified exponent.
+
+    Args:
+        amount (float | str): The amount to convert.
+        exponent (int): The decimal places of the minor units, e.g. 2 for cents.
+
+    Returns:
+        int: The amount in minor units, rounded half away from zero.
+    """
+    scaled = Decimal(str(amount)).scaleb(exponent)
+    return int(scaled.quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def from_minor_units(amount: int, currency: str) -> float:
+    """Converts integer minor units of the specified currency back to a float amount.
+
+    Args:
+        amount (int): The amount in minor units.
+        currency (str): The currency of the amount.
+
+    Returns:
+        float: The amount in major units.
+    """
+    return amount / float(10 ** get_currency_exponent(currency))
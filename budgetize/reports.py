@@ -0,0 +1,258 @@
+"""Period reports: totals of each category and month, quarter or year in the base currency.
+
+A report is built in two stages:
+
+1. Aggregation: SQLite sums the visible transactions of each month, category and account
+   over an index that covers the query (`Database.get_period_report_cells`), so a report
+   reads a row per cell instead of a row per transaction, however long the history is.
+2. Pivot: the cells are loaded into NumPy arrays, converted to the base currency with a
+   factor per account and binned by period and category with a single vectorized
+   group-by (`numpy.bincount`).
+
+NumPy is slow to import, so this module is only imported by the commands that build reports.
+"""
+
+import logging
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+from budgetize.consts import REPORT_KINDS, REPORT_PERIODS
+from budgetize.money import get_currency_exponent
+from budgetize.utils import _
+
+if TYPE_CHECKING:
+    from budgetize.db.database import Database
+
+logger = logging.getLogger(__name__)
+
+# Periods per year, used to number the periods consecutively across years.
+_PERIODS_PER_YEAR = {"month": 12, "quarter": 4, "year": 1}
+
+
+def get_period_keys(year_months: np.ndarray, period: str) -> np.ndarray:
+    """Returns the consecutive number of the period of each month.
+
+    Args:
+        year_months (np.ndarray): Months as YYYYMM integers, e.g. 202610.
+        period (str): One of `REPORT_PERIODS`.
+
+    Returns:
+        np.ndarray: The number of the period, e.g. year * 4 + quarter - 1 for quarters.
+    """
+    per_year = _PERIODS_PER_YEAR[period]
+    years = year_months // 100
+    months = year_months % 100
+    keys: np.ndarray = years * per_year + (months - 1) * per_year // 12
+    return keys
+
+
+def format_period(key: int, period: str) -> str:
+    """Returns the label of a period number, e.g. "2026-10", "2026-Q4" or "2026"."""
+    if period == "month":
+        return f"{key // 12}-{key % 12 + 1:02}"
+    if period == "quarter":
+        return f"{key // 4}-Q{key % 4 + 1}"
+    return str(key)
+
+
+class PeriodReport:
+    """Totals of each category and period, in the base currency.
+
+    Parameters
+    ----------
+    period : str
+        One of `REPORT_PERIODS`.
+
+    kind : str
+        One of `REPORT_KINDS`. Expenses are positive amounts.
+
+    categories : list[str]
+        The categories, with the highest total first.
+
+    periods : list[str]
+        The labels of the periods, in chronological order. Periods without transactions
+        are included, so averages count them.
+
+    values : np.ndarray
+        The totals, with a row per category and a column per period.
+    """
+
+    def __init__(
+        self,
+        period: str,
+        kind: str,
+        categories: list[str],
+        periods: list[str],
+        values: np.ndarray,
+    ):
+        self.period = period
+        self.kind = kind
+        self.categories = categories
+        self.periods = periods
+        self.values = values
+
+    def get_total(self) -> float:
+        """Returns the total of every category and period."""
+        return float(self.values.sum())
+
+    def get_category_totals(self) -> dict[str, float]:
+        """Returns the total of each category across the periods."""
+        return dict(zip(self.categories, self.values.sum(axis=1).tolist()))
+
+    def get_period_totals(self) -> dict[str, float]:
+        """Returns the total of each period across the categories."""
+        return dict(zip(self.periods, self.values.sum(axis=0).tolist()))
+
+    def get_category_averages(self) -> dict[str, float]:
+        """Returns the average of each category per period."""
+        if not self.periods:
+            return {category: 0.0 for category in self.categories}
+
+        return dict(zip(self.categories, self.values.mean(axis=1).tolist()))
+
+    def to_rows(self) -> Iterator[dict]:
+        """Yields a row per category with its total of each period, its total and average."""
+        totals = self.values.sum(axis=1)
+        averages = totals / len(self.periods) if self.periods else totals
+        for category, values, total, average in zip(
+            self.categories, self.values.tolist(), totals.tolist(), averages.tolist()
+        ):
+            row: dict = {"category": category}
+            row.update(zip(self.periods, (round(value, 2) for value in values)))
+            row["total"] = round(total, 2)
+            row["average"] = round(average, 2)
+            yield row
+
+
+def pivot(
+    cells: list[tuple[int, int, int, int]],
+    account_factors: dict[int, float],
+    period: str,
+    kind: str,
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bins the cells of a report by category and period.
+
+    Args:
+        cells (list[tuple[int, int, int, int]]): The month, category ID, account ID and
+            total in minor units of every cell, as returned by
+            `Database.get_period_report_cells`.
+        account_factors (dict[int, float]): The factor that converts the minor units of
+            each account to the base currency. Cells of other accounts are left out.
+        period (str): One of `REPORT_PERIODS`.
+        kind (str): One of `REPORT_KINDS`.
+        start (int): The first month of the report, e.g. 201701. Defaults to the first cell.
+        end (int): The last month of the report, e.g. 202612. Defaults to the last cell.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: The IDs of the categories, the numbers
+        of the periods (see `get_period_keys`) and the totals, with a row per category
+        and a column per period.
+    """
+    data = np.array(cells, dtype=np.int64).reshape(-1, 4)
+    year_months, category_ids, account_ids, totals = data.T
+
+    # Accounts without a factor, e.g. deleted meanwhile, get 0 and add nothing.
+    factors = np.zeros(max(*account_factors, int(account_ids.max(initial=0)), 0) + 1)
+    factors[list(account_factors)] = list(account_factors.values())
+    amounts = totals * factors[account_ids]
+    if kind == "expenses":
+        amounts = -amounts
+
+    keys = get_period_keys(year_months, period)
+    if not len(keys) and (start is None or end is None):
+        return np.empty(0, dtype=np.int64), keys, np.empty((0, 0))
+
+    first = int(
+        keys.min() if start is None else get_period_keys(np.array(start), period)
+    )
+    last = int(keys.max() if end is None else get_period_keys(np.array(end), period))
+    periods = np.arange(first, last + 1)
+
+    categories, category_index = np.unique(category_ids, return_inverse=True)
+    values = np.bincount(
+        category_index * len(periods) + (keys - first),
+        weights=amounts,
+        minlength=len(categories) * len(periods),
+    ).reshape(len(categories), len(periods))
+
+    # bincount returns integers when there are no cells.
+    return categories, periods, values.astype(np.float64, copy=False)
+
+
+class ReportEngine:
+    """Builds the period reports of a ledger.
+
+    Parameters
+    ----------
+    db : Database
+        The database of the ledger.
+    """
+
+    def __init__(self, db: "Database"):
+        self.db = db
+
+    async def get_account_factors(self) -> dict[int, float]:
+        """(Coroutine) Returns the factor that converts the minor units of each account to
+        the base currency."""
+        accounts = list(self.db.get_accounts())
+        rates = await self.db.get_exchange_rates(
+            account.currency for account in accounts
+        )
+        return {
+            account.id: 10.0 ** -get_currency_exponent(account.currency)
+            / rates[account.currency]
+            for account in accounts
+        }
+
+    def build(
+        self,
+        account_factors: dict[int, float],
+        period: str = "month",
+        kind: str = "expenses",
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        account_ids: Optional[Iterable[int]] = None,
+    ) -> PeriodReport:
+        """Returns the report of the ledger.
+
+        Args:
+            account_factors (dict[int, float]): The factors of the accounts, as returned
+                by `get_account_factors`.
+            period (str): One of `REPORT_PERIODS`.
+            kind (str): One of `REPORT_KINDS`.
+            start (int): The first month, e.g. 201701. Defaults to the first transaction.
+            end (int): The last month, included. Defaults to the last transaction.
+            account_ids (Iterable[int]): Only report the transactions of these accounts.
+
+        Returns:
+            PeriodReport: The report, with the categories sorted by their total.
+        """
+        if period not in REPORT_PERIODS:
+            raise ValueError(f"Unknown report period '{period}'")
+        if kind not in REPORT_KINDS:
+            raise ValueError(f"Unknown report kind '{kind}'")
+
+        cells = self.db.get_period_report_cells(kind, start, end, account_ids)
+        category_ids, periods, values = pivot(
+            cells, account_factors, period, kind, start, end
+        )
+
+        order = np.argsort(-values.sum(axis=1), kind="stable")
+        names = {
+            category_id: name
+            for name, category_id in self.db.get_category_ids().items()
+        }
+        return PeriodReport(
+            period=period,
+            kind=kind,
+            categories=[
+                names.get(int(category_id), _("Uncategorized"))
+                for category_id in category_ids[order]
+            ],
+            periods=[format_period(int(key), period) for key in periods],
+            values=values[order],
+        )
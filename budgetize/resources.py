@@ -0,0 +1,79 @@
+"""Module that locates the data files shipped with Budgetize, such as translations.
+
+Run `python -m budgetize.resources` after adding a translation to regenerate the
+manifest of available languages.
+"""
+
+import json
+import logging
+import os
+from functools import lru_cache
+from importlib.resources import files
+
+logger = logging.getLogger(__name__)
+
+LANGUAGES_MANIFEST = "languages.json"
+
+
+@lru_cache(maxsize=None)
+def get_translations_path() -> str:
+    """Returns the path of the folder with the compiled translations."""
+    return str(files("budgetize").joinpath("translations"))
+
+
+@lru_cache(maxsize=None)
+def get_available_languages() -> list[tuple[str, str]]:
+    """Returns the display name and code of every language the app is translated to.
+
+    The languages are read from the manifest in the translations folder. If it is missing
+    or invalid, the folder is scanned instead, which requires loading Babel's locale data.
+
+    Returns:
+        list[tuple[str, str]]: The display name and code of each language, English first.
+    """
+    manifest = files("budgetize").joinpath("translations").joinpath(LANGUAGES_MANIFEST)
+    try:
+        languages = json.loads(manifest.read_text(encoding="utf-8"))
+        return [(language["name"], language["code"]) for language in languages]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(
+            "Could not read %s (%s). Scanning translations...", LANGUAGES_MANIFEST, e
+        )
+        return scan_languages()
+
+
+def scan_languages() -> list[tuple[str, str]]:
+    """Lists the languages of the translations folder, building their display names with Babel.
+
+    Returns:
+        list[tuple[str, str]]: The display name and code of each language, English first.
+    """
+    from babel import Locale
+
+    translations_path = get_translations_path()
+    languages = [(Locale("en").display_name, "en")]
+    for locale_dir in sorted(os.listdir(translations_path)):
+        if os.path.isdir(os.path.join(translations_path, locale_dir)):
+            languages.append((Locale(locale_dir).display_name.title(), locale_dir))
+
+    return languages
+
+
+def write_languages_manifest() -> str:
+    """Scans the translations folder and saves the available languages to the manifest.
+
+    Returns:
+        str: The path of the manifest.
+    """
+    path = os.path.join(get_translations_path(), LANGUAGES_MANIFEST)
+    languages = [{"name": name, "code": code} for name, code in scan_languages()]
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(languages, f, indent=4, ensure_ascii=False)
+        f.write("\n")
+
+    return path
+
+
+if __name__ == "__main__":
+    print(f"Saved languages manifest to {write_languages_manifest()}")
@@ -3,12 +3,19 @@
 import json
 import os
 from pathlib import Path
-from typing import Optional, TypedDict
-
-from babel import Locale
+from typing import TYPE_CHECKING, Optional, TypedDict
 
 from budgetize import Budget
-from budgetize.consts import APP_FOLDER_PATH, DEFAULT_SETTINGS
+from budgetize.consts import (
+    APP_FOLDER_PATH,
+    DEFAULT_DATABASE_SETTINGS,
+    DEFAULT_IMPORT_PROFILES,
+    DEFAULT_LOGGING_SETTINGS,
+    DEFAULT_SETTINGS,
+)
+
+if TYPE_CHECKING:
+    from babel import Locale
 
 
 class SettingsDict(TypedDict):
@@ -18,6 +25,9 @@ class SettingsDict(TypedDict):
     categories: list[str]
     base_currency: str
     budget: Optional[dict]
+    database: Optional[dict]
+    logging: Optional[dict]
+    import_profiles: Optional[dict]
 
 
 class SettingsManager:
@@ -68,8 +78,10 @@ class SettingsManager:
         self._reload_settings()
         return self._settings["language"]
 
-    def get_locale(self) -> Locale:
+    def get_locale(self) -> "Locale":
         """Returns a Locale object based from the user's selected language."""
+        from babel import Locale
+
         self._reload_settings()
         return Locale(self._settings["language"])
 
@@ -83,6 +95,24 @@ class SettingsManager:
         self._reload_settings()
         return self._settings["categories"]
 
+    def get_database_settings(self) -> dict:
+        """Returns the SQLite performance settings, using the defaults for any missing value."""
+        self._reload_settings()
+        return {**DEFAULT_DATABASE_SETTINGS, **(self._settings.get("database") or {})}
+
+    def get_logging_settings(self) -> dict:
+        """Returns the log level and rotation settings, using the defaults for any missing value."""
+        self._reload_settings()
+        return {**DEFAULT_LOGGING_SETTINGS, **(self._settings.get("logging") or {})}
+
+    def get_import_profiles(self) -> dict[str, dict]:
+        """Returns the CSV import profiles, the user's ones overriding the built-in ones."""
+        self._reload_settings()
+        return {
+            **DEFAULT_IMPORT_PROFILES,
+            **(self._settings.get("import_profiles") or {}),
+        }
+
     def set_categories(self, categories: list[str]) -> None:
         """Sets the user's categories and saves them."""
         self._settings["categories"] = categories
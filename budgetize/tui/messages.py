@@ -0,0 +1,17 @@
+"""Module that defines the Textual messages shared by screens"""
+
+from textual.message import Message
+
+from budgetize.db.events import DatabaseEvent
+
+
+class DatabaseChanged(Message):
+    """Posted to a screen when the database publishes a change event.
+
+    Database events may be published from worker threads, so screens subscribe with a
+    callback that posts this message and handle it in the event loop.
+    """
+
+    def __init__(self, event: DatabaseEvent) -> None:
+        self.event = event
+        super().__init__()
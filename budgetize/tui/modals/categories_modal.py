@@ -8,6 +8,7 @@ from textual.screen import ModalScreen
 from textual.widgets import Button, SelectionList
 
 from budgetize import SettingsManager
+from budgetize.db.async_database import AsyncDatabase
 from budgetize.db.database import Database
 from budgetize.tui.modals.input_modal import InputModal
 from budgetize.utils import _
@@ -16,13 +17,15 @@ from budgetize.utils import _
 class CategoriesModal(ModalScreen):
 
     DB: Database = None  # type: ignore
+    ASYNC_DB: AsyncDatabase = None  # type: ignore
 
     def __init__(self) -> None:
         """Creates a new CategoriesModal instance."""
 
         self.settings = SettingsManager()
-        self.current_categories = self.settings.get_categories()
         CategoriesModal.DB = Database(self.app)
+        CategoriesModal.ASYNC_DB = AsyncDatabase(CategoriesModal.DB)
+        self.current_categories: list[str] = []
         super().__init__()
 
     def compose(self) -> ComposeResult:
@@ -31,18 +34,24 @@ class CategoriesModal(ModalScreen):
         with ScrollableContainer(id="scrollable"):
 
             self.selection_list: SelectionList[str] = SelectionList(
-                *self._get_categories_tuple(), id="categories-list"
+                id="categories-list"
             )
             yield self.selection_list
 
         with Horizontal(id="horizontal"):
             yield Button(_("Add Category"), id="add-category-btn", variant="primary")
             yield Button.error(
-                _("Delete Selected Categories"), id="delstrete-btn", disabled=True
+                _("Delete Selected Categories"), id="delete-btn", disabled=True
             )
             yield Button(_("Close"), id="close-btn")
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def on_mount(self) -> None:
+        """Loads the categories once the modal is mounted."""
+
+        self.current_categories = await self.ASYNC_DB.get_categories()
+        self._update_selection_list()
+
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Triggers when a Button is pressed."""
 
         # TODO: Show confirmation msg
@@ -50,8 +59,10 @@ class CategoriesModal(ModalScreen):
             selected_items = self.selection_list.selected
 
             for category in selected_items:
+                await self.ASYNC_DB.delete_category(category)
                 self.current_categories.remove(category)
 
+            # Keep the settings file in sync so exported data includes the categories.
             self.settings.set_categories(self.current_categories)
             self._update_selection_list()
 
@@ -72,18 +83,14 @@ class CategoriesModal(ModalScreen):
 
         selected_items = event.selection_list.selected
 
-        horizontal_container = self.app.get_child_by_id(
-            "horizontal", expect_type=Horizontal
-        )
-        delete_button = horizontal_container.get_child_by_id(
-            "delete-btn", expect_type=Button
-        )
+        delete_button = self.query_one("#delete-btn", expect_type=Button)
 
         delete_button.disabled = True if not selected_items else False
 
-    def add_category(self, category_name: Any) -> None:
+    async def add_category(self, category_name: Any) -> None:
         """Adds a new category to the list of categories"""
 
+        await self.ASYNC_DB.add_category(category_name)
         self.current_categories.append(category_name)
         self.settings.set_categories(self.current_categories)
         self._update_selection_list()
@@ -97,7 +104,3 @@ class CategoriesModal(ModalScreen):
         self.selection_list.clear_options()
         for category in self.current_categories:
             self.selection_list.add_option((category, category))
-
-    def _get_categories_tuple(self) -> list[tuple[str, str]]:
-        """Returns a list of tuples with the category name in both values"""
-        return [(category, category) for category in self.current_categories]
@@ -54,7 +54,8 @@ class FileSelectorModal(ModalScreen):
         self.selected_path = event.path
         print(f"Selected Path: {self.selected_path}")
         logger.debug(
-            f"Selected Path: {self.selected_path}",
+            "Selected Path: %s",
+            self.selected_path,
         )
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
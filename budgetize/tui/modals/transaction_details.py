@@ -1,10 +1,13 @@
-from arrow import Arrow
 from textual.app import ComposeResult
 from textual.containers import Center, Horizontal
 from textual.screen import ModalScreen
 from textual.widgets import Button, Label
 
+from budgetize.dates import format_date
+from budgetize.db.async_database import AsyncDatabase
 from budgetize.db.database import Database
+from budgetize.db.orm.transactions import Transaction
+from budgetize.money import from_minor_units
 from budgetize.tui.screens.add_transaction import AddTransaction
 from budgetize.utils import _
 
@@ -13,59 +16,84 @@ class TransactionDetails(ModalScreen):
     """Modal screen for displaying transaction details."""
 
     DB: Database = None  # type: ignore
+    ASYNC_DB: AsyncDatabase = None  # type: ignore
     CSS_PATH = "css/transaction_details.tcss"
 
     def __init__(self, transaction_id: int, from_manage_accounts: bool = True) -> None:
         """Creates a new TransactionDetails modal."""
         TransactionDetails.DB = Database(self.app)
-        self.transaction = self.DB.get_transaction_by_id(transaction_id)
+        TransactionDetails.ASYNC_DB = AsyncDatabase(TransactionDetails.DB)
+        self.transaction_id = transaction_id
+        self.transaction: Transaction = None  # type: ignore
         self.from_manage_accounts = from_manage_accounts
 
         super().__init__()
 
     def compose(self) -> ComposeResult:
-
-        if self.transaction.account_id is None:
-            raise RuntimeError("Transaction must have an account_id")
-
         """Called when modal needs to be composed."""
-        date_str = Arrow.fromtimestamp(self.transaction.timestamp).format("MM/DD/YYYY")
 
         with Center(id="dialog"):
             yield Label(
                 _("Transaction #{transaction_id} Details").format(
-                    transaction_id=self.transaction.id
+                    transaction_id=self.transaction_id
                 ),
                 id="title",
             )
-            yield Label(_("Date: {date_str}").format(date_str=date_str))
-            yield Label(
-                _("Account: {account_name}").format(
-                    account_name=self.DB.get_account_by_id(
-                        int(self.transaction.account_id)
-                    ).name
-                )
-            )
-            yield Label(_("Amount: {amt}").format(amt=self.transaction.amount))
-            yield Label(
-                _("Description: {desc}").format(desc=self.transaction.description)
-            )
-            yield Label(
-                _("Category: {category}").format(category=self.transaction.category)
-            )
+            yield Label(id="date-label")
+            yield Label(id="account-label")
+            yield Label(id="amount-label")
+            yield Label(id="description-label")
+            yield Label(id="category-label")
             with Horizontal(id="buttons"):
                 yield Button(_("Close"), id="close-button")
-                yield Button(_("Edit"), id="edit-button", variant="primary")
-                yield Button.error(_("Delete"), id="delete-button")
+                yield Button(
+                    _("Edit"), id="edit-button", variant="primary", disabled=True
+                )
+                yield Button.error(_("Delete"), id="delete-button", disabled=True)
+
+    async def on_mount(self) -> None:
+        """Loads the transaction once the modal is mounted."""
+
+        self.transaction = await self.ASYNC_DB.get_transaction_by_id(
+            self.transaction_id
+        )
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if self.transaction.account_id is None:
+            raise RuntimeError("Transaction must have an account_id")
+
+        date_str = format_date(self.transaction.epoch, "MM/DD/YYYY")
+        account = await self.ASYNC_DB.get_account_by_id(
+            int(self.transaction.account_id)
+        )
+
+        self.query_one("#date-label", Label).update(
+            _("Date: {date_str}").format(date_str=date_str)
+        )
+        self.query_one("#account-label", Label).update(
+            _("Account: {account_name}").format(account_name=account.name)
+        )
+        self.query_one("#amount-label", Label).update(
+            _("Amount: {amt}").format(
+                amt=from_minor_units(self.transaction.amount_minor, account.currency)
+            )
+        )
+        self.query_one("#description-label", Label).update(
+            _("Description: {desc}").format(desc=self.transaction.description)
+        )
+        self.query_one("#category-label", Label).update(
+            _("Category: {category}").format(category=self.transaction.category)
+        )
+        self.query_one("#edit-button", Button).disabled = False
+        self.query_one("#delete-button", Button).disabled = False
+
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Button handler"""
 
         if event.button.id == "close-button":
             self.app.pop_screen()
 
         if event.button.id == "delete-button":
-            self.DB.delete_transaction(self.transaction.id)
+            await self.ASYNC_DB.delete_transaction(self.transaction.id)
             self.app.pop_screen()
 
             if self.from_manage_accounts:
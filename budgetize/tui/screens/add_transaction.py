@@ -12,9 +12,10 @@ from textual.screen import Screen
 from textual.validation import Number
 from textual.widgets import Button, Footer, Header, Input, Label, Select
 
+from budgetize.db.async_database import AsyncDatabase
 from budgetize.db.database import Database
 from budgetize.db.orm.transactions import Transaction
-from budgetize.settings_manager import SettingsManager
+from budgetize.money import from_minor_units
 from budgetize.utils import _
 
 logger = logging.getLogger(__name__)
@@ -26,6 +27,7 @@ class AddTransaction(Screen):
     """Screen that handles adding a new transaction"""
 
     DB: Database = None  # type: ignore
+    ASYNC_DB: AsyncDatabase = None  # type: ignore
     BINDINGS = [
         Binding(
             key="q,Q",
@@ -42,6 +44,7 @@ class AddTransaction(Screen):
             If a transaction is passed, all those details are loaded for the user to edit it.
         """
         AddTransaction.DB = Database(self.app)
+        AddTransaction.ASYNC_DB = AsyncDatabase(AddTransaction.DB)
         self.transaction = transaction
         super().__init__()
 
@@ -54,20 +57,13 @@ class AddTransaction(Screen):
         yield Header()
         yield Footer()
 
+        # The account and category selects are mounted once their options are loaded.
         yield Label(_("Account"), id="account-label")
-        yield Select(
-            self._get_account_options(),
-            id="account-select",
-            allow_blank=False,
-            value=self.transaction.account_id if self.transaction else Select.BLANK,
-            prompt="Select an account",
-        )
         yield Label(_("Amount"), id="amount-label")
         yield Input(
             type="number",
             placeholder="250",
             id="amount-input",
-            value=str(self.transaction.amount) if self.transaction else "",
             validators=[Number(failure_description="Please enter a valid number")],
         )
 
@@ -86,12 +82,6 @@ class AddTransaction(Screen):
             value=transaction_date.format("M/D/YYYY"),
         )
 
-        yield Select(
-            self.get_category_select_options(),
-            allow_blank=False,
-            id="category-select",
-        )
-
         yield Label(_("Description"), id="description-label")
         yield Input(
             max_length=255,
@@ -101,13 +91,36 @@ class AddTransaction(Screen):
         )
 
         lbl = _("Update Transaction") if self.transaction else _("Add Transaction")
-        yield Button(lbl, id="add-transaction-button")
+        yield Button(lbl, id="add-transaction-button", disabled=True)
+
+    async def on_mount(self) -> None:
+        """Loads the accounts and categories once the screen is mounted."""
+        await self.mount(
+            Select(
+                await self._get_account_options(),
+                id="account-select",
+                allow_blank=False,
+                value=self.transaction.account_id if self.transaction else Select.NULL,
+                prompt="Select an account",
+            ),
+            after="#account-label",
+        )
+        await self.mount(
+            Select(
+                await self.get_category_select_options(),
+                allow_blank=False,
+                id="category-select",
+            ),
+            before="#description-label",
+        )
+        self.query_one("#amount-input", Input).value = await self._get_amount_value()
+        self.query_one("#add-transaction-button", Button).disabled = False
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handles button presses"""
         logger.info("Adding Transaction")
         account_selected: int = self.get_widget_by_id("account-select").value  # type: ignore
-        account = self.DB.get_account_by_id(account_selected)
+        account = await self.ASYNC_DB.get_account_by_id(account_selected)
         currency = account.currency
 
         amount = self.get_widget_by_id("amount-input").value  # type: ignore
@@ -119,7 +132,10 @@ class AddTransaction(Screen):
         # If parsing fails, use the current date and time for saving the transaction
 
         logger.debug(
-            f"Amount: {amount}, Category: {category}, Description: {description}",
+            "Amount: %s, Category: %s, Description: %s",
+            amount,
+            category,
+            description,
         )
         date = Arrow.now()
 
@@ -133,7 +149,7 @@ class AddTransaction(Screen):
                 int(date_strs[1]),
             )
             date = Arrow.fromdate(date_from_input)
-            logger.debug(f"Parsed Date (Manually): {date}")
+            logger.debug("Parsed Date (Manually): %s", date)
 
         except Exception:
             traceback_str = format_exc()
@@ -146,7 +162,7 @@ class AddTransaction(Screen):
         self.get_widget_by_id("date-input").value = ""  # type: ignore
 
         if self.transaction:
-            self.DB.update_transaction(
+            await self.ASYNC_DB.update_transaction(
                 transaction_id=self.transaction.id,
                 account_id=account.id,
                 amount=amount,
@@ -161,7 +177,7 @@ class AddTransaction(Screen):
             )
             return
 
-        self.DB.add_transaction(
+        await self.ASYNC_DB.add_transaction(
             account_id=account.id,
             amount=amount,
             description=description,
@@ -178,14 +194,26 @@ class AddTransaction(Screen):
             title=_("Transaction Added"),
         )
 
-    def _get_account_options(self) -> list[tuple[str, int]]:
+    async def _get_amount_value(self) -> str:
+        """Returns the amount of the edited transaction, or an empty string for new ones."""
+        if self.transaction is None or self.transaction.account_id is None:
+            return ""
+
+        account = await self.ASYNC_DB.get_account_by_id(
+            int(self.transaction.account_id)
+        )
+        return str(from_minor_units(self.transaction.amount_minor, account.currency))
+
+    async def _get_account_options(self) -> list[tuple[str, int]]:
         """Returns a list of tuples (name, id) for the TUI to show"""
-        return [(account.name, account.id) for account in self.DB.get_accounts()]
+        return [
+            (account.name, account.id) for account in await self.ASYNC_DB.get_accounts()
+        ]
 
-    def get_category_select_options(self) -> list[tuple[str, str]]:
+    async def get_category_select_options(self) -> list[tuple[str, str]]:
         """Returns a list of tuples (name, id) for the TUI to show"""
         categories = []
-        for category in SettingsManager().get_categories():
+        for category in await self.ASYNC_DB.get_categories():
             categories.append((category, category))
 
         return categories
@@ -9,6 +9,7 @@ from textual.screen import Screen
 from textual.validation import Number
 from textual.widgets import Button, Footer, Header, Input, Label, Select
 
+from budgetize.db.async_database import AsyncDatabase
 from budgetize.db.database import Database
 from budgetize.tui.modals.error_modal import ErrorModal
 from budgetize.utils import _, get_select_currencies
@@ -22,6 +23,7 @@ class CreateAccount(Screen):
     CSS_PATH = "css/create_account.tcss"
 
     DB: Database = None  # type: ignore
+    ASYNC_DB: AsyncDatabase = None  # type: ignore
     BINDINGS = [
         Binding(
             key="c,C",
@@ -34,6 +36,7 @@ class CreateAccount(Screen):
     def __init__(self) -> None:
         """Creates a new CreateAccount Screen"""
         CreateAccount.DB = Database(self.app)
+        CreateAccount.ASYNC_DB = AsyncDatabase(CreateAccount.DB)
         super().__init__()
 
     def action_pop_screen(self) -> None:
@@ -77,16 +80,16 @@ class CreateAccount(Screen):
             ),
         )
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Button press handlers"""
         if event.button.id == "create-account-button":
             name: str = self.get_widget_by_id("account-name-input").value  # type: ignore
             currency: str = self.get_widget_by_id("currency-select").value  # type: ignore
             starting_balance: float = self.get_widget_by_id("balance-input").value  # type: ignore
 
-            logger.debug(f"Creating Account: {name} {currency} {starting_balance}")
+            logger.debug("Creating Account: %s %s %s", name, currency, starting_balance)
 
-            if self.DB.account_name_exists(name):
+            if await self.ASYNC_DB.account_name_exists(name):
                 logger.warning("Account Name already exists! Showing error")
                 self.app.push_screen(
                     ErrorModal(
@@ -98,7 +101,7 @@ class CreateAccount(Screen):
                 )
                 return
 
-            self.DB.add_account(
+            await self.ASYNC_DB.add_account(
                 name=name,
                 currency=currency,
                 starting_balance=starting_balance,
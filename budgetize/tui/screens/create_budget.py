@@ -9,6 +9,7 @@ from textual.screen import Screen
 from textual.widgets import Button, Header, Input, Label, Select
 
 from budgetize.budget import Budget
+from budgetize.db.database import Database
 from budgetize.settings_manager import SettingsManager
 from budgetize.utils import _
 
@@ -69,7 +70,7 @@ class CreateBudget(Screen):
                     id="category-select",
                     options=[
                         (category, category)
-                        for category in SettingsManager().get_categories()
+                        for category in Database(self.app).get_categories()
                     ],
                     allow_blank=False,
                 )
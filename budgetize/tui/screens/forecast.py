@@ -0,0 +1,148 @@
+"""Module that defines the screen with the cash-flow forecast"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Optional
+
+from babel.numbers import format_currency
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.screen import Screen
+from textual.widgets import DataTable, Footer, Header, Label
+
+from budgetize import SettingsManager
+from budgetize.db.database import Database
+from budgetize.exceptions import ExchangeRateFetchError
+from budgetize.utils import _
+
+if TYPE_CHECKING:
+    from budgetize.forecast import Forecast
+
+logger = logging.getLogger(__name__)
+
+
+class ForecastScreen(Screen):
+    """Screen that shows the balance of each account and the net worth at the end of the next months."""
+
+    DB: Database = None  # type: ignore
+    CSS_PATH = "css/forecast.tcss"
+
+    BINDINGS = [
+        Binding(
+            key="escape",
+            key_display="ESC",
+            action="pop_screen",
+            description=_("Back to Main Menu"),
+        ),
+        Binding(
+            key="b,B",
+            key_display="B",
+            action="switch_scenario()",
+            description=_("Switch Scenario"),
+        ),
+    ]
+
+    def __init__(self) -> None:
+        """Creates a new ForecastScreen"""
+        ForecastScreen.DB = Database(self.app)
+        self.forecast: Optional["Forecast"] = None
+        self.scenario = "seasonal"
+        self.locale = SettingsManager().get_locale()
+        super().__init__()
+
+    def compose(self) -> ComposeResult:
+        """Called when screen is composed"""
+        logger.info("Composing ForecastScreen...")
+        self.app.sub_title = _("Cash-flow Forecast")
+        yield Header()
+        yield Footer()
+
+        yield Label(_("Forecasting..."), id="forecast-label")
+        yield DataTable(id="forecast-table", cursor_type="row")
+
+    def on_mount(self) -> None:
+        """Called when the screen is mounted"""
+        self.run_worker(self._load_forecast, exclusive=True)  # type: ignore
+
+    def action_switch_scenario(self) -> None:
+        """Shows the next scenario of the forecast"""
+        if self.forecast is None or len(self.forecast.scenarios) < 2:
+            self.notify(
+                title=_("No Budget"),
+                message=_("Create a budget to forecast spending its limits."),
+                severity="warning",
+            )
+            return
+
+        scenarios = self.forecast.scenarios
+        self.scenario = scenarios[(scenarios.index(self.scenario) + 1) % len(scenarios)]
+        self._show_forecast()
+
+    async def _load_forecast(self) -> None:
+        """(Coroutine) Builds the forecast outside the event loop and shows it."""
+        # Imported here, NumPy is slow to import and only this screen needs it.
+        from budgetize.forecast import ForecastEngine
+
+        label = self.query_one("#forecast-label", expect_type=Label)
+        engine = ForecastEngine(ForecastScreen.DB)
+        try:
+            rates = await engine.get_rates()
+        except ExchangeRateFetchError as e:
+            label.update(str(e))
+            return
+
+        self.forecast = await asyncio.to_thread(
+            engine.build, rates, SettingsManager().load_budget()
+        )
+        self._show_forecast()
+
+    def _show_forecast(self) -> None:
+        """Fills the table with the balances of the selected scenario"""
+        if self.forecast is None:
+            return
+
+        forecast = self.forecast
+        index = forecast.scenarios.index(self.scenario)
+        table = self.query_one("#forecast-table", expect_type=DataTable)
+        table.clear(columns=True)
+        table.add_columns(_("Account"), *forecast.months)
+
+        rows = list(
+            zip(
+                forecast.accounts,
+                forecast.currencies,
+                forecast.balances[index].tolist(),
+            )
+        )
+        rows.append(
+            (
+                _("[bold]Net worth[/bold]"),
+                forecast.base_currency,
+                forecast.net_worth[index].tolist(),
+            )
+        )
+        for name, currency, balances in rows:
+            table.add_row(
+                name,
+                *(
+                    f"{'[red]' if balance < 0 else ''}"
+                    f"{format_currency(balance, currency, locale=self.locale)}"
+                    for balance in balances
+                ),
+            )
+
+        month, lowest = forecast.get_lowest_net_worth(self.scenario)
+        scenario_names = {
+            "seasonal": _("Seasonal averages"),
+            "budget": _("Spending the budget limits"),
+        }
+        label = self.query_one("#forecast-label", expect_type=Label)
+        label.update(
+            _("Scenario: {scenario}. Lowest net worth: {amount} in {month}.").format(
+                scenario=scenario_names[self.scenario],
+                amount=format_currency(
+                    lowest, forecast.base_currency, locale=self.locale
+                ),
+                month=month,
+            )
+        )
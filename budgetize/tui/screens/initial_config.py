@@ -19,6 +19,7 @@ from budgetize.consts import (
     EXPORT_DATA_EXTENSION,
     TRANSLATIONS_PATH,
 )
+from budgetize.db.async_database import AsyncDatabase
 from budgetize.db.database import Database
 from budgetize.settings_manager import SettingsDict, SettingsManager
 from budgetize.tui.modals.file_selector_modal import FileSelectorModal
@@ -36,7 +37,7 @@ try:
     else:
         default_locale = default_locale.split("_")[0]
 except Exception as e:
-    logger.error(f"Error getting default locale: {e}")
+    logger.error("Error getting default locale: %s", e)
     default_locale = "en"
 
 t = gettext.translation(
@@ -86,8 +87,8 @@ class InitialConfig(Screen):
                 expect_type=Select,
             ).value
 
-            logger.debug(f"Selected currency: {currency}")
-            logger.debug(f"Selected language: {language}")
+            logger.debug("Selected currency: %s", currency)
+            logger.debug("Selected language: %s", language)
             # This should never happen at runtime
             if isinstance(language, NoSelection) or isinstance(currency, NoSelection):
                 return
@@ -98,8 +99,11 @@ class InitialConfig(Screen):
                 "base_currency": str(currency),
                 "categories": settings.get_categories(),
                 "budget": None,
+                "database": settings.get_settings_dict().get("database"),
+                "logging": settings.get_settings_dict().get("logging"),
+                "import_profiles": settings.get_settings_dict().get("import_profiles"),
             }
-            logger.debug(f"Saving settings: {new_settings}")
+            logger.debug("Saving settings: %s", new_settings)
             settings.save(new_settings)
 
             self.show_modal(language)
@@ -119,9 +123,9 @@ class InitialConfig(Screen):
 
             self.app.push_screen(fs, callback=self.process_file_selector_result)
 
-    def process_file_selector_result(self, path: Any) -> None:
+    async def process_file_selector_result(self, path: Any) -> None:
         """Process the result of the file selector modal."""
-        logging.debug(f"Exported Data selected: {path}")
+        logger.debug("Exported Data selected: %s", path)
 
         selected_path: Path = path  # type: ignore
         _ = gettext.translation(
@@ -141,9 +145,11 @@ class InitialConfig(Screen):
 
         data = self.get_export_data_as_dict(path)
         settings = SettingsManager()
-        db = Database(self.app)
+        db = AsyncDatabase(Database(self.app))
 
-        db.populate_from_dict(data["database"])
+        await db.populate_from_dict(data["database"])
+        for category in data["settings"]["categories"]:
+            await db.add_category(category)
         settings.save(data["settings"])  # type: ignore
 
         self.show_modal(language=data["settings"]["language"])
@@ -21,31 +21,42 @@ from textual.widgets import (
     TabbedContent,
     TabPane,
 )
-from textual.widgets.data_table import CellKey
+from textual.widgets.data_table import CellDoesNotExist, CellKey
 
 from budgetize import CurrencyManager, SettingsManager
 from budgetize.consts import RICH_COLORS
+from budgetize.dates import format_date, get_year_month
+from budgetize.db.async_database import AsyncDatabase
 from budgetize.db.database import Database
+from budgetize.db.events import (
+    AccountsChanged,
+    CategoriesChanged,
+    DatabaseEvent,
+    TransactionsChanged,
+)
 from budgetize.exceptions import ExchangeRateFetchError
+from budgetize.money import from_minor_units
+from budgetize.tui.messages import DatabaseChanged
 from budgetize.tui.modals.confirm_modal import ConfirmModal
 from budgetize.tui.modals.error_modal import ErrorModal
 from budgetize.tui.modals.transaction_details import TransactionDetails
 from budgetize.tui.screens.add_transaction import AddTransaction
 from budgetize.tui.screens.create_budget import CreateBudget
+from budgetize.tui.screens.forecast import ForecastScreen
 from budgetize.tui.screens.manage_accounts import ManageAccounts
+from budgetize.tui.screens.search import SearchScreen
 from budgetize.tui.screens.settings import Settings
 from budgetize.tui.screens.transfer import TransferScreen
+from budgetize.tui.startup import StartupScheduler
 from budgetize.utils import _
 
 logger = logging.getLogger(__name__)
-BUDGET_MSG = _(
-    """Need a Budget? Let's get to action.
+BUDGET_MSG = _("""Need a Budget? Let's get to action.
 With a budget you can:
 - Track every cent coming in and going out of your accounts.
 - Add limits to expend on each category.
 - Get reports of how much you have been following your budget.
-"""
-)
+""")
 
 
 class MainMenu(Screen):
@@ -53,6 +64,7 @@ class MainMenu(Screen):
 
     TOTAL_SPENT = 0
     DB: Database = None  # type: ignore
+    ASYNC_DB: AsyncDatabase = None  # type: ignore
     CSS_PATH = "css/main_menu.tcss"
     BINDINGS = [
         Binding(
@@ -73,13 +85,27 @@ class MainMenu(Screen):
             action="show_settings()",
             description=_("Open Settings"),
         ),
+        Binding(
+            key="f,F",
+            key_display="F",
+            action="search_transactions()",
+            description=_("Search Transactions"),
+        ),
+        Binding(
+            key="c,C",
+            key_display="C",
+            action="show_forecast()",
+            description=_("Cash-flow Forecast"),
+        ),
     ]
 
     def __init__(self) -> None:
         """Creates a new MainMenu Screen"""
         super().__init__()
         MainMenu.DB = Database(self.app)
+        MainMenu.ASYNC_DB = AsyncDatabase(MainMenu.DB)
         self.rates_fetched = False
+        self.rates_version = 0
         self.is_quitting = False
 
         # Keys for storing actual values to show main currency
@@ -88,6 +114,18 @@ class MainMenu(Screen):
         self.last_recent_transactions_key: Optional[CellKey] = None
         self.last_recent_transactions_value: str = "None"
 
+        # What is currently shown, to only update what changed since the last render
+        self.rendered_state: dict[str, Any] = {}
+        self.rendered_accounts: dict[str, tuple] = {}
+        self.rendered_transactions: dict[str, tuple] = {}
+        self.budget_colors: dict[int, str] = {}
+
+        # Database changes waiting to be patched into the widgets
+        self.pending_tables: set[str] = set()
+        self.pending_account_ids: set[int] = set()
+        self.pending_year_months: set[int] = set()
+        self.applying_database_changes = False
+
     def compose(self) -> ComposeResult:
         """Called when screen is composed"""
         logger.info("Composing MainMenu...")
@@ -149,7 +187,24 @@ class MainMenu(Screen):
                 yield DataTable(id="recent-transactions-table")
 
             with TabPane(_("Budgets"), id="budgets-tab"):
-                pass
+                # Only the widgets of either class are shown, depending on whether a budget exists.
+                with Center(id="limits-center"):
+                    yield Label(BUDGET_MSG, id="budget-msg", classes="no-budget")
+                    yield Button(
+                        "Create Budget", id="create-budget-btn", classes="no-budget"
+                    )
+                    yield Label(_("Current Budget Progress"), classes="budget")
+                    yield ProgressBar(
+                        show_eta=False, id="budget-progress", classes="budget"
+                    )
+                    yield Horizontal(id="budget-labels-horizontal", classes="budget")
+                    yield Button("Edit Budget", id="edit-budget-btn", classes="budget")
+                    yield Button(
+                        "Delete Budget",
+                        id="delete-budget-btn",
+                        variant="error",
+                        classes="budget",
+                    )
 
     # ================== Textual Events ==================
 
@@ -161,13 +216,34 @@ class MainMenu(Screen):
         self.last_recent_transactions_key = None
         self.last_recent_transactions_value = ""
 
+        accounts_table = self.query_one("#accounts-table", expect_type=DataTable)
+        accounts_table.add_column(_("Account Name"), key="name")
+        accounts_table.add_column(_("Balance"), key="balance")
+
+        transactions_table = self.query_one(
+            "#recent-transactions-table", expect_type=DataTable
+        )
+        transactions_table.add_column(_("Account"), key="account")
+        transactions_table.add_column(_("Amount"), key="amount")
+        transactions_table.add_column(_("Date"), key="date")
+        transactions_table.add_column(_("Category"), key="category")
+        transactions_table.add_column(_("Description"), key="description")
+
+        Database.events.subscribe(DatabaseEvent, self._post_database_change)
+
         logger.info("Runnning background worker for updating UI...")
 
+    def on_unmount(self) -> None:
+        """Called when the screen is removed"""
+        Database.events.unsubscribe(DatabaseEvent, self._post_database_change)
+
     def after_layout(self) -> None:
         self.run_worker(self.update_ui_info, exclusive=True)  # type: ignore
 
     def on_screen_resume(self) -> None:
         """Called when the screen is now the current screen"""
+        self._restore_highlighted_balance()
+
         # Reset key values to avoid crashes
         self.last_account_key = None
         self.last_account_value = "None"
@@ -177,7 +253,7 @@ class MainMenu(Screen):
         self.app.sub_title = _("Main Menu")
         self.run_worker(self.update_ui_info, exclusive=True)  # type: ignore
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Button press handler"""
         if event.button.id == "create-account-button":
             self.app.push_screen("create_account")
@@ -185,8 +261,8 @@ class MainMenu(Screen):
             self.rates_fetched = False
 
         if event.button.id == "manage-accounts-button":
-            accounts = self.DB.get_accounts()
-            if sum(1 for _ in accounts) > 0:  # Get the length of the generator
+            accounts = await self.ASYNC_DB.get_accounts()
+            if accounts:
                 self.app.push_screen(ManageAccounts())
             else:
                 self.app.notify(
@@ -206,7 +282,7 @@ class MainMenu(Screen):
             self.app.push_screen(CreateBudget(budget=settings_manager.load_budget()))
 
         if event.button.id == "transaction-button":
-            self.action_verify_add_transaction()
+            await self.action_verify_add_transaction()
 
         if event.button.id == "delete-budget-btn":
             settings_manager = SettingsManager()
@@ -219,6 +295,88 @@ class MainMenu(Screen):
 
             self.after_layout()
 
+    def _post_database_change(self, event: DatabaseEvent) -> None:
+        """Forwards a database event to the screen. May be called from a database thread."""
+        self.post_message(DatabaseChanged(event))
+
+    def on_database_changed(self, message: DatabaseChanged) -> None:
+        """Queues the database change to patch the affected widgets."""
+        # Until the first render, update_ui_info renders everything.
+        if not self.rendered_state:
+            return
+
+        event = message.event
+        if isinstance(event, AccountsChanged):
+            self.pending_tables.add("accounts")
+        elif isinstance(event, TransactionsChanged):
+            self.pending_tables.add("transactions")
+            self.pending_account_ids |= event.account_ids
+            self.pending_year_months |= event.year_months
+        elif isinstance(event, CategoriesChanged):
+            self.pending_tables.add("categories")
+
+        if not self.applying_database_changes:
+            self.applying_database_changes = True
+            self.run_worker(self._apply_database_changes, group="database-changes")  # type: ignore
+
+    async def _apply_database_changes(self) -> None:
+        """(Coroutine) Patches the widgets affected by the queued database changes."""
+        try:
+            while self.pending_tables:
+                versions = self.DB.get_versions()
+                tables = self.pending_tables
+                account_ids = self.pending_account_ids
+                year_months = self.pending_year_months
+                self.pending_tables = set()
+                self.pending_account_ids = set()
+                self.pending_year_months = set()
+                logger.info(
+                    "Patching changes of %s in accounts %s and months %s",
+                    tables,
+                    account_ids,
+                    year_months,
+                )
+
+                # Balances are about to be replaced, show them in the account currency again.
+                self._restore_highlighted_balance()
+                self.last_account_key = None
+
+                if "accounts" in tables:
+                    await self._update_account_tables()
+                elif account_ids:
+                    await self._update_account_balances(account_ids)
+
+                if tables & {"accounts", "transactions"}:
+                    await self._update_recent_transactions_table()
+
+                current_month_changed = (
+                    get_year_month(Arrow.now().timestamp()) in year_months
+                )
+                if current_month_changed or "accounts" in tables:
+                    await self._update_balance_labels()
+
+                if current_month_changed or "categories" in tables:
+                    await self.build_budget_widgets()
+
+                self.rendered_state.update(versions)
+        finally:
+            self.applying_database_changes = False
+
+    def _restore_highlighted_balance(self) -> None:
+        """Shows the balance in the account currency again if it is being shown in the base currency."""
+        if self.last_account_key is None:
+            return
+
+        accounts_table = self.query_one("#accounts-table", expect_type=DataTable)
+        try:
+            accounts_table.update_cell(
+                self.last_account_key.row_key,
+                self.last_account_key.column_key,
+                self.last_account_value,
+            )
+        except CellDoesNotExist:
+            pass
+
     def on_data_table_cell_selected(self, event: DataTable.CellSelected) -> None:
         """Called when a cell in the DataTable is selected"""
         if event.data_table.id == "recent-transactions-table":
@@ -236,38 +394,61 @@ class MainMenu(Screen):
         if self.is_quitting:
             return
 
-        await self.build_budget_widgets()
+        settings_manager = SettingsManager()
+        base_currency = settings_manager.get_base_currency()
+
+        # Until rates have been checked (first render, or settings changed), render everything.
+        if not self.rates_fetched:
+            self.rendered_state = {}
+
+        render_state = {
+            **self.DB.get_versions(),
+            "budget": settings_manager.get_settings_dict().get("budget"),
+            "base_currency": base_currency,
+            "locale": settings_manager.get_locale(),
+            "year_month": get_year_month(Arrow.now().timestamp()),
+            "rates": self.rates_version,
+        }
+        changed = {
+            key
+            for key, value in render_state.items()
+            if key not in self.rendered_state or self.rendered_state[key] != value
+        }
+
+        if not changed:
+            logger.info("Nothing changed since the last render. Skipping UI update.")
+            return
+
+        logger.info("Updating UI. Changed since last render: %s", changed)
+        if changed & {
+            "budget",
+            "transactions",
+            "categories",
+            "base_currency",
+            "year_month",
+            "rates",
+        }:
+            await self.build_budget_widgets()
 
         labels_container = self.query_one("#balance-labels", expect_type=Vertical)
-        logger.debug(labels_container.children)
         labels_container.loading = True
         try:
-            base_currency = SettingsManager().get_base_currency()
-            currency_manager = CurrencyManager(base_currency)
-            logger.info(
-                f"Created a new CurrencyManager instance with base currency {base_currency}",
-            )
-
-            if currency_manager.has_expired_rates() and not self.rates_fetched:
-                logger.info("Attempting to update expired rates...")
-                self.app.notify(
-                    title=_("Updating Currency Rates"),
-                    message=_(
-                        "Please wait while we retrieve the latest currency conversion rates for you."
-                    ),
-                    severity="warning",
-                    timeout=6,
-                )
-                await currency_manager.update_invalid_rates()
-
-            # Once the rates have been fetched (successfully or not), update UI without checking for outdated rates
-            logger.info(
-                "Rates have been fetched or attempted. Updating UI without checking for outdated rates.",
-            )
-
-            self._update_account_tables()
-            self._update_recent_transactions_table()
-            await self._update_balance_labels()
+            # Expired rates are used until they are refreshed in the background.
+            if changed & {"accounts", "transactions", "locale"}:
+                await self._update_account_tables()
+                await self._update_recent_transactions_table()
+
+            if changed & {
+                "accounts",
+                "transactions",
+                "base_currency",
+                "locale",
+                "year_month",
+                "rates",
+            }:
+                await self._update_balance_labels()
+
+            self.rendered_state = render_state
 
             # progress = self.query_one("#budget-progress", expect_type=ProgressBar)
             # progress.advance(MainMenu.TOTAL_SPENT)
@@ -280,70 +461,159 @@ class MainMenu(Screen):
 
         labels_container.loading = False
         if not self.rates_fetched:
-            self.app.notify(
-                title=_("Updating Currency Rates"),
-                message=_("Updated all currency rates."),
-                severity="information",
-                timeout=6,
-            )
             self.rates_fetched = True
 
-    def _update_recent_transactions_table(self) -> None:
-        """Updates the recent transactions DataTable widget."""
+            startup: Optional[StartupScheduler] = getattr(self.app, "startup", None)
+            if startup is None:
+                self.run_worker(self.refresh_rates, group="rates", exclusive=True)  # type: ignore
+            else:
+                startup.add_task("refresh rates", self.refresh_rates)
+                startup.first_render()
+
+    async def refresh_rates(self) -> None:
+        """(Coroutine) Updates the expired exchange rates, then the amounts shown in the base currency."""
+        if self.is_quitting:
+            return
+
+        currency_manager = CurrencyManager(SettingsManager().get_base_currency())
+        if not currency_manager.has_expired_rates():
+            return
+
+        logger.info("Attempting to update expired rates...")
+        self.app.notify(
+            title=_("Updating Currency Rates"),
+            message=_(
+                "Please wait while we retrieve the latest currency conversion rates for you."
+            ),
+            severity="warning",
+            timeout=6,
+        )
+
+        try:
+            await currency_manager.update_invalid_rates()
+        except ExchangeRateFetchError as e:
+            msg = f"{e}\n\n Using outdated exchange rates for now."
+            self.app.push_screen(
+                ErrorModal(title=_("Error Fetching Exchange Rates"), traceback_msg=msg),
+            )
+            return
+
+        self.app.notify(
+            title=_("Updating Currency Rates"),
+            message=_("Updated all currency rates."),
+            severity="information",
+            timeout=6,
+        )
+
+        self.rates_version += 1
+        self.run_worker(self.update_ui_info, exclusive=True)  # type: ignore
+
+    async def _update_recent_transactions_table(self) -> None:
+        """(Coroutine) Updates the recent transactions DataTable widget."""
         logger.info("Updating recent transactions table...")
         table: DataTable = self.get_widget_by_id("recent-transactions-table")  # type: ignore
-        recent_transactions = self.DB.get_all_recent_transactions()
-        table.clear(columns=True)
-        logger.info("Cleared columns from recent transactions table.")
-        table.add_columns(
-            _("Account"),
-            _("Amount"),
-            _("Date"),
-            _("Category"),
-            _("Description"),
-        )
+        recent_transactions = await self.ASYNC_DB.get_all_recent_transactions()
+        user_locale = SettingsManager().get_locale()
 
+        rows: dict[str, tuple] = {}
         for trans in recent_transactions:
-            # Should never happen.
-            if trans.account_id == None:
-                continue
-
             if trans.account_id is None:
                 continue
 
-            account = self.DB.get_account_by_id(int(trans.account_id))
-            color = "[green]" if trans.amount > 0 else "[red]"
-            date = Arrow.fromtimestamp(trans.timestamp).format("MM/DD/YYYY")
+            account = await self.ASYNC_DB.get_account_by_id(int(trans.account_id))
+            amount = from_minor_units(trans.amount_minor, account.currency)
+            color = "[green]" if amount > 0 else "[red]"
+            date = format_date(trans.epoch, "MM/DD/YYYY")
 
-            table.add_row(
+            rows[str(trans.id)] = (
                 account.name,
-                f"{color}{format_currency(trans.amount, account.currency, locale=SettingsManager().get_locale())}",
+                f"{color}{format_currency(amount, account.currency, locale=user_locale)}",
                 date,
                 trans.category,
                 trans.description,
-                key=str(trans.id),
             )
 
-    def _update_account_tables(self) -> None:
-        """Updates the accounts DataTable widget"""
+        self._update_table_rows(table, rows, self.rendered_transactions)
+
+    async def _update_account_tables(self) -> None:
+        """(Coroutine) Updates the accounts DataTable widget"""
         logger.info("Updating account tables...")
-        table: DataTable = self.get_widget_by_id("accounts-table")  # type: ignore
-        table.clear(columns=True)
-        table.add_columns(
-            _("Account Name"),
-            _("Balance"),
+        accounts = await self.ASYNC_DB.get_accounts()
+        balances = await self.ASYNC_DB.get_account_balances(
+            [acc.id for acc in accounts]
         )
 
-        for acc in self.DB.get_accounts():
-            table.add_row(
+        user_locale = SettingsManager().get_locale()
+        rows = {
+            str(acc.id): (
                 acc.name,
-                format_currency(
-                    self.DB.get_account_balance(acc.id),
-                    acc.currency,
-                    locale=SettingsManager().get_locale(),
-                ),
+                format_currency(balance, acc.currency, locale=user_locale),
+            )
+            for acc, balance in zip(accounts, balances)
+        }
+
+        table: DataTable = self.get_widget_by_id("accounts-table")  # type: ignore
+        self._update_table_rows(table, rows, self.rendered_accounts)
+
+    async def _update_account_balances(self, account_ids: set[int]) -> None:
+        """(Coroutine) Updates the balance of the specified accounts in the accounts DataTable widget."""
+        shown_ids = [
+            account_id
+            for account_id in account_ids
+            if str(account_id) in self.rendered_accounts
+        ]
+        balances = await self.ASYNC_DB.get_account_balances(shown_ids)
+        user_locale = SettingsManager().get_locale()
+
+        rows = dict(self.rendered_accounts)
+        for account_id, balance in zip(shown_ids, balances):
+            account = await self.ASYNC_DB.get_account_by_id(account_id)
+            rows[str(account_id)] = (
+                account.name,
+                format_currency(balance, account.currency, locale=user_locale),
             )
 
+        table: DataTable = self.get_widget_by_id("accounts-table")  # type: ignore
+        self._update_table_rows(table, rows, self.rendered_accounts)
+
+    def _update_table_rows(
+        self,
+        table: DataTable,
+        rows: dict[str, tuple],
+        rendered_rows: dict[str, tuple],
+    ) -> None:
+        """Makes a DataTable show the specified rows, only updating the cells that changed.
+
+        Args:
+            table (DataTable): The table to update.
+            rows (dict[str, tuple]): The values of each row by row key, in order.
+            rendered_rows (dict[str, tuple]): The rows currently shown by the table.
+                It is updated to the new rows.
+        """
+        kept_keys = [key for key in rendered_rows if key in rows]
+        if kept_keys != list(rows)[: len(kept_keys)]:
+            # Rows can only be appended, so they are rebuilt if their order changed.
+            logger.debug("Order of rows changed in %s. Rebuilding rows...", table.id)
+            table.clear()
+            rendered_rows.clear()
+
+        for key in [key for key in rendered_rows if key not in rows]:
+            table.remove_row(key)
+
+        for key, values in rows.items():
+            if key not in rendered_rows:
+                table.add_row(*values, key=key)
+                continue
+
+            for column_key, old_value, new_value in zip(
+                table.columns, rendered_rows[key], values
+            ):
+                if old_value != new_value:
+                    table.update_cell(key, column_key, new_value, update_width=True)
+
+        rendered_rows.clear()
+        rendered_rows.update(rows)
+
     async def _update_balance_labels(self) -> None:
         """(Coroutine) Updates monthly income/balance/expense labels"""
         monthly_income_label: Label = self.get_widget_by_id(
@@ -357,13 +627,16 @@ class MainMenu(Screen):
         )
 
         try:
-            monthly_income: float = await self.DB.get_monthly_income()
-            monthly_expense: float = await self.DB.get_monthly_expense()
+            monthly_income: float = await self.ASYNC_DB.get_monthly_income()
+            monthly_expense: float = await self.ASYNC_DB.get_monthly_expense()
             balance: float = round(monthly_income + monthly_expense, 2)
             base_currency = SettingsManager().get_base_currency()
 
             logger.info(
-                f"Monthly Income: {monthly_income} | Monthly Expense: {monthly_expense} | Balance: {balance}",
+                "Monthly Income: %s | Monthly Expense: %s | Balance: %s",
+                monthly_income,
+                monthly_expense,
+                balance,
             )
 
             income_color = "[green]" if monthly_income > 0 else "[red]"
@@ -405,7 +678,7 @@ class MainMenu(Screen):
             )
 
         except ExchangeRateFetchError as e:
-            logger.error(f"Error fetching exchange rates: {e}")
+            logger.error("Error fetching exchange rates: %s", e)
             msg = str(e) + _(
                 "\n\nConnect to the internet to be able to use Budgetize.\nOr create an issue at Github to get support.",
             )
@@ -417,61 +690,70 @@ class MainMenu(Screen):
             self.app.push_screen(modal)
 
     async def build_budget_widgets(self) -> None:
-        """(Coroutine) Adds the children for the budget tab accordingly."""
-
-        logger.info("Building Budget Widgets...")
-        budgets_tab = self.query_one("#budgets-tab", expect_type=TabPane)
-        await budgets_tab.remove_children()
+        """(Coroutine) Updates the children of the budget tab in place."""
 
+        logger.info("Updating Budget Widgets...")
         settings_manager = SettingsManager()
         budget = settings_manager.load_budget()
 
-        center = Center(id="limits-center")
+        if budget:
+            monthly_expense = await self.ASYNC_DB.get_monthly_expense()
+            category_ids = await self.ASYNC_DB.get_category_ids()
+            expenses = await self.ASYNC_DB.get_monthly_expenses_by_category()
+
+        # The widgets are only touched after the last query, so that concurrent calls
+        # can not interleave between checking for a label and mounting it.
+        center = self.query_one("#limits-center", expect_type=Center)
+        for widget in center.query(".no-budget"):
+            widget.display = not budget
+        for widget in center.query(".budget"):
+            widget.display = bool(budget)
 
-        await budgets_tab.mount(center)
         if not budget:
             logger.debug("No budget found. Showing message to create one.")
-            center.mount(
-                Label(BUDGET_MSG, id="budget-msg"),
-                Button(
-                    "Create Budget",
-                    id="create-budget-btn",
-                ),
-            )
             return
 
-        mgr = SettingsManager()
-
-        # Mount Budget progress bar
-        progress = ProgressBar(total=budget.get_income(), show_eta=False)
-        center.mount(Label(_("Current Budget Progress")), progress)
-        progress.advance(await self.DB.get_monthly_expense())
-
-        # Mount Horizontal container to show each category limit
-        container = Horizontal(id="budget-labels-horizontal")
-        center.mount(container)
-        for category, limit in budget.get_all_limits().items():
-            container.mount(
-                Label(
-                    "[{color}]{category}[white]: {limit}\nExpent: {amt}".format(
-                        category=category, limit=limit, amt=0, color=choice(RICH_COLORS)
-                    ),
-                    id=f"{category}-label",
-                )
+        progress = self.query_one("#budget-progress", expect_type=ProgressBar)
+        progress.update(total=budget.get_income(), progress=monthly_expense)
+
+        # Labels are keyed by category ID, so only the ones of removed categories are dropped.
+        container = self.query_one("#budget-labels-horizontal", expect_type=Horizontal)
+        category_names = {
+            category_id: name for name, category_id in category_ids.items()
+        }
+        limits = budget.get_limits_by_category_id(category_ids)
+        label_ids = {
+            category_id: f"budget-category-{category_id}" for category_id in limits
+        }
+        for label in container.query(Label):
+            if label.id not in label_ids.values():
+                label.remove()
+
+        for category_id, limit in limits.items():
+            label_id = label_ids[category_id]
+            if category_id not in self.budget_colors:
+                self.budget_colors[category_id] = choice(RICH_COLORS)
+
+            text = "[{color}]{category}[white]: {limit}\nExpent: {amt}".format(
+                category=category_names[category_id],
+                limit=limit,
+                amt=round(expenses.get(category_id, 0.0), 2),
+                color=self.budget_colors[category_id],
             )
-        center.mount(Button("Edit Budget", id="edit-budget-btn"))
-        center.mount(Button("Delete Budget", id="delete-budget-btn", variant="error"))
+            labels = container.query(f"#{label_id}")
+            if labels:
+                labels.first(Label).update(text)
+            else:
+                container.mount(Label(text, id=label_id))
 
     # ==================== App Bindings ====================
 
-    def action_verify_add_transaction(self) -> None:
+    async def action_verify_add_transaction(self) -> None:
         """Verifies if there is atleast one account to add a transaction to.
         If there is, it pushes the add_transaction screen.
         If there isn't, it notifies the user.
         """
-        accounts = 0
-        for acc in self.DB.get_accounts():
-            accounts += 1
+        accounts = await self.ASYNC_DB.get_accounts()
         if accounts:
             self.app.push_screen(AddTransaction())
         else:
@@ -503,6 +785,16 @@ class MainMenu(Screen):
         self.rates_fetched = False
         self.app.push_screen(Settings())
 
+    def action_search_transactions(self) -> None:
+        """Opens the transaction search."""
+        logger.info("Pushing SearchScreen...")
+        self.app.push_screen(SearchScreen())
+
+    def action_show_forecast(self) -> None:
+        """Opens the cash-flow forecast."""
+        logger.info("Pushing ForecastScreen...")
+        self.app.push_screen(ForecastScreen())
+
     async def on_data_table_cell_highlighted(
         self,
         event: DataTable.CellHighlighted,
@@ -511,7 +803,7 @@ class MainMenu(Screen):
         if event.control.id == "accounts-table":
             accounts_table: DataTable = self.get_widget_by_id(
                 "accounts-table",
-            )  # type:ignore
+            )  # type: ignore
 
             # User clicked in balance column
             if event.coordinate.column == 1:
@@ -536,21 +828,21 @@ class MainMenu(Screen):
                     self.last_account_value = str(event.value)
 
                 # 0.00\xa0USD - format
-                logger.info(f"Parsing currency from cell: {event.value}")
+                logger.info("Parsing currency from cell: %s", event.value)
                 detected_decimal = ""
                 for char in str(event.value):
                     if char.strip().isdigit() or char.strip() in [",", "."]:
                         detected_decimal += char
 
-                logger.debug(f"Detected decimals: {detected_decimal}")
+                logger.debug("Detected decimals: %s", detected_decimal)
 
                 decimal_value = parse_decimal(
                     detected_decimal,
                     locale=SettingsManager().get_locale(),
                 )
-                logger.debug(f"Decimal value: {decimal_value}")
+                logger.debug("Decimal value: %s", decimal_value)
                 account_name = accounts_table.get_cell_at(event.coordinate.left())
-                account = self.DB.get_account_by_name(account_name)
+                account = await self.ASYNC_DB.get_account_by_name(account_name)
 
                 # Do not show exchange rate of the currency since its the same
                 if account.currency == SettingsManager().get_base_currency():
@@ -561,7 +853,7 @@ class MainMenu(Screen):
                 exchange_rate = await CurrencyManager(main_currency).get_exchange(
                     account.currency,
                 )
-                logger.info(f"Exchange rate got: {exchange_rate}")
+                logger.info("Exchange rate got: %s", exchange_rate)
 
                 amt = float(str(decimal_value))
                 formatted_currency = format_currency(
@@ -577,7 +869,7 @@ class MainMenu(Screen):
                     update_width=True,
                 )
 
-                logger.info(f"Updated exchange rate to: {formatted_currency}")
+                logger.info("Updated exchange rate to: %s", formatted_currency)
 
             # User selected other column instead of balance
             elif self.last_account_key is not None:
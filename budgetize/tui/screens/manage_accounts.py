@@ -1,11 +1,14 @@
 """Screen that allows the user to manage their accounts."""
 
+import asyncio
 import gettext
 import logging
-from typing import Generator
+from collections import OrderedDict
+from typing import Iterable, Optional
 
 from arrow import Arrow
 from babel.numbers import format_currency
+from sqlalchemy.exc import NoResultFound
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.screen import Screen
@@ -20,7 +23,13 @@ from textual.widgets import (
 )
 
 from budgetize import SettingsManager
+from budgetize.dates import format_date, get_year_month
+from budgetize.db.async_database import AsyncDatabase
 from budgetize.db.database import Database
+from budgetize.db.events import TransactionsChanged
+from budgetize.db.orm.transactions import Transaction
+from budgetize.money import from_minor_units
+from budgetize.tui.messages import DatabaseChanged
 from budgetize.tui.modals.transaction_details import TransactionDetails
 from budgetize.utils import _
 
@@ -28,9 +37,17 @@ logger = logging.getLogger(__name__)
 
 
 class ManageAccounts(Screen):
-    """Screen that allows the user to manage their accounts."""
+    """Screen that allows the user to manage their accounts.
+
+    Tabs start as placeholders and are built when activated. The most recently used tabs
+    are kept built, and the tabs next to the active one are built in the background.
+    """
 
     DB: Database = None  # type: ignore
+    ASYNC_DB: AsyncDatabase = None  # type: ignore
+
+    # Maximum amount of account tabs kept built. Older ones go back to placeholders.
+    MAX_BUILT_TABS = 3
     BINDINGS = [
         Binding(
             key="q,Q",
@@ -43,6 +60,13 @@ class ManageAccounts(Screen):
     def __init__(self) -> None:
         """Creates a new ManageAccounts Screen"""
         ManageAccounts.DB = Database(self.app)
+        ManageAccounts.ASYNC_DB = AsyncDatabase(ManageAccounts.DB)
+
+        # IDs of the accounts in tab order
+        self.account_ids: list[int] = []
+        self.built_tabs: OrderedDict[int, None] = OrderedDict()
+        self.building_tabs: set[int] = set()
+        self.active_account_id: Optional[int] = None
         super().__init__()
 
     def compose(self) -> ComposeResult:
@@ -55,72 +79,183 @@ class ManageAccounts(Screen):
         with TabbedContent():
             accounts = self.DB.get_accounts()
             for acc in accounts:
-                logger.info(f"Generating tab for account {acc.name}")
-                with TabPane(acc.name, id=f"tab-{acc.name.replace(' ', '-')}"):
-                    account_balance = self.DB.get_account_balance(acc.id)
-                    yield Label(
-                        _("Balance: {balance}").format(
-                            balance=format_currency(
-                                number=account_balance,
-                                currency=acc.currency,
-                                locale=SettingsManager().get_locale(),
-                            ),
+                logger.info("Generating placeholder tab for account %s", acc.name)
+                self.account_ids.append(acc.id)
+                with TabPane(acc.name, id=f"tab-{acc.id}"):
+                    yield Label(_("Loading..."))
+
+    def on_mount(self) -> None:
+        """Called when the screen is mounted"""
+        Database.events.subscribe(TransactionsChanged, self._post_database_change)
+
+    def on_unmount(self) -> None:
+        """Called when the screen is removed"""
+        Database.events.unsubscribe(TransactionsChanged, self._post_database_change)
+
+    def _post_database_change(self, event: TransactionsChanged) -> None:
+        """Forwards a database event to the screen. May be called from a database thread."""
+        self.post_message(DatabaseChanged(event))
+
+    async def on_database_changed(self, message: DatabaseChanged) -> None:
+        """Updates the balance and transactions of the accounts affected by a change."""
+        event = message.event
+        if not isinstance(event, TransactionsChanged):
+            return
+
+        now = Arrow.now()
+        current_month_changed = get_year_month(now.timestamp()) in event.year_months
+
+        for account_id in event.account_ids:
+            balance_labels = self.query(f"#balance-label-{account_id}")
+            if not balance_labels:
+                continue
+
+            try:
+                account = await self.ASYNC_DB.get_account_by_id(account_id)
+            except NoResultFound:
+                logger.info("Account #%s was deleted. Skipping its tab.", account_id)
+                continue
+
+            logger.info("Updating tab of Account #%s", account_id)
+            balance_labels.first(Label).update(
+                _("Balance: {balance}").format(
+                    balance=format_currency(
+                        number=await self.ASYNC_DB.get_account_balance(account_id),
+                        currency=account.currency,
+                        locale=SettingsManager().get_locale(),
+                    ),
+                ),
+            )
+
+            if not current_month_changed:
+                continue
+
+            table = self.query_one(
+                f"#management-table-{account_id}", expect_type=DataTable
+            )
+            table.clear()
+            self._add_transaction_rows(
+                table,
+                await self.ASYNC_DB.get_monthly_transactions_from_account(
+                    account_id, month=now.format("M"), year=now.format("YYYY")
+                ),
+                account.currency,
+            )
+
+    def on_tabbed_content_tab_activated(
+        self, event: TabbedContent.TabActivated
+    ) -> None:
+        """Builds the activated tab, then prefetches its neighbours."""
+        if event.pane.id is None:
+            return
+
+        self.active_account_id = int(event.pane.id.split("-")[-1])
+        self.run_worker(self._show_account_tab, exclusive=True, group="tabs")  # type: ignore
+
+    async def _show_account_tab(self) -> None:
+        """(Coroutine) Builds the tab of the active account and the tabs next to it."""
+        if self.active_account_id is None:
+            return
+
+        await self._build_account_tab(self.active_account_id)
+
+        position = self.account_ids.index(self.active_account_id)
+        for neighbour in (position + 1, position - 1):
+            if 0 <= neighbour < len(self.account_ids):
+                await self._build_account_tab(self.account_ids[neighbour])
+
+    async def _build_account_tab(self, account_id: int) -> None:
+        """(Coroutine) Replaces the placeholder of the account tab with its balance and transactions."""
+        if account_id in self.built_tabs:
+            self.built_tabs.move_to_end(account_id)
+            return
+
+        if account_id in self.building_tabs:
+            return
+
+        logger.info("Building tab for Account #%s", account_id)
+        self.building_tabs.add(account_id)
+        try:
+            now = Arrow.now()
+            account = await self.ASYNC_DB.get_account_by_id(account_id)
+            account_balance, transactions = await asyncio.gather(
+                self.ASYNC_DB.get_account_balance(account_id),
+                self.ASYNC_DB.get_monthly_transactions_from_account(
+                    account_id, month=now.format("M"), year=now.format("YYYY")
+                ),
+            )
+
+            pane = self.query_one(f"#tab-{account_id}", expect_type=TabPane)
+            await pane.remove_children()
+            await pane.mount(
+                Label(
+                    _("Balance: {balance}").format(
+                        balance=format_currency(
+                            number=account_balance,
+                            currency=account.currency,
+                            locale=SettingsManager().get_locale(),
                         ),
-                    )
-                    yield self.get_transactions_table(acc.id)
-                    yield Button.error(_("Delete Account"), id=f"delete-acc-{acc.id}")
+                    ),
+                    id=f"balance-label-{account_id}",
+                ),
+                self.get_transactions_table(account_id, account.currency, transactions),
+                Button.error(_("Delete Account"), id=f"delete-acc-{account_id}"),
+            )
+            self.built_tabs[account_id] = None
+        finally:
+            self.building_tabs.discard(account_id)
+
+        await self._evict_account_tabs()
+
+    async def _evict_account_tabs(self) -> None:
+        """(Coroutine) Turns the least recently used tabs back into placeholders."""
+        for account_id in list(self.built_tabs):
+            if len(self.built_tabs) <= ManageAccounts.MAX_BUILT_TABS:
+                return
+
+            if account_id == self.active_account_id:
+                continue
+
+            logger.info("Unloading tab of Account #%s", account_id)
+            del self.built_tabs[account_id]
+            pane = self.query_one(f"#tab-{account_id}", expect_type=TabPane)
+            await pane.remove_children()
+            await pane.mount(Label(_("Loading...")))
 
     def action_quit_screen(self) -> None:
         """Quits the application"""
         self.app.pop_screen()
 
-    def generate_accounts_tab(self) -> Generator:
-        """Generates the accounts tab including all user accounts"""
-        with TabbedContent() as tabs:
-            accounts = self.DB.get_accounts()
-            for acc in accounts:
-                with TabPane(acc.name, id=f"tab-{acc.name.replace(' ', '-')}"):
-                    account_balance = self.DB.get_account_balance(acc.id)
-                    yield Label(
-                        _("Balance: {balance}").format(
-                            balance=format_currency(
-                                number=account_balance,
-                                currency=acc.currency,
-                                locale=SettingsManager().get_locale(),
-                            ),
-                        ),
-                    )
-                    yield self.get_transactions_table(acc.id)
-                    yield Button(_("Delete Account"), id=f"delete-acc-{acc.id}")
-            return tabs
-
-    def get_transactions_table(self, account: int) -> DataTable:
-        """Returns the data table containing the transactions for an account."""
-        logger.info(f"Building transactions table for Account #{account}")
+    def get_transactions_table(
+        self,
+        account: int,
+        currency: str,
+        transactions: Iterable[Transaction],
+    ) -> DataTable:
+        """Returns the data table containing the specified transactions of an account."""
+        logger.info("Building transactions table for Account #%s", account)
         table: DataTable = DataTable(id=f"management-table-{account!s}")  # type: ignore
         table.add_columns(_("Date"), _("Amount"), _("Category"), _("Description"))
 
-        now = Arrow.now()
-        month = now.format("M")
-        year = now.format("YYYY")
-        transactions = self.DB.get_monthly_transactions_from_account(
-            account,
-            month=month,
-            year=year,
-        )
+        self._add_transaction_rows(table, transactions, currency)
+        logger.info("Table done building.")
+        return table
 
+    def _add_transaction_rows(
+        self, table: DataTable, transactions: Iterable[Transaction], currency: str
+    ) -> None:
+        """Adds a row to the table for each transaction of an account in the specified currency."""
         for trans in transactions:
-            color = "[green]" if trans.amount > 0 else "[red]"
-            date = Arrow.fromtimestamp(trans.timestamp).format("M/D/YYYY")
+            amount = from_minor_units(trans.amount_minor, currency)
+            color = "[green]" if amount > 0 else "[red]"
+            date = format_date(trans.epoch, "M/D/YYYY")
             table.add_row(
                 date,
-                color + str(trans.amount),
+                color + str(amount),
                 trans.category,
                 trans.description,
                 key=str(trans.id),
             )
-        logger.info("Table done building.")
-        return table
 
     def on_data_table_cell_selected(self, event: DataTable.CellSelected) -> None:
         """Cell selection handler"""
@@ -146,10 +281,15 @@ class ManageAccounts(Screen):
             # Format of btn is delete-acc-{Account.id}
 
             account_id = int(event.button.id.split("-")[-1])
-            account_name = self.DB.get_account_by_id(account_id).name
-            self.DB.delete_account(account_id=account_id)
-            self.notify(
-                _("{account_name} has been deleted.").format(account_name=account_name),
-                title=_("Account Deleted"),
-            )
-            self.app.pop_screen()
+            event.button.disabled = True
+            self.run_worker(self._delete_account(account_id), group="delete")  # type: ignore
+
+    async def _delete_account(self, account_id: int) -> None:
+        """(Coroutine) Deletes the account and goes back to the main menu."""
+        account = await self.ASYNC_DB.get_account_by_id(account_id)
+        await self.ASYNC_DB.delete_account(account_id=account_id)
+        self.notify(
+            _("{account_name} has been deleted.").format(account_name=account.name),
+            title=_("Account Deleted"),
+        )
+        self.app.pop_screen()
@@ -0,0 +1,153 @@
+"""Module that defines the screen to search transactions"""
+
+import asyncio
+import logging
+
+from babel.numbers import format_currency
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.screen import Screen
+from textual.widgets import DataTable, Footer, Header, Input, Label
+
+from budgetize import SettingsManager
+from budgetize.dates import format_date
+from budgetize.db.async_database import AsyncDatabase
+from budgetize.db.database import Database
+from budgetize.money import from_minor_units
+from budgetize.tui.modals.transaction_details import TransactionDetails
+from budgetize.utils import _
+
+logger = logging.getLogger(__name__)
+
+
+class SearchScreen(Screen):
+    """Screen that searches transactions by description and category as the user types."""
+
+    DB: Database = None  # type: ignore
+    ASYNC_DB: AsyncDatabase = None  # type: ignore
+    CSS_PATH = "css/search.tcss"
+    PAGE_SIZE = 20
+
+    # Seconds to wait after the last keystroke before querying
+    DEBOUNCE_DELAY = 0.25
+
+    BINDINGS = [
+        Binding(
+            key="escape",
+            key_display="ESC",
+            action="pop_screen",
+            description=_("Back to Main Menu"),
+        ),
+        Binding(
+            key="pagedown",
+            key_display="PgDn",
+            action="change_page(1)",
+            description=_("Next Page"),
+        ),
+        Binding(
+            key="pageup",
+            key_display="PgUp",
+            action="change_page(-1)",
+            description=_("Previous Page"),
+        ),
+    ]
+
+    def __init__(self) -> None:
+        """Creates a new SearchScreen"""
+        SearchScreen.DB = Database(self.app)
+        SearchScreen.ASYNC_DB = AsyncDatabase(SearchScreen.DB)
+        self.query_text = ""
+        self.page = 0
+        self.has_next_page = False
+        self.locale = SettingsManager().get_locale()
+        super().__init__()
+
+    def compose(self) -> ComposeResult:
+        """Called when screen is composed"""
+        logger.info("Composing SearchScreen...")
+        self.app.sub_title = _("Search Transactions")
+        yield Header()
+        yield Footer()
+
+        yield Input(
+            placeholder=_("Search by description or category"),
+            id="search-input",
+        )
+        yield Label("", id="results-label")
+        yield DataTable(id="results-table", cursor_type="row")
+
+    def on_mount(self) -> None:
+        """Called when the screen is mounted"""
+        table = self.query_one("#results-table", expect_type=DataTable)
+        table.add_columns(
+            _("Account"),
+            _("Amount"),
+            _("Date"),
+            _("Category"),
+            _("Description"),
+        )
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Schedules a new search. Any search still waiting or running is cancelled."""
+        self.query_text = event.value
+        self.page = 0
+        self.run_worker(self._debounced_search, exclusive=True, group="search")  # type: ignore
+
+    def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
+        """Shows the details of the selected transaction"""
+        if event.row_key.value is not None:
+            self.app.push_screen(
+                TransactionDetails(int(event.row_key.value), from_manage_accounts=False)
+            )
+
+    def action_change_page(self, step: int) -> None:
+        """Shows the next or previous page of results"""
+        if (step > 0 and not self.has_next_page) or (step < 0 and self.page == 0):
+            return
+
+        self.page += step
+        self.run_worker(self._search, exclusive=True, group="search")  # type: ignore
+
+    async def _debounced_search(self) -> None:
+        """(Coroutine) Waits for the user to stop typing before searching."""
+        await asyncio.sleep(SearchScreen.DEBOUNCE_DELAY)
+        await self._search()
+
+    async def _search(self) -> None:
+        """(Coroutine) Runs the search and shows the current page of results."""
+        logger.debug("Searching '%s' (page %s)", self.query_text, self.page)
+
+        # Fetch an extra row to know whether there is a next page
+        results = await self.ASYNC_DB.search_transactions(
+            self.query_text,
+            limit=SearchScreen.PAGE_SIZE + 1,
+            offset=self.page * SearchScreen.PAGE_SIZE,
+        )
+        self.has_next_page = len(results) > SearchScreen.PAGE_SIZE
+
+        table = self.query_one("#results-table", expect_type=DataTable)
+        table.clear()
+
+        for trans in results[: SearchScreen.PAGE_SIZE]:
+            if trans.account_id is None:
+                continue
+
+            account = await self.ASYNC_DB.get_account_by_id(int(trans.account_id))
+            amount = from_minor_units(trans.amount_minor, account.currency)
+            color = "[green]" if amount > 0 else "[red]"
+            table.add_row(
+                account.name,
+                f"{color}{format_currency(amount, account.currency, locale=self.locale)}",
+                format_date(trans.epoch, "MM/DD/YYYY"),
+                trans.category,
+                trans.description,
+                key=str(trans.id),
+            )
+
+        label = self.query_one("#results-label", expect_type=Label)
+        if not self.query_text.strip():
+            label.update("")
+        elif not results:
+            label.update(_("No transactions found."))
+        else:
+            label.update(_("Page {page}").format(page=self.page + 1))
@@ -16,6 +16,7 @@ from budgetize.consts import (
     BACKUPS_FOLDER,
     EXPORT_DATA_EXTENSION,
 )
+from budgetize.db.async_database import AsyncDatabase
 from budgetize.db.database import Database
 from budgetize.settings_manager import SettingsDict, SettingsManager
 from budgetize.tui.modals.categories_modal import CategoriesModal
@@ -28,6 +29,7 @@ logger = logging.getLogger(__name__)
 
 class Settings(Screen):
     DB: Database = None  # type: ignore
+    ASYNC_DB: AsyncDatabase = None  # type: ignore
     BINDINGS = [
         Binding(
             key="q,Q",
@@ -48,6 +50,7 @@ class Settings(Screen):
     def __init__(self) -> None:
         self.app.sub_title = _("Settings")
         Settings.DB = Database(app=self.app)
+        Settings.ASYNC_DB = AsyncDatabase(Settings.DB)
         self.manager = SettingsManager()
         super().__init__()
 
@@ -81,7 +84,7 @@ class Settings(Screen):
         yield Button(_("Revert Accounts & Transactions from Backup"), id="backup-btn")
         yield Button(_("Export all Budgetize Data"), id="export-btn")
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Button press handler"""
         if event.button.id == "categories-btn":
             logger.info("Showing Categories Settings...")
@@ -97,14 +100,14 @@ class Settings(Screen):
             )
 
         if event.button.id == "export-btn":
-            self.export_data()
+            await self.export_data()
 
-    def export_data(self) -> None:
+    async def export_data(self) -> None:
         """Export all Budgetize data"""
         data: dict[str, dict] = {}
 
         data["settings"] = self.manager.get_settings_dict()  # type: ignore
-        data["database"] = Settings.DB.get_db_as_dict()
+        data["database"] = await Settings.ASYNC_DB.get_db_as_dict()
 
         path = os.path.join(APP_FOLDER_PATH, f"exported.{EXPORT_DATA_EXTENSION}")
         with open(path, "w", encoding="utf-8") as f:
@@ -115,7 +118,7 @@ class Settings(Screen):
         )
         self.app.push_screen(modal)
 
-    def load_backup(self, backup: Optional[Path]) -> None:
+    async def load_backup(self, backup: Optional[Path]) -> None:
         """Load a backup file
 
         Args:
@@ -131,7 +134,7 @@ class Settings(Screen):
             )
             return
 
-        Settings.DB.revert_from_backup(backup)
+        await Settings.ASYNC_DB.revert_from_backup(backup)
         message_modal = MessageModal(
             message=_("Backup loaded successfully.\nPlease restart Budgetize."),
         )
@@ -155,6 +158,9 @@ class Settings(Screen):
             "base_currency": currency,
             "categories": self.manager.get_categories(),
             "budget": budget.to_dict() if budget else None,
+            "database": self.manager.get_settings_dict().get("database"),
+            "logging": self.manager.get_settings_dict().get("logging"),
+            "import_profiles": self.manager.get_settings_dict().get("import_profiles"),
         }
 
         logger.debug("Saving settings: " + str(new_settings))
@@ -0,0 +1,90 @@
+"""Module that defines the screen with the instrumentation stats, only available for development"""
+
+import logging
+
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.screen import Screen
+from textual.widgets import DataTable, Footer, Header, Label
+
+from budgetize.db.instrumentation import instrumentation
+
+logger = logging.getLogger(__name__)
+
+
+class StatsScreen(Screen):
+    """Screen that shows where the time of the database and currency calls goes."""
+
+    CSS_PATH = "css/stats.tcss"
+
+    # Seconds between refreshes of the table
+    REFRESH_INTERVAL = 1.0
+
+    BINDINGS = [
+        Binding(
+            key="escape",
+            key_display="ESC",
+            action="pop_screen",
+            description="Back",
+        ),
+        Binding(key="r", action="reset_stats", description="Reset"),
+    ]
+
+    def compose(self) -> ComposeResult:
+        """Called when screen is composed"""
+        logger.info("Composing StatsScreen...")
+        self.app.sub_title = "Instrumentation"
+        yield Header()
+        yield Footer()
+
+        yield Label("", id="stats-label")
+        yield DataTable(id="stats-table", cursor_type="row")
+
+    def on_mount(self) -> None:
+        """Called when the screen is mounted"""
+        table = self.query_one("#stats-table", expect_type=DataTable)
+        table.add_columns(
+            "Call site",
+            "Calls",
+            "Total ms",
+            "p50 ms",
+            "p95 ms",
+            "Max ms",
+            "Statements",
+            "SQL ms",
+            "Rows",
+        )
+        self.update_stats()
+        self.set_interval(StatsScreen.REFRESH_INTERVAL, self.update_stats)
+
+    def update_stats(self) -> None:
+        """Shows the latest measurements, slowest call sites first."""
+        report = instrumentation.get_report()
+        table = self.query_one("#stats-table", expect_type=DataTable)
+        table.clear()
+        for call_site, stats in report.items():
+            calls = stats["calls"]
+            statements = stats["statements"]
+            table.add_row(
+                call_site,
+                calls["count"],
+                f"{calls['total_ms']:.1f}",
+                f"{calls['p50_ms']:.2f}",
+                f"{calls['p95_ms']:.2f}",
+                f"{calls['max_ms']:.1f}",
+                statements["count"],
+                f"{statements['total_ms']:.1f}",
+                stats["rows"],
+                key=call_site,
+            )
+
+        label = self.query_one("#stats-label", expect_type=Label)
+        label.update(
+            f"{sum(stats['statements']['count'] for stats in report.values())} statements "
+            f"in {len(report)} call sites. Percentiles are bucket bounds."
+        )
+
+    def action_reset_stats(self) -> None:
+        """Forgets the measurements taken so far"""
+        instrumentation.reset()
+        self.update_stats()
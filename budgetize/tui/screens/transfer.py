@@ -1,10 +1,12 @@
 """Module that defines the transfer screen between accounts"""
 
+import asyncio
 import logging
 
 from arrow import Arrow
 from babel.numbers import format_currency
 from budgetize import CurrencyManager, SettingsManager
+from budgetize.db.async_database import AsyncDatabase
 from budgetize.db.database import Database
 from budgetize.utils import _
 from textual.app import ComposeResult
@@ -19,12 +21,22 @@ logger = logging.getLogger(__name__)
 class TransferScreen(Screen):
     """Screen used to transfer funds between user accounts"""
 
-    DB: Database = Database()
+    DB: Database = None  # type: ignore
+    ASYNC_DB: AsyncDatabase = None  # type: ignore
     CSS_PATH = "css/transfer.tcss"
 
+    # Seconds to wait after the last keystroke before updating the preview
+    PREVIEW_DELAY = 0.2
+
     def __init__(self) -> None:
         TransferScreen.DB = Database(app=self.app)
+        TransferScreen.ASYNC_DB = AsyncDatabase(TransferScreen.DB)
         self.app.sub_title = _("Transfer Funds")
+        self.locale = SettingsManager().get_locale()
+
+        # Values used by the preview, kept while the screen is open
+        self.balances: dict[int, float] = {}
+        self.exchange_rates: dict[tuple[str, str], float] = {}
         super().__init__()
 
     def compose(self) -> ComposeResult:
@@ -45,12 +57,8 @@ class TransferScreen(Screen):
 
         with Horizontal():
             with Vertical():
+                # The account selects are mounted once the accounts are loaded.
                 yield Label(_("Origin Account"), id="origin-label")
-                yield Select(
-                    self.get_accounts_for_select(),
-                    id="origin-select",
-                    allow_blank=False,
-                )
                 yield Label(_("Amount to Tranfer"), id="transfer-label")
                 yield Input(
                     placeholder="100.00",
@@ -61,31 +69,38 @@ class TransferScreen(Screen):
 
             with Vertical():
                 yield Label(_("Destination Account"), id="destination-label")
-                yield Select(
-                    self.get_accounts_for_select(),
-                    id="destination-select",
-                    allow_blank=False,
-                )
 
         with Horizontal(id="btn-container"):
             yield Button.success(_("Confirm Transfer"), id="transfer-btn")
             yield Button.error(_("Cancel"), id="cancel-btn")
 
+    async def on_mount(self) -> None:
+        """Loads the accounts once the screen is mounted."""
+        accounts = await self.get_accounts_for_select()
+        await self.mount(
+            Select(accounts, id="origin-select", allow_blank=False),
+            after="#origin-label",
+        )
+        await self.mount(
+            Select(accounts, id="destination-select", allow_blank=False),
+            after="#destination-label",
+        )
+
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Button handler"""
         if event.button.id == "transfer-btn":
             logger.info("User clicked on transfer button.")
             origin_select: Select = self.get_widget_by_id(
                 "origin-select",
-            )  # type:ignore
-            origin_account = TransferScreen.DB.get_account_by_id(
+            )  # type: ignore
+            origin_account = await TransferScreen.ASYNC_DB.get_account_by_id(
                 int(str(origin_select.value)),
             )
 
             destination_select: Select = self.get_widget_by_id(
                 "destination-select",
-            )  # type:ignore
-            destination_account = TransferScreen.DB.get_account_by_id(
+            )  # type: ignore
+            destination_account = await TransferScreen.ASYNC_DB.get_account_by_id(
                 int(str(destination_select.value)),
             )
 
@@ -108,9 +123,13 @@ class TransferScreen(Screen):
                 )
                 return
 
-            origin_balance = TransferScreen.DB.get_account_balance(origin_account.id)
+            origin_balance = await TransferScreen.ASYNC_DB.get_account_balance(
+                origin_account.id
+            )
             logger.debug(
-                f"Transfer Funds: {transfer_funds!s} | Origin Account Balance: {origin_balance!s}",
+                "Transfer Funds: %s | Origin Account Balance: %s",
+                transfer_funds,
+                origin_balance,
             )
             if transfer_funds > origin_balance:
                 self.app.notify(
@@ -120,13 +139,11 @@ class TransferScreen(Screen):
                 )
                 return
 
-            exchange_rate = 1.0
-            if destination_account.currency != origin_account.currency:
-                exchange_rate = await CurrencyManager(
-                    origin_account.currency,
-                ).get_exchange(destination_account.currency)
+            exchange_rate = await self.get_exchange_rate(
+                origin_account.currency, destination_account.currency
+            )
 
-            TransferScreen.DB.add_transaction(
+            await TransferScreen.ASYNC_DB.add_transaction(
                 account_id=origin_account.id,
                 amount=-1 * transfer_funds,
                 description="-",
@@ -135,7 +152,7 @@ class TransferScreen(Screen):
                 visible=False,
             )
 
-            TransferScreen.DB.add_transaction(
+            await TransferScreen.ASYNC_DB.add_transaction(
                 account_id=destination_account.id,
                 amount=transfer_funds * exchange_rate,
                 description="-",
@@ -158,17 +175,17 @@ class TransferScreen(Screen):
 
     def get_transfer_funds(self) -> float:
         """Returns the transfer funds the user entered"""
-        amount_input: Input = self.get_widget_by_id("transfer-input")  # type:ignore
+        amount_input: Input = self.get_widget_by_id("transfer-input")  # type: ignore
         funds_to_transfer = 0.0
 
-        logger.debug(f"Amount Field Input: {amount_input}")
+        logger.debug("Amount Field Input: %s", amount_input)
         try:
             funds_to_transfer = float(amount_input.value)
 
             if funds_to_transfer < 0:
                 funds_to_transfer = 0
 
-            logger.info(f"Parsed funds to: {funds_to_transfer!s}")
+            logger.debug("Parsed funds to: %s", funds_to_transfer)
             return funds_to_transfer
         except ValueError:
             logger.critical(
@@ -176,25 +193,55 @@ class TransferScreen(Screen):
             )
             return 0
 
-    async def on_input_changed(self, event: Input.Changed) -> None:
+    def on_input_changed(self, event: Input.Changed) -> None:
         """Input handler"""
-        await self.update_transfer_info()
+        self.run_worker(self._debounced_transfer_info, exclusive=True, group="preview")  # type: ignore
 
-    async def on_select_changed(self, event: Select.Changed) -> None:
+    def on_select_changed(self, event: Select.Changed) -> None:
         """Select handler"""
+        self.run_worker(self.update_transfer_info, exclusive=True, group="preview")  # type: ignore
+
+    async def _debounced_transfer_info(self) -> None:
+        """(Coroutine) Waits for the user to stop typing before updating the preview.
+
+        Workers of the preview are exclusive, so a new keystroke cancels the previous wait.
+        """
+        await asyncio.sleep(TransferScreen.PREVIEW_DELAY)
         await self.update_transfer_info()
 
+    async def get_balance(self, account_id: int) -> float:
+        """(Coroutine) Returns the balance of the account, only querying it the first time."""
+        if account_id not in self.balances:
+            self.balances[account_id] = (
+                await TransferScreen.ASYNC_DB.get_account_balance(account_id)
+            )
+        return self.balances[account_id]
+
+    async def get_exchange_rate(
+        self, origin_currency: str, destination_currency: str
+    ) -> float:
+        """(Coroutine) Returns the rate to convert between the currencies, only looking it up the first time."""
+        if origin_currency == destination_currency:
+            return 1.0
+
+        pair = (origin_currency, destination_currency)
+        if pair not in self.exchange_rates:
+            self.exchange_rates[pair] = await CurrencyManager(
+                origin_currency
+            ).get_exchange(destination_currency)
+        return self.exchange_rates[pair]
+
     async def update_transfer_info(self) -> None:
         """Function that updates labels and balance data temporarily"""
-        origin_select: Select = self.get_widget_by_id("origin-select")  # type:ignore
+        origin_select: Select = self.get_widget_by_id("origin-select")  # type: ignore
 
-        origin_account = TransferScreen.DB.get_account_by_id(
+        origin_account = await TransferScreen.ASYNC_DB.get_account_by_id(
             int(str(origin_select.value)),
         )
-        origin_label: Label = self.get_widget_by_id("origin-balance")  # type:ignore
+        origin_label: Label = self.get_widget_by_id("origin-balance")  # type: ignore
 
         funds_to_transfer = self.get_transfer_funds()
-        origin_balance = TransferScreen.DB.get_account_balance(origin_account.id)
+        origin_balance = await self.get_balance(origin_account.id)
 
         if funds_to_transfer > origin_balance:
             origin_label.update(
@@ -207,7 +254,7 @@ class TransferScreen(Screen):
         origin_formatted_balance = format_currency(
             number=origin_balance - funds_to_transfer,
             currency=origin_account.currency,
-            locale=SettingsManager().get_locale(),
+            locale=self.locale,
         )
 
         origin_label.update(
@@ -222,9 +269,9 @@ class TransferScreen(Screen):
 
         destination_select: Select = self.get_widget_by_id(
             "destination-select",
-        )  # type:ignore
+        )  # type: ignore
 
-        destination_account = TransferScreen.DB.get_account_by_id(
+        destination_account = await TransferScreen.ASYNC_DB.get_account_by_id(
             int(str(destination_select.value)),
         )
         destination_label: Label = self.get_widget_by_id("destination-balance")  # type: ignore
@@ -237,19 +284,14 @@ class TransferScreen(Screen):
             )
             return
 
-        exchange_rate = 1.0
-        if destination_account.currency != origin_account.currency:
-            exchange_rate = await CurrencyManager(origin_account.currency).get_exchange(
-                destination_account.currency,
-            )
-
-        destination_balance = TransferScreen.DB.get_account_balance(
-            destination_account.id,
+        exchange_rate = await self.get_exchange_rate(
+            origin_account.currency, destination_account.currency
         )
+        destination_balance = await self.get_balance(destination_account.id)
         destination_formatted_balance = format_currency(
             number=destination_balance + (funds_to_transfer * exchange_rate),
             currency=destination_account.currency,
-            locale=SettingsManager().get_locale(),
+            locale=self.locale,
         )
 
         destination_label.update(
@@ -262,18 +304,24 @@ class TransferScreen(Screen):
             ),
         )
 
-    def get_accounts_for_select(self) -> list[tuple[str, int]]:
-        """Returns the accounts as tuples of (name, id)"""
-        if TransferScreen.DB is None:
+    async def get_accounts_for_select(self) -> list[tuple[str, int]]:
+        """(Coroutine) Returns the accounts as tuples of (name, id)"""
+        if TransferScreen.ASYNC_DB is None:
             return []
 
-        accounts = TransferScreen.DB.get_accounts()
+        accounts = await TransferScreen.ASYNC_DB.get_accounts()
+        missing_ids = [
+            account.id for account in accounts if account.id not in self.balances
+        ]
+        balances = await TransferScreen.ASYNC_DB.get_account_balances(missing_ids)
+        self.balances.update(zip(missing_ids, balances))
+
         account_list = []
         for account in accounts:
             formatted_currency = format_currency(
-                TransferScreen.DB.get_account_balance(account.id),
+                self.balances[account.id],
                 account.currency,
-                locale=SettingsManager().get_locale(),
+                locale=self.locale,
             )
             name = f"{account.name} | {formatted_currency}"
             account_list.append((name, account.id))
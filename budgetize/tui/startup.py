@@ -0,0 +1,81 @@
+"""Module that defines the scheduler of the tasks that are deferred until the app is shown"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable
+
+from textual.app import App
+
+logger = logging.getLogger(__name__)
+
+
+class StartupScheduler:
+    """Keeps slow startup work (backups, rate refreshes...) off the critical path of the first render.
+
+    Tasks are queued with `add_task` and run one after another in a background worker once
+    `first_render` is called. Tasks added after that are run right away.
+
+    Parameters
+    ----------
+    app : App
+        The app whose workers run the tasks.
+    """
+
+    def __init__(self, app: App) -> None:
+        self.app = app
+        self.started_at = time.perf_counter()
+        self.rendered = False
+        self._tasks: list[tuple[str, Callable[[], Awaitable]]] = []
+
+    def add_task(self, name: str, task: Callable[[], Awaitable]) -> None:
+        """Queues a task to run in the background after the first render.
+
+        Args:
+            name (str): The name of the task, used in the log.
+            task (Callable): A coroutine function. Blocking work should be sent to a thread.
+        """
+        self._tasks.append((name, task))
+        if self.rendered:
+            self._run_pending_tasks()
+
+    def first_render(self) -> None:
+        """Logs the time to the first render and starts the queued tasks. Only the first call does something."""
+        if self.rendered:
+            return
+
+        self.rendered = True
+        logger.info(
+            "Time to first render: %.0f ms",
+            (time.perf_counter() - self.started_at) * 1000,
+        )
+        self._run_pending_tasks()
+
+    def _run_pending_tasks(self) -> None:
+        """Runs the queued tasks in a background worker."""
+        tasks, self._tasks = self._tasks, []
+        self.app.run_worker(
+            self._run_tasks(tasks), group="startup", exit_on_error=False
+        )
+
+    async def _run_tasks(
+        self, tasks: list[tuple[str, Callable[[], Awaitable]]]
+    ) -> None:
+        """(Coroutine) Runs the tasks in order. A failing task does not stop the next ones."""
+        for name, task in tasks:
+            # Let pending renders and input go first.
+            await asyncio.sleep(0)
+
+            logger.info("Running startup task '%s'...", name)
+            task_started_at = time.perf_counter()
+            try:
+                await task()
+            except Exception:
+                logger.exception("Startup task '%s' failed", name)
+                continue
+
+            logger.info(
+                "Startup task '%s' finished in %.0f ms",
+                name,
+                (time.perf_counter() - task_started_at) * 1000,
+            )
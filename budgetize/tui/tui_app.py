@@ -1,14 +1,29 @@
 """Main Module that starts the Terminal User Interface (TUI)"""
 
+import asyncio
 import logging
+import os
+from typing import Any
 
 from textual.app import App
+from textual.binding import Binding
 
-from budgetize.consts import VERSION
+from budgetize.consts import (
+    APP_FOLDER_PATH,
+    INSTRUMENTATION_ENV_VAR,
+    INSTRUMENTATION_FILE_NAME,
+    VERSION,
+)
+from budgetize.db.async_database import AsyncDatabase
+from budgetize.db.database import Database
+from budgetize.db.instrumentation import instrumentation
 from budgetize.settings_manager import SettingsManager
 from budgetize.tui.screens.create_account import CreateAccount
 from budgetize.tui.screens.initial_config import InitialConfig
 from budgetize.tui.screens.main_menu import MainMenu
+from budgetize.tui.screens.stats import StatsScreen
+from budgetize.tui.startup import StartupScheduler
+from budgetize.utils import _
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +31,20 @@ logger = logging.getLogger(__name__)
 class TuiApp(App):
     """App that handles the TUI"""
 
+    BINDINGS = [
+        Binding(key="f12", action="show_stats", description="Stats", show=False),
+    ]
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.startup = StartupScheduler(self)
+
+        # Methods are wrapped before any screen creates a Database.
+        if "devtools" in self.features or os.environ.get(INSTRUMENTATION_ENV_VAR):
+            instrumentation.enable(
+                dump_path=os.path.join(APP_FOLDER_PATH, INSTRUMENTATION_FILE_NAME)
+            )
+
     def on_mount(self) -> None:
         """Called when the app is mounted"""
         self.title = f"Budgetize (v{VERSION})"
@@ -32,6 +61,30 @@ class TuiApp(App):
             self.push_screen(InitialConfig())
         else:
             logger.info("User has custom settings. Redirecting to MainMenu...")
+            if "devtools" not in self.features:
+                self.startup.add_task("backup", self.backup_database)
+            self.startup.add_task(
+                "recurring transactions", self.materialize_recurring_transactions
+            )
+
             self.install_screen(MainMenu(), "main_menu")
             self.install_screen(CreateAccount(), "create_account")
             self.push_screen("main_menu")
+
+    def action_show_stats(self) -> None:
+        """Shows the instrumentation stats, if instrumentation is enabled"""
+        if instrumentation.enabled and not isinstance(self.screen, StatsScreen):
+            self.push_screen(StatsScreen())
+
+    async def backup_database(self) -> None:
+        """(Coroutine) Backs up the database in a thread, so the UI keeps responding."""
+        await asyncio.to_thread(Database(self).backup_database)
+
+    async def materialize_recurring_transactions(self) -> None:
+        """(Coroutine) Adds the recurring transactions that became due since the last run."""
+        added = await AsyncDatabase(Database(self)).materialize_due_transactions()
+        if added:
+            self.notify(
+                _("Added {count} recurring transactions").format(count=added),
+                title=_("Recurring Transactions"),
+            )
@@ -1,19 +1,27 @@
 """Util functions for Budgetize"""
 
 import gettext
+from functools import lru_cache
 
 from budgetize import SettingsManager
 from budgetize.consts import CURRENCIES, TRANSLATIONS_PATH
 
-_t = gettext.translation(
-    "budgetize",
-    TRANSLATIONS_PATH,
-    languages=[SettingsManager().get_language()],
-    fallback=True,
-)
+
+@lru_cache(maxsize=None)
+def _get_translation() -> gettext.NullTranslations:
+    """Loads the translation of the user's language. Done on first use to keep imports fast."""
+    return gettext.translation(
+        "budgetize",
+        TRANSLATIONS_PATH,
+        languages=[SettingsManager().get_language()],
+        fallback=True,
+    )
+
 
 # Definition of the translating function
-_ = _t.gettext
+def _(message: str) -> str:
+    """Translates the message to the user's language."""
+    return _get_translation().gettext(message)
 
 
 def get_select_currencies() -> list[tuple[str, str]]:
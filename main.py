@@ -1,21 +1,13 @@
-import logging
-import os
-
 """This is the file that should be run in development to start Budgetize."""
 
-from budgetize.consts import APP_FOLDER_PATH
+from budgetize.log import setup_logging
 from budgetize.tui import TuiApp
 
 if __name__ == "__main__":
-
-    log_path = os.path.join(APP_FOLDER_PATH, "budgetize.log")
-
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format="[%(asctime)s ] (%(module)s.%(funcName)s | %(levelname)s) %(message)s",
-        datefmt="%d/%m/%Y @ %H:%M:%S %Z",
-        filename=log_path,
-    )
+    listener = setup_logging()
 
     # To run budgetize from PyPi installation, use `budgetize` command.
-    TuiApp().run()
+    try:
+        TuiApp().run()
+    finally:
+        listener.stop()